@@ -0,0 +1,166 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+@dataclass
+class ApplicationWait:
+    """A workflow (checkpoint thread) parked until its job has `threshold` applications or `deadline` passes."""
+    thread_id: str
+    job_id: int
+    threshold: int
+    deadline: float     # epoch seconds
+    not_before: float = 0.0     # not polled before this (epoch seconds), when retrying a wake-up
+
+
+class NotWaitingYet(Exception):
+    """
+    Raised by a resume callback when the workflow hasn't reached its wait yet (the step
+    that registered it is still running); the scheduler puts the wait back and retries.
+    """
+
+
+class ApplicationWaitScheduler:
+    """
+    Wakes workflows parked at the wait_for_applications interrupt. One background thread
+    polls the application count of every waiting job every `poll_seconds` (sooner when a
+    deadline is due) and resumes a workflow with {"count", "reason"} once its count
+    reaches the threshold ("threshold") or its deadline passes ("deadline"). Resumes run on
+    a small worker pool, so a waiting workflow holds no thread at all.
+    """
+
+    def __init__(
+        self,
+        count_applications: Callable[[int], int],
+        resume: Callable[[str, Dict[str, Any]], Any],
+        poll_seconds: float = 10.0,
+        max_workers: int = 4,
+        clock: Callable[[], float] = time.time,
+        retry_seconds: float = 1.0,
+    ):
+        self.count_applications = count_applications
+        self.resume = resume
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self.clock = clock
+        self._waits: Dict[str, ApplicationWait] = {}
+        # Threads whose wake-up has been taken by the poller and not yet delivered
+        self._waking: Set[str] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="application-wait")
+
+    def add(self, wait: ApplicationWait):
+        """Registers (or replaces) the wait of `wait.thread_id` and starts polling if needed."""
+        with self._lock:
+            self._waits[wait.thread_id] = wait
+        print(f"⏳ Job {wait.job_id} waiting for {wait.threshold} applications until {time.strftime('%H:%M:%S', time.localtime(wait.deadline))}")
+        self.start()
+        self._wake.set()
+
+    def remove(self, thread_id: str) -> bool:
+        with self._lock:
+            return self._waits.pop(thread_id, None) is not None
+
+    def claim(self, thread_id: str) -> bool:
+        """
+        Takes a workflow's wait off the scheduler before it is resumed by hand, so the two
+        can't both resume it. Returns False if the scheduler is already waking it.
+        """
+        with self._lock:
+            if thread_id in self._waking:
+                return False
+            self._waits.pop(thread_id, None)
+            return True
+
+    def _take(self, thread_id: str) -> bool:
+        with self._lock:
+            if self._waits.pop(thread_id, None) is None:
+                return False
+            self._waking.add(thread_id)
+            return True
+
+    def waiting(self) -> List[ApplicationWait]:
+        with self._lock:
+            return list(self._waits.values())
+
+    def poll_once(self) -> List[Tuple[ApplicationWait, Dict[str, Any]]]:
+        """
+        Checks every waiting job once and hands the due ones to the resume pool.
+        Returns:
+            List[Tuple[ApplicationWait, Dict[str, Any]]]: The woken waits and their resume values.
+        """
+        due = []
+        for wait in self.waiting():
+            now = self.clock()
+            if now < wait.not_before:
+                continue
+            try:
+                count = self.count_applications(wait.job_id)
+            except Exception as e:
+                print(f"⚠️ Could not count applications of job {wait.job_id}: {type(e).__name__}: {e}")
+                count = None
+            if count is not None and count >= wait.threshold:
+                reason = "threshold"
+            elif now >= wait.deadline:
+                reason = "deadline"
+            else:
+                continue
+            # Whoever removes the wait owns the resume, so a workflow is never woken twice
+            if self._take(wait.thread_id):
+                value = {"count": count or 0, "reason": reason}
+                due.append((wait, value))
+                self._executor.submit(self._resume, wait, value)
+        return due
+
+    def _resume(self, wait: ApplicationWait, value: Dict[str, Any]):
+        print(f"🔔 Waking job {wait.job_id} ({value['reason']}: {value['count']}/{wait.threshold} applications)")
+        try:
+            self.resume(wait.thread_id, value)
+        except NotWaitingYet:
+            self._retry(wait)
+        except Exception as e:
+            print(f"⚠️ Resuming workflow {wait.thread_id} failed: {type(e).__name__}: {e}")
+        finally:
+            with self._lock:
+                self._waking.discard(wait.thread_id)
+
+    def _retry(self, wait: ApplicationWait):
+        """Puts back a wait whose workflow isn't parked yet, unless it was registered again meanwhile."""
+        print(f"⏳ Workflow {wait.thread_id} isn't waiting for applications yet; retrying in {self.retry_seconds}s")
+        wait.not_before = self.clock() + self.retry_seconds
+        with self._lock:
+            self._waits.setdefault(wait.thread_id, wait)
+        self._wake.set()
+
+    def _next_timeout(self) -> float:
+        waits = self.waiting()
+        if not waits:
+            return self.poll_seconds
+        now = self.clock()
+        due = min(max(wait.deadline, wait.not_before) for wait in waits)
+        return max(0.0, min(self.poll_seconds, due - now))
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.poll_once()
+            self._wake.wait(self._next_timeout())
+            self._wake.clear()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name="application-wait-poller", daemon=True)
+                self._thread.start()
+
+    def stop(self, wait: bool = True):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=wait)
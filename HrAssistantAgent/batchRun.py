@@ -0,0 +1,314 @@
+import argparse
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, TextIO
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from HrAssistantAgent.workflowManager import CANCELLED, COMPLETED, FAILED, PAUSED, Workflow, WorkflowManager
+
+# Interrupt node -> the ApprovalPolicy field that answers it
+APPROVAL_NODES = {
+    "approve_jd": "jd",
+    "approve_shortlisted_Candidates": "shortlist",
+    "approve_offer_letter": "offer",
+    "wait_for_applications": "applications",
+}
+_APPROVE_AFTER = re.compile(r"approve-after-(\d+)$")
+
+
+def check_policy(name: str, policy: str) -> str:
+    """Validates one approval policy: "approve", "approve-after-N" or "stop" ("wait" or "skip" for applications)."""
+    allowed = ("wait", "skip") if name == "applications" else ("approve", "stop")
+    if policy not in allowed and (name == "applications" or not _APPROVE_AFTER.match(policy)):
+        choices = ", ".join(allowed) + ("" if name == "applications" else ", approve-after-N")
+        raise ValueError(f"Invalid {name} policy '{policy}' (expected {choices})")
+    return policy
+
+
+@dataclass
+class ApprovalPolicy:
+    """
+    Pre-decided answers to the workflow's interrupts. "approve" answers yes,
+    "approve-after-N" answers no N times (asking for a revision each time) and then yes,
+    "stop" ends the workflow there. The application wait is either waited out ("wait", the
+    scheduler resumes it) or skipped with the applications received so far ("skip"). Only
+    the first wait is skipped: a job short of applications is tweaked and reposted, and
+    skipping every wait would repost it forever.
+    """
+    jd: str = "approve"
+    shortlist: str = "approve"
+    offer: str = "approve"
+    applications: str = "wait"
+
+    def __post_init__(self):
+        for name in ("jd", "shortlist", "offer", "applications"):
+            check_policy(name, getattr(self, name))
+
+    def decide(self, node: str, times_asked: int) -> Optional[str]:
+        """
+        Returns the answer to the interrupt of `node`, asked `times_asked` times before:
+        "yes", "no", None to stop the workflow or "wait" to leave it paused.
+        """
+        policy = getattr(self, APPROVAL_NODES[node])
+        if policy == "wait" or (policy == "skip" and times_asked > 0):
+            return "wait"
+        if policy == "stop":
+            return None
+        if policy in ("approve", "skip"):
+            return "yes"
+        return "no" if times_asked < int(_APPROVE_AFTER.match(policy).group(1)) else "yes"
+
+
+@dataclass
+class BatchPosition:
+    position: str
+    policy: ApprovalPolicy = field(default_factory=ApprovalPolicy)
+    # Extra initial state, e.g. application_threshhold
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+def load_positions(path: str, default_policy: ApprovalPolicy) -> List[BatchPosition]:
+    """
+    Reads the positions to run. Each line is either a plain position title or a JSON object
+    such as {"position": "ML Engineer", "policy": {"jd": "approve-after-2"}, "application_threshold": 3};
+    policies not given fall back to `default_policy`. Blank lines and lines starting with # are skipped.
+    """
+    positions = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if not line.startswith("{"):
+                positions.append(BatchPosition(position=line, policy=default_policy))
+                continue
+            try:
+                spec = json.loads(line)
+                state = {}
+                if "application_threshold" in spec:
+                    state["application_threshhold"] = int(spec["application_threshold"])
+                positions.append(BatchPosition(
+                    position=spec["position"],
+                    policy=replace(default_policy, **spec.get("policy", {})),
+                    state=state,
+                ))
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"{path}:{line_no}: {type(e).__name__}: {e}") from e
+    return positions
+
+
+class NodeTimer(BaseCallbackHandler):
+    """Callback handler that records how long each graph node takes to run (interrupted runs excluded)."""
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # run_id -> (node, start)
+        self._runs: Dict[UUID, tuple] = {}
+        self.durations: Dict[str, List[float]] = {}
+
+    def on_chain_start(self, serialized, inputs, *, run_id: UUID, parent_run_id: Optional[UUID] = None,
+                       metadata: Optional[Dict[str, Any]] = None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        # Only the node's own run, not the runnables inside it (a RunnableLambda node has the node's name too)
+        if node is None or kwargs.get("name") != node:
+            return
+        with self._lock:
+            parent = self._runs.get(parent_run_id)
+            if parent is None or parent[0] != node:
+                self._runs[run_id] = (node, time.perf_counter())
+
+    def on_chain_end(self, outputs, *, run_id: UUID, **kwargs):
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+            if run is not None:
+                self.durations.setdefault(run[0], []).append(time.perf_counter() - run[1])
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs):
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            durations = {node: sorted(values) for node, values in self.durations.items()}
+        return {
+            node: {
+                "runs": len(values),
+                "p50": values[len(values) // 2],
+                "p95": values[min(len(values) - 1, int(0.95 * len(values)))],
+                "max": values[-1],
+            }
+            for node, values in durations.items()
+        }
+
+
+class BatchRunner:
+    """
+    Runs positions through an HRRecruitingGraph with `parallelism` workflows executing at
+    once, answering their interrupts from each position's ApprovalPolicy, and writes one
+    JSON line per position to `out` as soon as it finishes. A workflow still running after
+    `timeout` seconds is cancelled and reported as "timed_out".
+    """
+
+    def __init__(self, hr_graph, parallelism: int = 4, timeout: Optional[float] = None):
+        self.hr_graph = hr_graph
+        self.timeout = timeout
+        self.timer = NodeTimer()
+        self.manager = WorkflowManager(hr_graph, max_workers=parallelism, on_change=self._on_change,
+                                       run_config={"callbacks": [self.timer]})
+        self._lock = threading.Lock()
+        self._positions: Dict[str, BatchPosition] = {}
+        self._started: Dict[str, float] = {}
+        self._asked: Dict[tuple, int] = {}
+        # thread_id -> "stopped" / "timed_out", for workflows the runner cancelled
+        self._outcomes: Dict[str, str] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._done = threading.Event()
+        self._out: Optional[TextIO] = None
+
+    def run(self, positions: List[BatchPosition], out: TextIO) -> Dict[str, Any]:
+        """
+        Runs every position to the end (or its stop policy / timeout).
+        Args:
+            positions (List[BatchPosition]): Positions and their policies.
+            out (TextIO): Where the per-position JSON lines are written.
+
+        Returns:
+            Dict[str, Any]: Throughput, outcome counts and per-node latency percentiles.
+        """
+        self._out = out
+        start = time.perf_counter()
+        if not positions:
+            self._done.set()
+        for batch_position in positions:
+            with self._lock:
+                thread_id = self.manager.start(batch_position.position, **batch_position.state)
+                self._positions[thread_id] = batch_position
+                self._started[thread_id] = time.perf_counter()
+        while not self._done.wait(0.5):
+            self._cancel_overdue()
+        elapsed = time.perf_counter() - start
+        self.manager.shutdown()
+        self.hr_graph.application_waits.stop()
+
+        outcomes: Dict[str, int] = {}
+        for result in self._results.values():
+            outcomes[result["status"]] = outcomes.get(result["status"], 0) + 1
+        return {
+            "positions": len(positions),
+            "seconds": elapsed,
+            "positions_per_minute": 60 * len(positions) / elapsed if elapsed else 0.0,
+            "outcomes": outcomes,
+            "nodes": self.timer.percentiles(),
+        }
+
+    def _cancel_overdue(self):
+        if self.timeout is None:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            overdue = [thread_id for thread_id, started in self._started.items()
+                       if thread_id not in self._results and thread_id not in self._outcomes and now - started > self.timeout]
+            for thread_id in overdue:
+                self._outcomes[thread_id] = "timed_out"
+        for thread_id in overdue:
+            self.manager.cancel(thread_id)
+
+    def _on_change(self, workflow: Workflow):
+        if workflow.status == PAUSED and workflow.node in APPROVAL_NODES:
+            with self._lock:
+                policy = self._positions[workflow.thread_id].policy
+                key = (workflow.thread_id, workflow.node)
+                asked = self._asked.get(key, 0)
+                self._asked[key] = asked + 1
+            answer = policy.decide(workflow.node, asked)
+            if answer == "wait":
+                return
+            if answer is None:
+                with self._lock:
+                    self._outcomes.setdefault(workflow.thread_id, "stopped")
+                self.manager.cancel(workflow.thread_id)
+                return
+            self.manager.resume(workflow.thread_id, answer)
+            return
+        if workflow.status in (PAUSED, COMPLETED, FAILED, CANCELLED):
+            self._record(workflow)
+
+    def _record(self, workflow: Workflow):
+        values = self.hr_graph.graph.get_state(workflow.config).values
+        with self._lock:
+            if workflow.thread_id in self._results:
+                return
+            status = self._outcomes.get(workflow.thread_id, workflow.status)
+            job = values.get("job")
+            result = {
+                "position": workflow.position,
+                "thread_id": workflow.thread_id,
+                "status": status,
+                "stopped_at": workflow.node if status != COMPLETED else None,
+                "jd_revisions": max(0, self._asked.get((workflow.thread_id, "approve_jd"), 0) - 1),
+                "job_id": getattr(job, "id", None),
+                "applications": values.get("current_number_of_application"),
+                "shortlisted": [
+                    {"name": c.get("name"), "email": c.get("email"), "score": c.get("score")}
+                    for c in values.get("shortlisted_candidates") or []
+                ],
+                "offer_sent": bool(values.get("offer_sent")),
+                "seconds": round(time.perf_counter() - self._started[workflow.thread_id], 3),
+                "error": workflow.error,
+            }
+            self._results[workflow.thread_id] = result
+            self._out.write(json.dumps(result, default=str) + "\n")
+            self._out.flush()
+            print(f"📄 {workflow.position}: {status} ({len(self._results)}/{len(self._positions)})")
+            if len(self._results) == len(self._positions):
+                self._done.set()
+
+
+def print_report(summary: Dict[str, Any]):
+    outcomes = ", ".join(f"{count} {status}" for status, count in sorted(summary["outcomes"].items()))
+    print(f"📦 {summary['positions']} positions in {summary['seconds']:.1f}s "
+          f"({summary['positions_per_minute']:.1f}/min): {outcomes or 'none'}")
+    print(f"{'node':<38} {'runs':>5} {'p50':>8} {'p95':>8} {'max':>8}")
+    for node, stats in sorted(summary["nodes"].items(), key=lambda item: -item[1]["p95"]):
+        print(f"{node:<38} {stats['runs']:>5} {stats['p50']:>7.2f}s {stats['p95']:>7.2f}s {stats['max']:>7.2f}s")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Run many positions through the recruiting workflow without the UI, answering its approvals by policy.",
+    )
+    parser.add_argument("positions", help="File with one position per line (a title or a JSON object, see load_positions)")
+    parser.add_argument("--out", default="batch_results.jsonl", help="JSONL file with one result per position")
+    parser.add_argument("--parallelism", type=int, default=4, help="Workflows executing at once")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds after which a position is cancelled")
+    parser.add_argument("--jd-policy", default="approve", help="approve, approve-after-N or stop")
+    parser.add_argument("--shortlist-policy", default="approve", help="approve, approve-after-N or stop")
+    parser.add_argument("--offer-policy", default="approve", help="approve, approve-after-N or stop")
+    parser.add_argument("--applications-policy", default="wait", help="wait (for the threshold or deadline) or skip")
+    args = parser.parse_args(argv)
+
+    try:
+        default_policy = ApprovalPolicy(jd=args.jd_policy, shortlist=args.shortlist_policy,
+                                        offer=args.offer_policy, applications=args.applications_policy)
+        positions = load_positions(args.positions, default_policy)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Imported here so --help and bad input don't pay for the graph's imports
+    from HrAssistantAgent.graphUtil import HRRecruitingGraph
+
+    runner = BatchRunner(HRRecruitingGraph(), parallelism=args.parallelism, timeout=args.timeout)
+    with open(args.out, "w", encoding="utf-8") as out:
+        summary = runner.run(positions, out)
+    print_report(summary)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import os
+import re
+import json
+import math
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+
+# Keeps tokens such as "c++", "c#", "cs-3", "node.js" and "llama-3.3" intact
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the their this to "
+    "was we were will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Local inverted index with Okapi BM25 scoring.
+
+    Kept next to the FAISS store (same document ids) so exact terms such as "PyTorch"
+    or "CS-3" can be matched lexically without any network call.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> {doc_id: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        # doc_id -> its distinct terms, so removals don't scan the whole vocabulary
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, doc_id: str, text: str):
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        self._doc_terms[doc_id] = list(counts)
+        self.doc_lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def add_many(self, items: Iterable[Tuple[str, str]]):
+        for doc_id, text in items:
+            self.add(doc_id, text)
+
+    def remove(self, doc_id: str):
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._doc_terms.pop(doc_id, []):
+            docs = self.postings.get(term)
+            if docs is not None and docs.pop(doc_id, None) is not None and not docs:
+                del self.postings[term]
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Scores documents containing at least one query term.
+        Returns:
+            List[Tuple[str, float]]: Up to `k` (doc_id, score) pairs, best first.
+        """
+        num_docs = len(self.doc_lengths)
+        if not num_docs:
+            return []
+        avg_length = self._total_length / num_docs
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (num_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, tf in docs.items():
+                norm = tf + self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    # ------------------------
+    # Persistence
+    # ------------------------
+    def save(self, path: str):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"k1": self.k1, "b": self.b, "postings": self.postings, "doc_lengths": self.doc_lengths}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(k1=data["k1"], b=data["b"])
+        index.postings = data["postings"]
+        index.doc_lengths = data["doc_lengths"]
+        index._total_length = sum(index.doc_lengths.values())
+        for term, docs in index.postings.items():
+            for doc_id in docs:
+                index._doc_terms.setdefault(doc_id, []).append(term)
+        return index
+
+
+def reciprocal_rank_fusion(
+    rankings: List[List[str]],
+    weights: List[float],
+    k: int = 60,
+) -> List[Tuple[str, float]]:
+    """
+    Fuses several rankings of document ids: score = sum(weight / (k + rank)).
+    Returns:
+        List[Tuple[str, float]]: (doc_id, fused score), best first.
+    """
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
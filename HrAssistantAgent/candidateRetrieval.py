@@ -0,0 +1,59 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain.docstore.document import Document
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.retrievers import BaseRetriever
+
+
+@dataclass
+class RankedCandidate:
+    """
+    One candidate with the aggregated retrieval score and the chunks that produced it.
+    """
+    application_id: str
+    score: float
+    section_scores: Dict[str, List[float]] = field(default_factory=dict)
+    matches: List[Tuple[Document, float]] = field(default_factory=list)
+
+    def best_documents(self, limit: int) -> List[Document]:
+        ranked = sorted(self.matches, key=lambda match: match[1], reverse=True)
+        return [doc for doc, _ in ranked[:limit]]
+
+
+def format_candidate_context(candidate: RankedCandidate, limit: int) -> List[Document]:
+    """
+    Labels a candidate's best chunks with their header (name and contact details) so
+    the LLM can attribute section-level context to the right person.
+    """
+    documents = []
+    for doc in candidate.best_documents(limit):
+        header = doc.metadata.get("candidate_header")
+        section = doc.metadata.get("section")
+        if header and section and section != "header":
+            content = f"{header}\n[{section}]\n{doc.page_content}"
+        else:
+            content = doc.page_content
+        documents.append(Document(page_content=content, metadata=doc.metadata))
+    return documents
+
+
+class CandidateRetriever(BaseRetriever):
+    """
+    Retriever for RetrievalQA that ranks whole candidates (not chunks) against the JD and
+    returns only the best-matching chunks of the top candidates.
+    """
+    pipeline: Any
+    jd: str
+    top_n: int = 1
+    chunks_per_candidate: int = 3
+    # Restricts ranking to these candidates, e.g. the requirement pre-screen shortlist
+    application_ids: Optional[List[str]] = None
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        # Rank on the JD itself: the QA query also carries the output format instructions
+        candidates = self.pipeline.rank_candidates(self.jd, top_n=self.top_n, application_ids=self.application_ids)
+        documents = []
+        for candidate in candidates:
+            documents.extend(format_candidate_context(candidate, self.chunks_per_candidate))
+        return documents
@@ -0,0 +1,109 @@
+import asyncio
+import sqlite3
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+# Checkpoints kept per workflow thread: enough to inspect the last few steps, while a
+# long-running workflow (JD revisions, tweak loops) doesn't grow without bound
+DEFAULT_KEEP_LAST = 20
+
+
+class CompactingSqliteSaver(SqliteSaver):
+    """
+    LangGraph checkpointer backed by a local SQLite file, so workflows paused at an
+    interrupt survive a restart. Runs in WAL mode (readers don't block the writer) and,
+    after every checkpoint, deletes all but the newest `keep_last` checkpoints of that
+    thread together with their pending writes (0 keeps everything). Resuming only needs
+    the newest checkpoint; older ones are history.
+
+    The async methods run the sync ones in a worker thread, so the graph's ainvoke/astream
+    work with it too.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, keep_last: int = DEFAULT_KEEP_LAST, **kwargs):
+        super().__init__(conn, **kwargs)
+        self.keep_last = keep_last
+        self.compacted = 0
+
+    def setup(self) -> None:
+        if self.is_setup:
+            return
+        # WAL is set by SqliteSaver.setup; NORMAL sync is durable in WAL mode except for the
+        # last transactions on power loss, and avoids an fsync per checkpoint
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        super().setup()
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions) -> RunnableConfig:
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        if self.keep_last > 0:
+            self._compact(saved["configurable"]["thread_id"], saved["configurable"]["checkpoint_ns"])
+        return saved
+
+    def _compact(self, thread_id: str, checkpoint_ns: str):
+        """Deletes the checkpoints (and their writes) of a thread older than its newest `keep_last`."""
+        key: Tuple[str, str] = (str(thread_id), checkpoint_ns)
+        with self.cursor() as cur:
+            # Checkpoint ids are time-ordered (uuid6), so id order is age order
+            cur.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                "ORDER BY checkpoint_id DESC LIMIT 1 OFFSET ?",
+                (*key, self.keep_last - 1),
+            )
+            row = cur.fetchone()
+            if row is None:
+                return
+            oldest_kept = row[0]
+            cur.execute("DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?", (*key, oldest_kept))
+            self.compacted += cur.rowcount
+            cur.execute("DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?", (*key, oldest_kept))
+
+    def thread_ids(self) -> List[str]:
+        """Ids of every workflow thread with a checkpoint, e.g. to restore waits after a restart."""
+        with self.cursor(transaction=False) as cur:
+            return [row[0] for row in cur.execute("SELECT DISTINCT thread_id FROM checkpoints")]
+
+    def stats(self) -> Dict[str, Any]:
+        with self.cursor(transaction=False) as cur:
+            threads, checkpoints = cur.execute("SELECT COUNT(DISTINCT thread_id), COUNT(*) FROM checkpoints").fetchone()
+            writes = cur.execute("SELECT COUNT(*) FROM writes").fetchone()[0]
+        return {"threads": threads, "checkpoints": checkpoints, "writes": writes, "compacted": self.compacted}
+
+    # ------------------------
+    # Async: the sync methods in a worker thread
+    # ------------------------
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(self, config: Optional[RunnableConfig], *, filter: Optional[Dict[str, Any]] = None,
+                    before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> AsyncIterator[CheckpointTuple]:
+        checkpoints = await asyncio.to_thread(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))
+        for checkpoint in checkpoints:
+            yield checkpoint
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata, new_versions: ChannelVersions) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def open_checkpointer(path: str, keep_last: int = DEFAULT_KEEP_LAST) -> CompactingSqliteSaver:
+    """
+    Opens (creating if needed) the checkpoint database at `path`.
+    Args:
+        path (str): SQLite file.
+        keep_last (int): Checkpoints kept per thread; 0 keeps all.
+
+    Returns:
+        CompactingSqliteSaver: Checkpointer to compile the graph with.
+    """
+    # One connection shared by all threads; SqliteSaver serialises access with its own lock
+    conn = sqlite3.connect(path, check_same_thread=False)
+    return CompactingSqliteSaver(conn, keep_last=keep_last)
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CountCache:
+    """
+    Short-lived cache of counts by key (e.g. applications per job). Polling many jobs then
+    costs at most one count query per job every `ttl_seconds`, and concurrent lookups of
+    the same key share a single query.
+    """
+
+    def __init__(self, fetch: Callable[[Any], int], ttl_seconds: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self.fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        # key -> (fetched_at, count)
+        self._counts: Dict[Hashable, Tuple[float, int]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.queries = 0
+
+    def _cached(self, key: Hashable, max_age: float) -> Optional[int]:
+        with self._lock:
+            entry = self._counts.get(key)
+            if entry is not None and self.clock() - entry[0] < max_age:
+                self.hits += 1
+                return entry[1]
+        return None
+
+    def _store(self, key: Hashable, fetched_at: float, count: int) -> int:
+        with self._lock:
+            self.queries += 1
+            self._counts[key] = (fetched_at, count)
+        return count
+
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> int:
+        """
+        Returns the count of `key`, queried afresh only when the cached one is older than
+        `max_age` (default `ttl_seconds`; 0 always queries).
+        """
+        max_age = self.ttl_seconds if max_age is None else max_age
+        count = self._cached(key, max_age)
+        if count is not None:
+            return count
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have fetched it while this one waited
+            count = self._cached(key, max_age)
+            if count is not None:
+                return count
+            fetched_at = self.clock()
+            return self._store(key, fetched_at, self.fetch(key))
+
+    async def aget(self, key: Hashable, afetch: Callable[[Any], Awaitable[int]], max_age: Optional[float] = None) -> int:
+        """Async `get` with an async query; shares the cached counts with `get`."""
+        max_age = self.ttl_seconds if max_age is None else max_age
+        count = self._cached(key, max_age)
+        if count is not None:
+            return count
+        fetched_at = self.clock()
+        return self._store(key, fetched_at, await afetch(key))
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Forgets the count of `key`, or every count."""
+        with self._lock:
+            if key is None:
+                self._counts.clear()
+            else:
+                self._counts.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.queries
+            return {"lookups": lookups, "queries": self.queries, "hits": self.hits, "hit_rate": self.hits / lookups if lookups else 0.0}
@@ -13,6 +13,8 @@ class Job:
     description: Optional[str] = None
     requirements: Optional[List[str]] = field(default_factory=list)    
     posted: Optional[datetime] = None
+    # Applications needed before resumes are reviewed; optional column of the jobs table
+    application_threshold: Optional[int] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
@@ -26,11 +28,12 @@ class Job:
             salary=data.get("salary", "Competitive"),
             description=data.get("description"),
             requirements=data.get("requirements") if data.get("requirements") else [],
-            posted = data.get("posted", None)
+            posted = data.get("posted", None),
+            application_threshold=data.get("application_threshold"),
         )
     
     def to_dict(self):
-        return {
+        data = {
             "title": self.title,
             "company": self.company,
             "location": self.location,
@@ -38,4 +41,8 @@ class Job:
             "salary": self.salary,
             "description": self.description,
             "requirements": self.requirements,
-        }
\ No newline at end of file
+        }
+        # Only sent when set, so tables without the column keep working
+        if self.application_threshold is not None:
+            data["application_threshold"] = self.application_threshold
+        return data
\ No newline at end of file
@@ -0,0 +1,105 @@
+import os
+import zlib
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from HrAssistantAgent.bm25Index import tokenize
+
+
+@lru_cache(maxsize=1 << 18)
+def _hash_feature(feature: str, dim: int) -> Tuple[int, float]:
+    # crc32 is stable across processes (unlike hash()), so vectors can be persisted
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h % dim, 1.0 if h & 0x80000000 else -1.0
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Fully local embeddings: signed feature hashing of word n-grams into a fixed-size
+    vector, with sublinear term frequency and L2 normalisation.
+
+    Needs no model download, no network and no fitting, so it works in air-gapped
+    environments and vectors stay comparable across incremental index updates.
+    Similarity is lexical (shared terms and phrases), not semantic.
+    """
+
+    def __init__(self, dim: int = 1024, ngram_range: Tuple[int, int] = (1, 2)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        # Used by CachedEmbeddings and in logs to tell backends apart
+        self.model = f"hashing-{dim}-ngram{ngram_range[0]}{ngram_range[1]}"
+
+    def _features(self, text: str) -> List[str]:
+        tokens = tokenize(text)
+        low, high = self.ngram_range
+        features = []
+        for n in range(low, high + 1):
+            features.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return features
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        features = self._features(text)
+        if not features:
+            return vector
+        buckets = [_hash_feature(feature, self.dim) for feature in features]
+        indices = np.fromiter((index for index, _ in buckets), dtype=np.int64, count=len(buckets))
+        signs = np.fromiter((sign for _, sign in buckets), dtype=np.float32, count=len(buckets))
+        np.add.at(vector, indices, signs)
+        vector = np.sign(vector) * np.log1p(np.abs(vector))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text).tolist() for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text).tolist()
+
+
+def _openai_embeddings(**kwargs) -> Embeddings:
+    from langchain.embeddings import OpenAIEmbeddings
+    # 429s are retried by the rate governor (GovernedEmbeddings), not the client, so its backoff sees them
+    kwargs.setdefault("max_retries", 0)
+    return OpenAIEmbeddings(**kwargs)
+
+
+# name -> (factory, runs locally). Local backends are cheap enough that the on-disk
+# embedding cache would only add overhead.
+EMBEDDING_BACKENDS: Dict[str, Tuple[Callable[..., Embeddings], bool]] = {
+    "openai": (_openai_embeddings, False),
+    "hashing": (HashingEmbeddings, True),
+}
+
+
+def register_embedding_backend(name: str, factory: Callable[..., Embeddings], local: bool = False):
+    """Makes another `Embeddings` implementation selectable by name (constructor or HR_EMBEDDING_BACKEND)."""
+    EMBEDDING_BACKENDS[name] = (factory, local)
+
+
+def resolve_backend_name(name: Optional[str] = None) -> str:
+    name = name or os.environ.get("HR_EMBEDDING_BACKEND", "openai")
+    if name not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown embedding backend '{name}', expected one of {tuple(EMBEDDING_BACKENDS)}")
+    return name
+
+
+def is_local_backend(name: str) -> bool:
+    return EMBEDDING_BACKENDS[resolve_backend_name(name)][1]
+
+
+def make_embeddings(name: Optional[str] = None, **kwargs) -> Embeddings:
+    """
+    Creates the embedding backend.
+    Args:
+        name (Optional[str]): Backend name; defaults to $HR_EMBEDDING_BACKEND, then "openai".
+        **kwargs: Passed to the backend factory (e.g. `dim` for "hashing").
+
+    Returns:
+        Embeddings: A LangChain embeddings object.
+    """
+    factory, _ = EMBEDDING_BACKENDS[resolve_backend_name(name)]
+    return factory(**kwargs)
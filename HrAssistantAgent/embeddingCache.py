@@ -0,0 +1,257 @@
+import os
+import re
+import json
+import atexit
+import hashlib
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+# Cache directory (absolute) -> its store, shared by every CachedEmbeddings in the process
+_STORES: Dict[str, "_EmbeddingStore"] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def _shared_store(cache_dir: str, max_bytes: int) -> "_EmbeddingStore":
+    """
+    Returns the one store of `cache_dir`. Each RAG pipeline (one per job) has its own
+    CachedEmbeddings over the same directory; separate indexes over one vectors file would
+    hand out the same rows and overwrite each other's entries.
+    """
+    key = os.path.abspath(cache_dir)
+    with _STORES_LOCK:
+        if key not in _STORES:
+            _STORES[key] = _EmbeddingStore(key, max_bytes)
+        return _STORES[key]
+
+
+@atexit.register
+def _compact_stores():
+    """Folds every store's log (and the recency of its hits) into its index file."""
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+    for store in stores:
+        with store.lock:
+            try:
+                store.compact()
+            except OSError:
+                # The directory is gone (e.g. a temporary cache); the log stays valid otherwise
+                pass
+
+
+class _EmbeddingStore:
+    """
+    Vectors of one cache directory in a memory-mapped float32 array, plus the JSON index of
+    keys to rows. Changes are appended to a log (evictions before their rows are reused,
+    new entries after their vectors are written) and folded into the index file once the
+    log outgrows it, so storing a vector doesn't rewrite the whole index.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.vectors_path = os.path.join(cache_dir, "vectors.f32")
+        self.log_path = os.path.join(cache_dir, "index.log")
+        self.log_records = 0
+
+        self.lock = threading.Lock()
+        self.vectors: Optional[np.memmap] = None
+        self.dim: Optional[int] = None
+        self.capacity = 0
+        self.clock = 0
+        # key -> [row, last_used]
+        self.index: Dict[str, List[int]] = {}
+        self.free_rows: List[int] = []
+        self._load()
+
+    def _load(self):
+        if not (os.path.exists(self.index_path) and os.path.exists(self.vectors_path)):
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.dim = data["dim"]
+        self.capacity = data["capacity"]
+        self.clock = data["clock"]
+        self.index = data["entries"]
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+        torn = False
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Cut short by a crash; nothing after it was written either
+                        torn = True
+                        break
+                    if record[0] == "put":
+                        self.index[record[1]] = [record[2], record[3]]
+                        self.clock = max(self.clock, record[3])
+                    else:
+                        self.index.pop(record[1], None)
+                    self.log_records += 1
+        used = {row for row, _ in self.index.values()}
+        self.free_rows = [row for row in range(self.capacity - 1, -1, -1) if row not in used]
+        if torn:
+            # Records appended after the torn line would never be read
+            self.compact()
+
+    def allocate(self, dim: int):
+        self.dim = dim
+        self.capacity = max(1, self.max_bytes // (dim * 4))
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="w+", shape=(self.capacity, dim))
+        self.free_rows = list(range(self.capacity - 1, -1, -1))
+        # A fresh vectors file: the index and log of an older one no longer apply
+        self.compact()
+
+    def _append(self, records: List[list]):
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+        self.log_records += len(records)
+
+    def stored(self, entries: List[list]):
+        """Logs new [key, row, clock] entries once their vectors are in the array."""
+        self.vectors.flush()
+        self._append([["put", *entry] for entry in entries])
+        if self.log_records > max(1000, len(self.index)):
+            self.compact()
+
+    def compact(self):
+        """Writes the whole index (with the recency of hits) and empties the log."""
+        if self.vectors is None:
+            return
+        self.vectors.flush()
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "capacity": self.capacity, "clock": self.clock, "entries": self.index}, f)
+        os.replace(tmp_path, self.index_path)
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self.log_records = 0
+
+    def evict(self, needed: int):
+        """Frees at least `needed` rows (and ~10% of capacity) by dropping the least recently used keys."""
+        count = max(needed, self.capacity // 10)
+        evicted = sorted(self.index.items(), key=lambda item: item[1][1])[:count]
+        # Logged before the rows are reused, so a reload never maps a key to another text's vector
+        self._append([["del", key] for key, _ in evicted])
+        for key, (row, _) in evicted:
+            del self.index[key]
+            self.free_rows.append(row)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Content-addressed, on-disk cache in front of any LangChain `Embeddings`.
+
+    Keys are a hash of the embedding model plus the whitespace-normalised text, so the
+    same resume or JD is only embedded once across jobs and review passes. Vectors live
+    in a memory-mapped float32 array; a small JSON index maps keys to rows and the least
+    recently used rows are evicted once the cache reaches `max_bytes`. All instances over
+    the same directory in a process share one store (the first one's `max_bytes` applies).
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        cache_dir: str = "embedding_cache",
+        max_bytes: int = 256 * 1024 * 1024,
+        model_name: Optional[str] = None,
+    ):
+        self.underlying = underlying
+        self.model_name = model_name or getattr(underlying, "model", None) or type(underlying).__name__
+        self.cache_dir = os.path.join(cache_dir, re.sub(r"[^A-Za-z0-9_.-]", "_", self.model_name))
+        self._store = _shared_store(self.cache_dir, max_bytes)
+
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def _key(self, text: str) -> str:
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{self.model_name}\0{normalized}".encode("utf-8")).hexdigest()[:32]
+
+    # ------------------------
+    # Embeddings interface
+    # ------------------------
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        store = self._store
+        keys = [self._key(text) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        missing: Dict[str, int] = {}
+
+        with store.lock:
+            for i, key in enumerate(keys):
+                entry = store.index.get(key)
+                if entry is not None:
+                    store.clock += 1
+                    entry[1] = store.clock
+                    results[i] = store.vectors[entry[0]].tolist()
+                    self.hits += 1
+                    self.bytes_saved += len(texts[i].encode("utf-8"))
+                elif key not in missing:
+                    missing[key] = i
+
+        if missing:
+            # Only cache misses ever reach the underlying (remote) model
+            fresh = self.underlying.embed_documents([texts[i] for i in missing.values()])
+            with store.lock:
+                if store.vectors is None:
+                    store.allocate(len(fresh[0]))
+                storable = min(len(missing), store.capacity)
+                if len(store.free_rows) < storable:
+                    store.evict(storable - len(store.free_rows))
+                stored = []
+                for key, vector in zip(missing, fresh):
+                    if not store.free_rows:
+                        break
+                    if key in store.index:
+                        # Stored meanwhile by a concurrent caller
+                        continue
+                    row = store.free_rows.pop()
+                    store.vectors[row] = np.asarray(vector, dtype=np.float32)
+                    store.clock += 1
+                    store.index[key] = [row, store.clock]
+                    stored.append([key, row, store.clock])
+                if stored:
+                    store.stored(stored)
+            by_key = dict(zip(missing, fresh))
+            for i, key in enumerate(keys):
+                if results[i] is None:
+                    results[i] = list(by_key[key])
+                    if missing[key] == i:
+                        self.misses += 1
+                    else:
+                        # Duplicate text within the same batch
+                        self.hits += 1
+                        self.bytes_saved += len(texts[i].encode("utf-8"))
+        return results
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    # ------------------------
+    # Reporting
+    # ------------------------
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "bytes_saved": self.bytes_saved,
+            "entries": len(self._store.index),
+            "capacity": self._store.capacity,
+        }
+
+    def report(self):
+        stats = self.stats()
+        print(
+            f"🧠 Embedding cache ({self.model_name}): {stats['hits']} hits / {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.0%}), {stats['bytes_saved'] / 1024:.1f} KB of text not re-sent, "
+            f"{stats['entries']}/{stats['capacity']} slots used"
+        )
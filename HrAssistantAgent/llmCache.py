@@ -0,0 +1,140 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+def _serialize(generation: Generation) -> Dict[str, Any]:
+    if isinstance(generation, ChatGeneration):
+        return {"message": message_to_dict(generation.message), "info": generation.generation_info}
+    return {"text": generation.text, "info": generation.generation_info}
+
+
+def _deserialize(data: Dict[str, Any]) -> Generation:
+    if "message" in data:
+        return ChatGeneration(message=messages_from_dict([data["message"]])[0], generation_info=data["info"])
+    return Generation(text=data["text"], generation_info=data["info"])
+
+
+@contextmanager
+def bypass_llm_cache():
+    """
+    Forces fresh LLM calls inside the block (e.g. "regenerate"). Fresh responses still
+    replace the cached ones. Scoped to the current thread/task via a context variable.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    Persistent LLM response cache for LangChain chat models (pass it as `cache=`).
+
+    Entries are keyed on a hash of LangChain's `llm_string` (model name plus sampling
+    parameters) and the rendered prompt, so byte-identical calls (re-running a position,
+    LangGraph replaying a node on resume) are answered from disk. Expired entries
+    (`ttl_seconds`) are ignored and the least recently used ones are evicted beyond
+    `max_entries`.
+    """
+
+    def __init__(self, db_path: str = "llm_cache.sqlite", max_entries: int = 5000, ttl_seconds: Optional[float] = 7 * 24 * 3600):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY, llm_string TEXT, response TEXT,"
+            " created_at REAL, last_used REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_last_used ON llm_cache (last_used)")
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        if _bypass.get():
+            self.bypassed += 1
+            return None
+        key = self._key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return [_deserialize(generation) for generation in json.loads(row[0])]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        response = json.dumps([_serialize(generation) for generation in return_val])
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, llm_string, response, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (self._key(prompt, llm_string), llm_string, response, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                " SELECT key FROM llm_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def entries(self) -> int:
+        # Deliberately not __len__: LangChain tests `model.cache or ...`, so an empty cache would read as disabled
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": self.entries(),
+        }
+
+    def report(self):
+        stats = self.stats()
+        print(
+            f"🗄️ LLM cache: {stats['hits']} hits, {stats['misses']} misses, {stats['bypassed']} bypassed "
+            f"({stats['hit_rate']:.0%} hit rate, {stats['entries']} entries in '{self.db_path}')"
+        )
@@ -1,21 +1,37 @@
-from langchain_cerebras import ChatCerebras
 from langchain.prompts import ChatPromptTemplate
-from langchain_community.document_loaders import TextLoader
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
 
 
-from typing import List
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+from HrAssistantAgent.llmCache import SQLiteLLMCache
+from HrAssistantAgent.outputRepair import OutputRepairStats
+from HrAssistantAgent.tokenBudget import MIN_DEDUP_CHARS, compact_text, estimate_tokens, pack_batches
+from HrAssistantAgent.modelRouting import ModelRouter, cerebras_model
+
 import smtplib
 import os
+import time
+import threading
+from functools import lru_cache
 
 
 
 load_dotenv()
 
+# Compaction is deterministic, and the company context and a JD are compacted again on
+# every call that uses them
+_compact_text = lru_cache(maxsize=64)(compact_text)
+# Too short to hold a repeated sentence (and well under any token budget)
+SHORT_INPUT_CHARS = 2 * MIN_DEDUP_CHARS
+
 
 class JobListing(BaseModel):
     """
@@ -38,83 +54,356 @@ class JobListing(BaseModel):
     )
 
 
+class ResumeReview(BaseModel):
+    """
+    Score of one resume against a job description.
+    """
+    resume: int = Field(
+        description="Number of the resume as shown in brackets, e.g. 2 for [2]"
+    )
+    candidate: str = Field(
+        description="Name of the candidate, or 'Unknown' if the resume doesn't say"
+    )
+    score: int = Field(
+        description="Fit for the job from 0 (no fit) to 100 (perfect fit)"
+    )
+    reason: str = Field(
+        description="One sentence on the main strengths and gaps"
+    )
+
+
+class ResumeBatchReview(BaseModel):
+    """
+    Scores of every resume in one review batch.
+    """
+    reviews: List[ResumeReview] = Field(
+        description="One review per resume in the batch"
+    )
 
-class CerebrasUtils:
-    def __init__(self):
-        self.llm = ChatCerebras(model="llama-3.3-70b")
-        self.JobListingParser = PydanticOutputParser(pydantic_object=JobListing)
-        
 
 
+class CompanyProfiles:
+    """
+    Company context texts by profile key, read from disk once and re-read only when the
+    file's modification time or size changes.
+    """
 
-    def create_job_description(self, position: str) -> str:
-        loader = TextLoader("companyinfo.txt",encoding='utf-8')
-        docs= loader.load()
-        company_context = docs[0].page_content 
+    def __init__(self, paths: Optional[Dict[str, str]] = None):
+        self.paths = dict(paths or {"default": "companyinfo.txt"})
+        # key -> ((mtime_ns, size), text)
+        self._cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, path: str):
+        with self._lock:
+            self.paths[key] = path
+            self._cache.pop(key, None)
+
+    def get(self, key: str = "default") -> str:
+        if key not in self.paths:
+            raise KeyError(f"Unknown company profile '{key}', expected one of {tuple(self.paths)}")
+        path = self.paths[key]
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        with self._lock:
+            self._cache[key] = (version, text)
+        return text
 
-        prompt = PromptTemplate.from_template(
+
+class CerebrasUtils:
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        cache_max_entries: int = 5000,
+        cache_ttl: Optional[float] = 7 * 24 * 3600,
+        llm: Optional[BaseChatModel] = None,
+        company_profiles: Optional[Dict[str, str]] = None,
+        review_batch_tokens: int = 6000,
+        review_concurrency: int = 4,
+        max_input_tokens: int = 6000,
+        router: Optional[ModelRouter] = None
+    ):
+        if llm is None:
+            # Identical prompts (same position re-run, LangGraph replaying a node on resume) are
+            # answered from a local SQLite cache. HR_LLM_CACHE_PATH="" disables it; wrap a call in
+            # `bypass_llm_cache()` to force a fresh answer.
+            cache_path = os.environ.get("HR_LLM_CACHE_PATH", "llm_cache.sqlite") if cache_path is None else cache_path
+            self.cache = SQLiteLLMCache(cache_path, max_entries=cache_max_entries, ttl_seconds=cache_ttl) if cache_path else None
+            # Each task runs on the model tier of its route (HR_MODEL_ROUTES), all sharing the cache
+            self.router = router or ModelRouter(factory=lambda model: cerebras_model(model, cache=self.cache))
+        else:
+            self.cache = llm.cache if isinstance(llm.cache, SQLiteLLMCache) else None
+            self.router = router or ModelRouter.single(llm)
+        self.llm = self.router.model("generation")
+        self.JobListingParser = PydanticOutputParser(pydantic_object=JobListing)
+        # The routed chains repair malformed listings and reviews locally, or with one short correction
+        # call, instead of failing the node (falling back to a bigger model only if that fails too);
+        # every chain counts its outcomes here
+        self.output_repair_stats = OutputRepairStats()
+        self.ResumeBatchReviewParser = PydanticOutputParser(pydantic_object=ResumeBatchReview)
+        # Resume review packs resumes into prompts of at most `review_batch_tokens` and scores
+        # up to `review_concurrency` batches at a time
+        self.review_batch_tokens = review_batch_tokens
+        self.review_concurrency = review_concurrency
+        # Budget per free-text prompt input (JD, company context, ...) after compaction
+        self.max_input_tokens = max_input_tokens
+        # Company context files by profile key ("default" -> companyinfo.txt)
+        self.company_profiles = CompanyProfiles(company_profiles)
+        self._build_chains()
+
+    def _build_chains(self):
+        """Compiles every prompt and chain once; the methods below only invoke them."""
+        job_listing_instructions = self.JobListingParser.get_format_instructions()
+        route = self.router.chain
+
+        self.job_description_prompt = PromptTemplate.from_template(
             "You are an HR assistant. Write a job description for the position: {position}. "
             "Context about company can be taken from: {company_context}."
         )
-        chain = prompt | self.llm
-        response = chain.invoke({"position": position, "company_context": company_context})
-        return response.content
-    
-    def change_job_description(self, jd: str, suggestions: str) -> str:
-        prompt = PromptTemplate.from_template(
+        self.job_description_chain = route("generation", self.job_description_prompt)
+
+        self.change_job_description_prompt = PromptTemplate.from_template(
             "You are an HR assistant. Modify the following job description based on these suggestions: {suggestions}\n"
             "Job Description: {jd}"
         )
-        chain = prompt | self.llm
-        response = chain.invoke({"jd": jd, "suggestions": suggestions})
-        return response.content
-    
-
+        self.change_job_description_chain = route("generation", self.change_job_description_prompt)
 
-    def create_post_listing_data(self, jd: str) -> JobListing:
-    
-        prompt = ChatPromptTemplate.from_template(
+        self.post_listing_chain = route("extraction", ChatPromptTemplate.from_template(
             template = "You are an HR assistant. Extract the job listing details from the following job description: {jd}\n Return the details in a structured format. \n {format_instruction}",
-            partial_variables={'format_instruction':self.JobListingParser.get_format_instructions()},
-        )
-        chain = prompt | self.llm | self.JobListingParser
-        response = chain.invoke({"jd": jd})
-        return response.model_dump_json(indent=2)
-    
+            partial_variables={'format_instruction': job_listing_instructions},
+        ), self.JobListingParser, self.output_repair_stats)
 
-    def tweak_job_description(self, jd: str, post_listing: JobListing) -> str:
-        
-        prompt = ChatPromptTemplate.from_template(
+        self.tweak_job_description_chain = route("generation", ChatPromptTemplate.from_template(
             template = """You are an HR assistant. The job description is not attracting enough candidates.\n Make slight modifications to improve its appeal.\n
             Job Description: {jd}\n
             previous Job Listing: {post_listing}
             \n {format_instruction}
             """,
-            partial_variables={'format_instruction':self.JobListingParser.get_format_instructions()},
+            partial_variables={'format_instruction': job_listing_instructions},
+        ), self.JobListingParser, self.output_repair_stats)
+
+        self.review_resumes_prompt = ChatPromptTemplate.from_template(
+            template = "You are an HR assistant. Review the following resumes against the job description: {jd}\n"
+            "Resumes:\n{resumes}\n\n"
+            "Score every resume from 0 to 100 for fit with the job description.\n {format_instruction}",
+            partial_variables={'format_instruction': self.ResumeBatchReviewParser.get_format_instructions()},
         )
+        self.review_resumes_chain = route("review", self.review_resumes_prompt, self.ResumeBatchReviewParser, self.output_repair_stats)
 
-        chain = prompt | self.llm | self.JobListingParser
-        response = chain.invoke({"jd": jd, post_listing: post_listing})
+        self.offer_letter_prompt = PromptTemplate.from_template(
+            "You are an HR assistant. Generate a formal offer letter for the candidate {candidate_name} for the position of {position}.\n"
+            "Can take reference from {details}"
+        )
+        self.offer_letter_chain = route("generation", self.offer_letter_prompt)
+
+    def _compact(self, call: str, **fields: str) -> Dict[str, str]:
+        """
+        Compacts free-text prompt inputs (whitespace, repeated paragraphs and sentences) and
+        caps each at `max_input_tokens`, logging the estimated input tokens when that shrinks them.
+        """
+        compacted = {
+            name: text if len(text) < SHORT_INPUT_CHARS else _compact_text(text, self.max_input_tokens)
+            for name, text in fields.items()
+        }
+        before = sum(estimate_tokens(text) for text in fields.values())
+        after = sum(estimate_tokens(text) for text in compacted.values())
+        if after != before:
+            print(f"✂️ {call}: {before} -> {after} input tokens")
+        return compacted
+
+    def _stream_text(self, prompt, inputs: Dict, task: str = "generation") -> Iterator[str]:
+        """
+        Streams the answer of the model routed to `task` to `prompt` token by token.
+
+        Chat models skip their cache when streaming, so the cache is consulted here with the
+        same key `invoke` uses: a cached answer is yielded in one piece and a streamed answer
+        is stored once complete.
+        """
+        messages = prompt.invoke(inputs).to_messages()
+        llm = self.router.model(task)
+        cache = llm.cache if isinstance(llm.cache, SQLiteLLMCache) else None
+        if cache is not None:
+            key, llm_string = dumps(messages), llm._get_llm_string()
+            cached = cache.lookup(key, llm_string)
+            if cached:
+                yield cached[0].text
+                return
+        parts = []
+        for chunk in llm.stream(messages, config=self.router.config(task)):
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        if cache is not None:
+            cache.update(key, llm_string, [ChatGeneration(message=AIMessage(content="".join(parts)))])
+
+    async def _astream_text(self, prompt, inputs: Dict, task: str = "generation") -> AsyncIterator[str]:
+        """Async `_stream_text`: same cache bridging, tokens awaited on the event loop."""
+        messages = (await prompt.ainvoke(inputs)).to_messages()
+        llm = self.router.model(task)
+        cache = llm.cache if isinstance(llm.cache, SQLiteLLMCache) else None
+        if cache is not None:
+            key, llm_string = dumps(messages), llm._get_llm_string()
+            cached = await cache.alookup(key, llm_string)
+            if cached:
+                yield cached[0].text
+                return
+        parts = []
+        async for chunk in llm.astream(messages, config=self.router.config(task)):
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        if cache is not None:
+            await cache.aupdate(key, llm_string, [ChatGeneration(message=AIMessage(content="".join(parts)))])
+
+    def stream_job_description(self, position: str, company: str = "default") -> Iterator[str]:
+        company_context = self.company_profiles.get(company)
+        return self._stream_text(self.job_description_prompt, {"position": position, **self._compact("create_job_description", company_context=company_context)})
+
+    def stream_change_job_description(self, jd: str, suggestions: str) -> Iterator[str]:
+        return self._stream_text(self.change_job_description_prompt, self._compact("change_job_description", jd=jd, suggestions=suggestions))
+
+    def stream_offer_letter(self, candidate_name: str, position: str, details: str) -> Iterator[str]:
+        return self._stream_text(self.offer_letter_prompt, {"candidate_name": candidate_name, "position": position, **self._compact("generate_offer_letter", details=details)})
+
+    def astream_job_description(self, position: str, company: str = "default") -> AsyncIterator[str]:
+        company_context = self.company_profiles.get(company)
+        return self._astream_text(self.job_description_prompt, {"position": position, **self._compact("create_job_description", company_context=company_context)})
+
+    def astream_change_job_description(self, jd: str, suggestions: str) -> AsyncIterator[str]:
+        return self._astream_text(self.change_job_description_prompt, self._compact("change_job_description", jd=jd, suggestions=suggestions))
+
+    def astream_offer_letter(self, candidate_name: str, position: str, details: str) -> AsyncIterator[str]:
+        return self._astream_text(self.offer_letter_prompt, {"candidate_name": candidate_name, "position": position, **self._compact("generate_offer_letter", details=details)})
+
+    def create_job_description(self, position: str, company: str = "default") -> str:
+        company_context = self.company_profiles.get(company)
+        response = self.job_description_chain.invoke({"position": position, **self._compact("create_job_description", company_context=company_context)})
+        return response.content
+    
+    def change_job_description(self, jd: str, suggestions: str) -> str:
+        response = self.change_job_description_chain.invoke(self._compact("change_job_description", jd=jd, suggestions=suggestions))
+        return response.content
+    
+
+
+    def create_post_listing_data(self, jd: str) -> JobListing:
+        response = self.post_listing_chain.invoke(self._compact("create_post_listing_data", jd=jd))
+        return response.model_dump_json(indent=2)
+    
+
+    def tweak_job_description(self, jd: str, post_listing: JobListing) -> str:
+        response = self.tweak_job_description_chain.invoke({**self._compact("tweak_job_description", jd=jd), "post_listing": post_listing})
         return response.model_dump_json(indent=2)
     
 
+    def _review_batches(self, resumes: List[str], jd: str) -> Tuple[List[List[int]], List[Dict[str, str]]]:
+        """Packs resumes into token-budgeted batches and renders the prompt input of each."""
+        before = estimate_tokens(jd) + sum(estimate_tokens(resume) for resume in resumes)
+        jd = compact_text(jd, self.max_input_tokens)
+        overhead = estimate_tokens(self.review_resumes_prompt.format(jd=jd, resumes=""))
+        # Never squeeze the resumes below a useful size, even for a very long JD
+        budget = max(self.review_batch_tokens - overhead, 1000)
+        resumes = [compact_text(resume, budget) for resume in resumes]
+        after = estimate_tokens(jd) + sum(estimate_tokens(resume) for resume in resumes)
+        print(f"✂️ review_resumes: {before} -> {after} input tokens")
+        batches = pack_batches(resumes, budget)
+        inputs = [
+            {"jd": jd, "resumes": "\n\n".join(f"[{n}]\n{resumes[i]}" for n, i in enumerate(batch, start=1))}
+            for batch in batches
+        ]
+        return batches, inputs
+
+    @staticmethod
+    def _reduce_reviews(batches: List[List[int]], results: List) -> List[ResumeReview]:
+        """Merges the batch results into one ranking; `resume` becomes the 1-based position in the input."""
+        merged: Dict[int, ResumeReview] = {}
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                print(f"⚠️ Could not review resumes {batch[0] + 1}-{batch[-1] + 1}: {type(result).__name__}: {result}")
+                continue
+            for review in result.reviews:
+                # Reviews point at resumes by their number inside the batch
+                if 1 <= review.resume <= len(batch) and batch[review.resume - 1] not in merged:
+                    index = batch[review.resume - 1]
+                    merged[index] = review.model_copy(update={"resume": index + 1, "score": max(0, min(100, review.score))})
+        # Every batch uses the same 0-100 rubric, so the scores rank across batches directly
+        return sorted(merged.values(), key=lambda review: (-review.score, review.resume))
+
+    def rank_resumes(self, resumes: List[str], jd: str, max_concurrency: Optional[int] = None) -> List[ResumeReview]:
+        """
+        Scores resumes against a JD with map-reduce: resumes are packed into batches that fit
+        `review_batch_tokens`, each batch is scored by one LLM call (at most `max_concurrency`
+        at a time) and the scores are merged into a single ranking.
+        Args:
+            resumes (List[str]): Resume texts.
+            jd (str): Job description.
+            max_concurrency (Optional[int]): Simultaneous LLM calls; defaults to `review_concurrency`.
+
+        Returns:
+            List[ResumeReview]: Best fit first. Resumes whose batch failed are left out.
+        """
+        if not resumes:
+            return []
+        batches, inputs = self._review_batches(resumes, jd)
+        concurrency = max_concurrency or self.review_concurrency
+        print(f"🗂️ Reviewing {len(resumes)} resumes in {len(batches)} batches, {concurrency} at a time ...")
+        start = time.perf_counter()
+        results = self.review_resumes_chain.batch(inputs, config={"max_concurrency": concurrency}, return_exceptions=True)
+        ranked = self._reduce_reviews(batches, results)
+        print(f"✅ Reviewed {len(ranked)} resumes in {time.perf_counter() - start:.2f}s")
+        self.router.stats.report()
+        return ranked
+
     def review_resumes(self, resumes: List[str], jd: str) -> List[str]:
-        prompt = PromptTemplate.from_template(
-            "You are an HR assistant. Review the following resumes against the job description: {jd}\n"
-            "Resumes: {resumes}\n"
-            "Return a list of the most suitable candidates."
-        )
-        chain = prompt | self.llm
-        response = chain.invoke({"jd": jd, "resumes": resumes})
-        return response.content.splitlines()
+        return self._review_lines(self.rank_resumes(resumes, jd))
+
+    @staticmethod
+    def _review_lines(reviews: List[ResumeReview]) -> List[str]:
+        return [f"{review.candidate} (resume {review.resume}, score {review.score}/100): {review.reason}" for review in reviews]
     
     def generate_offer_letter(self, candidate_name: str, position: str, details: str) -> str:
-        prompt = PromptTemplate.from_template(
-            "You are an HR assistant. Generate a formal offer letter for the candidate {candidate_name} for the position of {position}.\n"
-            "Can take reference from {details}"
+        response = self.offer_letter_chain.invoke({"candidate_name": candidate_name, "position": position, **self._compact("generate_offer_letter", details=details)})
+        return response.content
+
+    # ------------------------
+    # Async: same chains, awaited so many workflows can share one event loop
+    # ------------------------
+    async def acreate_job_description(self, position: str, company: str = "default") -> str:
+        company_context = self.company_profiles.get(company)
+        response = await self.job_description_chain.ainvoke({"position": position, **self._compact("create_job_description", company_context=company_context)})
+        return response.content
+
+    async def achange_job_description(self, jd: str, suggestions: str) -> str:
+        response = await self.change_job_description_chain.ainvoke(self._compact("change_job_description", jd=jd, suggestions=suggestions))
+        return response.content
+
+    async def acreate_post_listing_data(self, jd: str) -> JobListing:
+        response = await self.post_listing_chain.ainvoke(self._compact("create_post_listing_data", jd=jd))
+        return response.model_dump_json(indent=2)
+
+    async def atweak_job_description(self, jd: str, post_listing: JobListing) -> str:
+        response = await self.tweak_job_description_chain.ainvoke({**self._compact("tweak_job_description", jd=jd), "post_listing": post_listing})
+        return response.model_dump_json(indent=2)
+
+    async def arank_resumes(self, resumes: List[str], jd: str, max_concurrency: Optional[int] = None) -> List[ResumeReview]:
+        if not resumes:
+            return []
+        batches, inputs = self._review_batches(resumes, jd)
+        results = await self.review_resumes_chain.abatch(
+            inputs, config={"max_concurrency": max_concurrency or self.review_concurrency}, return_exceptions=True
         )
-        chain = prompt | self.llm
-        response = chain.invoke({"candidate_name": candidate_name, "position": position, "details": details})
+        return self._reduce_reviews(batches, results)
+
+    async def areview_resumes(self, resumes: List[str], jd: str) -> List[str]:
+        return self._review_lines(await self.arank_resumes(resumes, jd))
+
+    async def agenerate_offer_letter(self, candidate_name: str, position: str, details: str) -> str:
+        response = await self.offer_letter_chain.ainvoke({"candidate_name": candidate_name, "position": position, **self._compact("generate_offer_letter", details=details)})
         return response.content
     
   
@@ -189,6 +478,7 @@ If you are a motivated and experienced Senior Data Scientist looking to work on
     print("\n---------------------------------------------------------")
     print(result)
     print("\n---------------------------------------------------------")
+    hr_tool.router.stats.report()
 
 # This calls the main function when the script is run directly
 if __name__ == "__main__":
@@ -1,11 +1,14 @@
 import os
+import json
+import asyncio
 import shutil
-import requests
-from typing import List, Dict, Optional
+import hashlib
+import time
+import threading
+from typing import List, Dict, Optional, Tuple
 from langchain_community.document_loaders import PyPDFLoader
 from langchain.docstore.document import Document
 from langchain_community.vectorstores import FAISS
-from langchain.embeddings import OpenAIEmbeddings
 from langchain.chat_models import ChatOpenAI
 from langchain.chains import RetrievalQA
 from dotenv import load_dotenv
@@ -15,6 +18,19 @@ from langchain_core.output_parsers import PydanticOutputParser
 from typing import List
 from pydantic import BaseModel, Field
 
+from HrAssistantAgent.resumeDownloader import ResumeDownloader, url_hash
+from HrAssistantAgent.embeddingCache import CachedEmbeddings
+from HrAssistantAgent.embeddingBackends import is_local_backend, make_embeddings, resolve_backend_name
+from HrAssistantAgent.pdfExtraction import shared_extractor
+from HrAssistantAgent.streamingIngest import StreamingIngestor
+from HrAssistantAgent.resumeSections import AGGREGATORS, aggregate_section_scores, split_document_sections
+from HrAssistantAgent.candidateRetrieval import CandidateRetriever, RankedCandidate, format_candidate_context
+from HrAssistantAgent.bm25Index import BM25Index, reciprocal_rank_fusion
+from HrAssistantAgent.requirementPrescreen import PrescreenResult, RequirementIndex
+from HrAssistantAgent.outputRepair import OutputRepairStats, RepairingOutputParser
+from HrAssistantAgent.tokenBudget import compact_text, estimate_tokens
+from HrAssistantAgent.rateGovernor import GovernedEmbeddings, govern
+
 
 load_dotenv()
 
@@ -34,6 +50,39 @@ class CandidateSummary(BaseModel):
     )
 
 
+class CandidateAssessment(BaseModel):
+    """
+    LLM assessment of one candidate against a job description.
+    """
+    name: str = Field(
+        description="Full name of the candidate"
+    )
+    email: str = Field(
+        description="Email address of the candidate"
+    )
+    score: int = Field(
+        description="Fit for the role from 0 (no fit) to 100 (perfect fit)"
+    )
+    rationale: str = Field(
+        description="Two or three sentences justifying the score with evidence from the resume"
+    )
+
+
+class ShortlistedCandidate(CandidateAssessment):
+    """
+    One entry of a ranked shortlist: the LLM assessment plus where the candidate came from.
+    """
+    application_id: str = Field(
+        description="Application id (or resume path) of the candidate"
+    )
+    retrieval_score: float = Field(
+        description="Score of the candidate in the retrieval step that shortlisted them"
+    )
+
+    def to_summary(self) -> CandidateSummary:
+        return CandidateSummary(name=self.name, email=self.email, profile_summary=self.rationale)
+
+
 class PDFRAGPipeline:
     """
     Retrieval-Augmented Generation (RAG) pipeline for PDF documents from URLs.
@@ -45,76 +94,447 @@ class PDFRAGPipeline:
         self,
         db_path: str = "faiss_resume_full_db",
         download_dir: str = "resumes",
-        model_name: str = "gpt-4-turbo"
+        model_name: str = "gpt-4-turbo",
+        download_workers: int = 8,
+        embedding_cache_dir: Optional[str] = "embedding_cache",
+        extract_workers: int = 1,
+        extract_timeout: float = 30.0,
+        max_pages: Optional[int] = 20,
+        streaming_ingest: bool = False,
+        index_mode: str = "full",
+        section_aggregator: str = "max",
+        section_weights: Optional[Dict[str, float]] = None,
+        retrieval_mode: str = "similarity",
+        hybrid_weight: float = 0.5,
+        prescreen_top_n: int = 20,
+        embedding_backend: Optional[str] = None,
+        shortlist_concurrency: int = 4,
+        max_input_tokens: int = 6000
     ):
         self.CandidateSummaryParser = PydanticOutputParser(pydantic_object=CandidateSummary)
+        self.CandidateAssessmentParser = PydanticOutputParser(pydantic_object=CandidateAssessment)
+        self.output_repair_stats = OutputRepairStats()
+        # Upper bound on simultaneous LLM calls when scoring a shortlist
+        self.shortlist_concurrency = shortlist_concurrency
+        # Budget for the JD (and each resume) in LLM prompts, after compaction
+        self.max_input_tokens = max_input_tokens
         self.db_path = db_path
         self.download_dir = download_dir
-        os.makedirs(download_dir, exist_ok=True)
-
-        self.embeddings = OpenAIEmbeddings()
-        self.llm = ChatOpenAI(model_name=model_name)
+        self.downloader = ResumeDownloader(max_workers=download_workers)
+        # extract_workers > 1 parses PDFs on a process pool (shared by every pipeline) instead of the calling thread
+        self.extractor = shared_extractor(extract_workers, extract_timeout, max_pages) if extract_workers > 1 else None
+        self.max_pages = max_pages
+        # streaming_ingest overlaps download, parse and embed in memory instead of three passes over disk
+        self.streaming_ingest = streaming_ingest
+        # index_mode "sections" embeds experience/skills/education/... separately and rolls
+        # the section scores up to one score per candidate with `section_aggregator`
+        if index_mode not in ("full", "sections"):
+            raise ValueError(f"Unknown index_mode '{index_mode}', expected 'full' or 'sections'")
+        if section_aggregator not in AGGREGATORS:
+            raise ValueError(f"Unknown section_aggregator '{section_aggregator}', expected one of {AGGREGATORS}")
+        self.index_mode = index_mode
+        self.section_aggregator = section_aggregator
+        self.section_weights = section_weights
+        # retrieval_mode "hybrid" fuses FAISS similarity with a local BM25 index (reciprocal
+        # rank fusion); hybrid_weight is the share given to the lexical ranking
+        if retrieval_mode not in ("similarity", "hybrid"):
+            raise ValueError(f"Unknown retrieval_mode '{retrieval_mode}', expected 'similarity' or 'hybrid'")
+        self.retrieval_mode = retrieval_mode
+        self.hybrid_weight = hybrid_weight
+        self.bm25 = BM25Index()
+        # With job requirements, only the `prescreen_top_n` candidates with the best
+        # deterministic requirement match reach retrieval and the LLM (0 disables)
+        self.prescreen_top_n = prescreen_top_n
+        self.requirement_index = RequirementIndex()
+
+        # "openai" (default) or a local backend such as "hashing" for air-gapped builds;
+        # falls back to $HR_EMBEDDING_BACKEND. An index must be queried with the backend it was built with.
+        self.embedding_backend = resolve_backend_name(embedding_backend)
+        self.embeddings = make_embeddings(self.embedding_backend)
+        if not is_local_backend(self.embedding_backend):
+            # Remote calls share the process-wide rate limits; cache hits below don't spend quota
+            model = getattr(self.embeddings, "model", self.embedding_backend)
+            self.embeddings = GovernedEmbeddings(self.embeddings, self.embedding_backend, model)
+        if embedding_cache_dir and not is_local_backend(self.embedding_backend):
+            self.embeddings = CachedEmbeddings(self.embeddings, cache_dir=embedding_cache_dir)
+        # The chat model is built on first use, so indexing with a local backend needs no OpenAI key
+        self.model_name = model_name
+        self._llm = None
+        self._llm_lock = threading.Lock()
+        self.assessment_prompt = ChatPromptTemplate.from_template(
+            template="You are screening candidates for the job description below. Score how well this one candidate "
+                     "fits it and explain why, citing the resume.\n\nJob description:\n{jd}\n\nResume:\n{resume}\n\n{format_instruction}",
+            partial_variables={'format_instruction': self.CandidateAssessmentParser.get_format_instructions()},
+        )
         self.vectorstore: Optional[FAISS] = None
 
+    @property
+    def llm(self):
+        with self._llm_lock:
+            if self._llm is None:
+                # 429s are retried by the governor, not the client
+                self._llm = govern(ChatOpenAI(model_name=self.model_name, max_retries=0), "openai", self.model_name)
+            return self._llm
+
+    @llm.setter
+    def llm(self, llm):
+        with self._llm_lock:
+            self._llm = llm
+
     # ------------------------
     # STEP 1: Download PDFs
     # ------------------------
     def download_pdfs(self, resume_list: List[Dict[str, str]]) -> List[str]:
-        pdf_files = []
+        return [file_name for _, file_name in self._download(resume_list)]
+
+    def _download_jobs(self, resume_list: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[Tuple[str, str]]]:
+        """Applications with a resume URL and their (url, file path) download jobs."""
+        os.makedirs(self.download_dir, exist_ok=True)
+        jobs, items, paths = [], [], set()
         for item in resume_list:
             pdf_url = item.get("resume_url")
             if not pdf_url:
                 continue
-
             file_name = os.path.join(self.download_dir, pdf_url.split("/")[-1])
-            print(f"⬇️ Downloading {file_name} ...")
-
-            response = requests.get(pdf_url)
-            if response.status_code == 200:
-                with open(file_name, "wb") as f:
-                    f.write(response.content)
-                pdf_files.append(file_name)
+            if file_name in paths:
+                # Another URL with the same basename (e.g. .../resume.pdf) in this batch
+                base, name = os.path.split(file_name)
+                file_name = os.path.join(base, f"{url_hash(pdf_url)}_{name}")
+            paths.add(file_name)
+            jobs.append((pdf_url, file_name))
+            items.append(item)
+        print(f"⬇️ Downloading {len(jobs)} PDFs with {self.downloader.max_workers} workers ...")
+        return items, jobs
+
+    def _download(self, resume_list: List[Dict[str, str]]) -> List[Tuple[Dict[str, str], str]]:
+        """Downloads resumes and returns (application, file path) pairs for the successful ones."""
+        items, jobs = self._download_jobs(resume_list)
+        start = time.perf_counter()
+        return self._collect_downloads(items, self.downloader.download_all(jobs), start)
+
+    async def _adownload(self, resume_list: List[Dict[str, str]]) -> List[Tuple[Dict[str, str], str]]:
+        """Async `_download`: the transfers run on the event loop instead of a thread pool."""
+        items, jobs = self._download_jobs(resume_list)
+        start = time.perf_counter()
+        return self._collect_downloads(items, await self.downloader.adownload_all(jobs), start)
+
+    def _collect_downloads(self, items, results, start: float) -> List[Tuple[Dict[str, str], str]]:
+        downloaded = []
+        for item, result in zip(items, results):
+            if result.ok:
+                print(f"   {os.path.basename(result.path)}: {result.num_bytes / 1024:.1f} KB in {result.elapsed:.2f}s (attempts: {result.attempts})")
+                downloaded.append((item, result.path))
             else:
-                print(f"⚠️ Failed to download {pdf_url}")
+                print(f"⚠️ Failed to download {result.url}: {result.error}")
 
-        print(f"✅ Downloaded {len(pdf_files)} PDFs successfully")
-        return pdf_files
+        print(f"✅ Downloaded {len(downloaded)} PDFs successfully in {time.perf_counter() - start:.2f}s")
+        return downloaded
 
     # ------------------------
     # STEP 2: Load PDFs as Documents
     # ------------------------
-    def load_documents(self, pdf_files: List[str]) -> List[Document]:
+    def load_documents(self, pdf_files: List[str], extra_metadata: Optional[List[Dict]] = None) -> List[Document]:
+        if self.extractor is not None:
+            return self._load_documents_parallel(pdf_files, extra_metadata)
+
         all_docs = []
-        for file_path in pdf_files:
+        for i, file_path in enumerate(pdf_files):
             loader = PyPDFLoader(file_path)
             pages = loader.load()
             full_text = "\n".join([p.page_content for p in pages])
 
-            doc = Document(
-                page_content=full_text,
-                metadata={
-                    "filename": os.path.basename(file_path),
-                    "source": file_path,
-                },
-            )
+            metadata = {
+                "filename": os.path.basename(file_path),
+                "source": file_path,
+            }
+            if extra_metadata:
+                metadata.update(extra_metadata[i])
+            doc = Document(page_content=full_text, metadata=metadata)
             all_docs.append(doc)
 
         print(f"✅ Loaded {len(all_docs)} full documents")
         return all_docs
 
+    def _load_documents_parallel(self, pdf_files: List[str], extra_metadata: Optional[List[Dict]] = None) -> List[Document]:
+        """Parses PDFs on the process pool; documents that fail or time out are skipped."""
+        start = time.perf_counter()
+        all_docs = []
+        for i, (file_path, result) in enumerate(zip(pdf_files, self.extractor.extract(pdf_files))):
+            if not result.ok:
+                print(f"⚠️ Skipping {os.path.basename(file_path)}: {result.error}")
+                continue
+            if result.truncated:
+                print(f"✂️ {os.path.basename(file_path)} truncated to {result.pages} pages")
+
+            metadata = {
+                "filename": os.path.basename(file_path),
+                "source": file_path,
+            }
+            if extra_metadata:
+                metadata.update(extra_metadata[i])
+            all_docs.append(Document(page_content=result.text, metadata=metadata))
+
+        print(f"✅ Loaded {len(all_docs)} full documents with {self.extractor.max_workers} workers in {time.perf_counter() - start:.2f}s")
+        return all_docs
+
     # ------------------------
     # STEP 3: Embed and Store in FAISS
     # ------------------------
     def build_faiss_index(self, documents: List[Document]):
         print("🔄 Building FAISS vector store ...")
         self.vectorstore = FAISS.from_documents(documents, self.embeddings)
-        self.vectorstore.save_local(self.db_path)
+        self._rebuild_bm25()
+        self._rebuild_requirement_index()
+        self._save_index()
+        # A full rebuild invalidates whatever the incremental manifest recorded
+        self._save_manifest({})
         print(f"✅ FAISS vector store saved at '{self.db_path}'")
+        if isinstance(self.embeddings, CachedEmbeddings):
+            self.embeddings.report()
+        self._cleanup_downloads()
+
+    @property
+    def bm25_path(self) -> str:
+        return os.path.join(self.db_path, "bm25.json")
 
+    @property
+    def requirement_index_path(self) -> str:
+        return os.path.join(self.db_path, "requirement_terms.json")
+
+    def _save_index(self):
+        """Persists the FAISS store and the lexical indexes built alongside it."""
+        self.vectorstore.save_local(self.db_path)
+        self.bm25.save(self.bm25_path)
+        self.requirement_index.save(self.requirement_index_path)
+
+    def _stored_documents(self):
+        """(doc_id, Document) pairs of everything in the FAISS docstore."""
+        for doc_id in self.vectorstore.index_to_docstore_id.values():
+            doc = self.vectorstore.docstore.search(doc_id)
+            if isinstance(doc, Document):
+                yield doc_id, doc
+
+    def _rebuild_bm25(self):
+        self.bm25 = BM25Index()
+        for doc_id, doc in self._stored_documents():
+            self.bm25.add(doc_id, doc.page_content)
+
+    def _rebuild_requirement_index(self):
+        texts: Dict[str, List[str]] = {}
+        for _, doc in self._stored_documents():
+            texts.setdefault(self._candidate_key(doc), []).append(doc.page_content)
+        self.requirement_index = RequirementIndex()
+        for key, parts in texts.items():
+            self.requirement_index.add(key, "\n".join(parts))
+
+    @staticmethod
+    def _candidate_key(doc: Document) -> str:
+        """Application a document belongs to (the file path for indexes built without ids)."""
+        return doc.metadata.get("application_id") or doc.metadata.get("source")
+
+    def _cleanup_downloads(self):
         if os.path.exists(self.download_dir):
             shutil.rmtree(self.download_dir)
             print(f"🧹 Cleaned up download directory: {self.download_dir}")
 
+    # ------------------------
+    # STEP 3b: Incremental per-job index
+    # ------------------------
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.db_path, "manifest.json")
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, str]]):
+        os.makedirs(self.db_path, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def application_key(item: Dict[str, str]) -> str:
+        """Stable key of an application: its id, falling back to the resume URL."""
+        app_id = item.get("id")
+        return str(app_id) if app_id is not None else item["resume_url"]
+
+    @staticmethod
+    def _entry_ids(entry: Dict) -> List[str]:
+        """Vector store ids of a manifest entry (one per section in sections mode)."""
+        return entry.get("doc_ids") or [entry["doc_id"]]
+
+    @staticmethod
+    def _file_hash(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _resume_metadata(self, item: Dict[str, str], content_hash: str, manifest: Dict[str, Dict[str, str]]) -> Optional[Dict]:
+        """Metadata for a downloaded resume, or None when the same content is already indexed."""
+        key = self.application_key(item)
+        previous = manifest.get(key)
+        if previous and previous["content_hash"] == content_hash:
+            # Same resume served from a new URL: nothing to embed
+            previous["resume_url"] = item["resume_url"]
+            return None
+        return {
+            "doc_id": f"{key}:{content_hash[:16]}",
+            "application_id": key,
+            "resume_url": item["resume_url"],
+            "content_hash": content_hash,
+            "name": item.get("name"),
+            "email": item.get("email"),
+        }
+
+    def _ingest_from_files(self, pending: List[Dict[str, str]], manifest: Dict[str, Dict[str, str]]) -> List[Document]:
+        """Download everything to `download_dir`, then parse; embedding happens when the docs are added."""
+        return self._parse_downloaded(self._download(pending), manifest)
+
+    def _parse_downloaded(self, downloaded: List[Tuple[Dict[str, str], str]], manifest: Dict[str, Dict[str, str]]) -> List[Document]:
+        """Parses downloaded resumes whose content is not indexed yet, then removes the files."""
+        new_files, new_metadata = [], []
+        for item, file_path in downloaded:
+            metadata = self._resume_metadata(item, self._file_hash(file_path), manifest)
+            if metadata is not None:
+                new_files.append(file_path)
+                new_metadata.append(metadata)
+        docs = self.load_documents(new_files, extra_metadata=new_metadata) if new_files else []
+        self._cleanup_downloads()
+        if self.index_mode == "sections":
+            docs = [section for doc in docs for section in split_document_sections(doc)]
+        return docs
+
+    def _ingest_streaming(self, pending: List[Dict[str, str]], manifest: Dict[str, Dict[str, str]]) -> Tuple[List[Document], List[List[float]]]:
+        """Overlapped download -> parse -> embed straight from memory, without temp files."""
+        ingestor = StreamingIngestor(
+            self.downloader,
+            self.embeddings,
+            max_pages=self.max_pages,
+            extractor=self.extractor,
+            splitter=split_document_sections if self.index_mode == "sections" else None,
+        )
+        result = ingestor.run(pending, lambda item, content_hash: self._resume_metadata(item, content_hash, manifest))
+        result.stats.report()
+        return result.documents, result.vectors
+
+    def update_index(self, resume_list: List[Dict[str, str]]) -> int:
+        """
+        Adds only the applications that are not in the index yet (or whose resume changed).
+        Each entry is keyed by application id plus a hash of the resume content, so a
+        re-review costs O(new applications) instead of re-embedding the whole pool.
+        Args:
+            resume_list (List[Dict[str, str]]): Applications with `id` and `resume_url`.
+
+        Returns:
+            int: Number of documents embedded in this call.
+        """
+        manifest = self._load_manifest()
+        if self._needs_load(manifest):
+            self.load_faiss_index()
+
+        pending = self._pending_applications(resume_list, manifest)
+        if not pending:
+            return 0
+
+        vectors = None
+        if self.streaming_ingest:
+            docs, vectors = self._ingest_streaming(pending, manifest)
+        else:
+            docs = self._ingest_from_files(pending, manifest)
+        return self._apply_update(docs, vectors, manifest)
+
+    async def aupdate_index(self, resume_list: List[Dict[str, str]]) -> int:
+        """
+        Async `update_index`. Downloads run on the event loop and embeddings are requested
+        with `aembed_documents`; parsing and the FAISS/manifest writes (CPU and local disk)
+        run in a worker thread so the loop stays free for other workflows.
+        """
+        if self.streaming_ingest:
+            # The streaming ingestor already overlaps its stages on its own threads
+            return await asyncio.to_thread(self.update_index, resume_list)
+
+        manifest = self._load_manifest()
+        if self._needs_load(manifest):
+            await asyncio.to_thread(self.load_faiss_index)
+
+        pending = self._pending_applications(resume_list, manifest)
+        if not pending:
+            return 0
+
+        downloaded = await self._adownload(pending)
+        docs = await asyncio.to_thread(self._parse_downloaded, downloaded, manifest)
+        vectors = await self.embeddings.aembed_documents([doc.page_content for doc in docs]) if docs else None
+        return await asyncio.to_thread(self._apply_update, docs, vectors, manifest)
+
+    def _needs_load(self, manifest: Dict[str, Dict[str, str]]) -> bool:
+        return self.vectorstore is None and bool(manifest) and os.path.exists(os.path.join(self.db_path, "index.faiss"))
+
+    def _pending_applications(self, resume_list: List[Dict[str, str]], manifest: Dict[str, Dict[str, str]]) -> List[Dict[str, str]]:
+        """Applications that are new or whose resume URL changed since they were indexed."""
+        pending = [
+            item for item in resume_list
+            if item.get("resume_url")
+            and manifest.get(self.application_key(item), {}).get("resume_url") != item["resume_url"]
+        ]
+        print(f"🔎 {len(resume_list) - len(pending)} applications already indexed, {len(pending)} to process")
+        return pending
+
+    def _apply_update(self, docs: List[Document], vectors: Optional[List[List[float]]], manifest: Dict[str, Dict[str, str]]) -> int:
+        """Swaps the new documents (and their vectors, when precomputed) into the index and saves it."""
+        if docs:
+            # Documents that failed to parse are left out of the manifest and retried next time
+            new_ids = [doc.metadata["doc_id"] for doc in docs]
+            stale_ids, entries, texts = [], {}, {}
+            for doc in docs:
+                key = doc.metadata["application_id"]
+                if key not in entries:
+                    previous = manifest.get(key)
+                    if previous:
+                        stale_ids.extend(self._entry_ids(previous))
+                    entries[key] = {
+                        "resume_url": doc.metadata["resume_url"],
+                        "content_hash": doc.metadata["content_hash"],
+                        "doc_ids": [],
+                    }
+                entries[key]["doc_ids"].append(doc.metadata["doc_id"])
+                texts.setdefault(key, []).append(doc.page_content)
+            manifest.update(entries)
+            print(f"🔄 Adding {len(docs)} new documents from {len(entries)} resumes to '{self.db_path}' ...")
+            if stale_ids and self.vectorstore is not None:
+                self.vectorstore.delete(ids=stale_ids)
+            for doc_id in stale_ids:
+                self.bm25.remove(doc_id)
+            self.bm25.add_many((doc_id, doc.page_content) for doc_id, doc in zip(new_ids, docs))
+            # Resume terms are extracted once here; pre-screening never re-reads the resumes
+            for key, parts in texts.items():
+                self.requirement_index.add(key, "\n".join(parts))
+            if vectors is not None:
+                text_embeddings = [(doc.page_content, vector) for doc, vector in zip(docs, vectors)]
+                metadatas = [doc.metadata for doc in docs]
+                if self.vectorstore is None:
+                    self.vectorstore = FAISS.from_embeddings(text_embeddings, self.embeddings, metadatas=metadatas, ids=new_ids)
+                else:
+                    self.vectorstore.add_embeddings(text_embeddings, metadatas=metadatas, ids=new_ids)
+            elif self.vectorstore is None:
+                self.vectorstore = FAISS.from_documents(docs, self.embeddings, ids=new_ids)
+            else:
+                self.vectorstore.add_documents(docs, ids=new_ids)
+
+        if self.vectorstore is not None:
+            self._save_index()
+        self._save_manifest(manifest)
+        if isinstance(self.embeddings, CachedEmbeddings):
+            self.embeddings.report()
+        print(f"✅ Index for '{self.db_path}' holds {len(manifest)} applications")
+        return len(docs)
+
     # ------------------------
     # STEP 4: Load Existing FAISS DB
     # ------------------------
@@ -125,6 +545,15 @@ class PDFRAGPipeline:
             self.embeddings,
             allow_dangerous_deserialization=True
         )
+        if os.path.exists(self.bm25_path):
+            self.bm25 = BM25Index.load(self.bm25_path)
+        else:
+            # Index built before BM25 existed: derive it from the stored documents
+            self._rebuild_bm25()
+        if os.path.exists(self.requirement_index_path):
+            self.requirement_index = RequirementIndex.load(self.requirement_index_path)
+        else:
+            self._rebuild_requirement_index()
         print("✅ FAISS database loaded successfully")
 
     # ------------------------
@@ -136,17 +565,146 @@ class PDFRAGPipeline:
             template = "Based on the provided {JD}, Which person best fits for position.  Return the details in a structured format. \n {format_instruction}",
             partial_variables={'format_instruction':self.CandidateSummaryParser.get_format_instructions()},
         )
-        query_text = prompt.format(JD=JD)
+        compacted = compact_text(JD, self.max_input_tokens)
+        print(f"✂️ query: {estimate_tokens(JD)} -> {estimate_tokens(compacted)} input tokens")
+        query_text = prompt.format(JD=compacted)
         return query_text
         
     
 
-    def query(self, jd: str, top_k: int = 1) -> CandidateSummary:
+    def prescreen(self, requirements: List[str], top_n: Optional[int] = None) -> Optional[List[PrescreenResult]]:
+        """
+        Deterministic pre-screen of the whole pool against the job requirements, using
+        the resume terms extracted at ingest time (no embeddings, no LLM).
+        Args:
+            requirements (List[str]): Structured requirements, e.g. `Job.requirements`.
+            top_n (Optional[int]): Candidates to keep; defaults to `prescreen_top_n`.
+
+        Returns:
+            Optional[List[PrescreenResult]]: Best matches first, or None when the requirements
+            give nothing to match on (every candidate then stays in the running).
+        """
+        top_n = top_n or self.prescreen_top_n
+        start = time.perf_counter()
+        results = self.requirement_index.score(requirements, top_n=top_n)
+        if results is None:
+            print("⚠️ Requirements carry no matchable terms, skipping pre-screen")
+            return None
+        if not results:
+            # Nobody matches a single term: rather than reject everyone, leave it to retrieval
+            print("⚠️ No candidate matches any requirement, skipping pre-screen")
+            return None
+        print(
+            f"🧮 Pre-screened {len(self.requirement_index)} candidates against {len(requirements)} requirements "
+            f"in {(time.perf_counter() - start) * 1000:.1f} ms, keeping {len(results)}"
+        )
+        return results
+
+    def search_chunks(self, query: str, k: int, application_ids: Optional[List[str]] = None) -> List[Tuple[Document, float]]:
+        """
+        Retrieves the top-k indexed documents (resumes or sections) for a query.
+        "similarity" returns FAISS relevance scores; "hybrid" fuses the FAISS and BM25
+        rankings and returns the fused scores. `application_ids` restricts the search to
+        those candidates (e.g. the pre-screen shortlist).
+        """
+        search_kwargs = {}
+        allowed = None
+        if application_ids is not None:
+            allowed = set(application_ids)
+            # FAISS filters after the vector search, so consider every stored vector
+            search_kwargs = {
+                "filter": lambda metadata: (metadata.get("application_id") or metadata.get("source")) in allowed,
+                "fetch_k": self.vectorstore.index.ntotal,
+            }
+        if self.retrieval_mode == "similarity":
+            return self.vectorstore.similarity_search_with_relevance_scores(query, k=k, **search_kwargs)
+
+        # Over-fetch both rankings so documents strong in only one of them can still surface
+        dense = self.vectorstore.similarity_search_with_score(query, k=k * 2, **search_kwargs)
+        if allowed is None:
+            lexical = self.bm25.search(query, k=k * 2)
+        else:
+            lexical = []
+            for doc_id, score in self.bm25.search(query, k=len(self.bm25)):
+                doc = self.vectorstore.docstore.search(doc_id)
+                if isinstance(doc, Document) and self._candidate_key(doc) in allowed:
+                    lexical.append((doc_id, score))
+                    if len(lexical) == k * 2:
+                        break
+        fused = reciprocal_rank_fusion(
+            [[doc.id for doc, _ in dense], [doc_id for doc_id, _ in lexical]],
+            [1 - self.hybrid_weight, self.hybrid_weight],
+        )
+        docs_by_id = {doc.id: doc for doc, _ in dense}
+        results = []
+        for doc_id, score in fused:
+            doc = docs_by_id.get(doc_id) or self.vectorstore.docstore.search(doc_id)
+            if isinstance(doc, Document):
+                results.append((doc, score))
+            if len(results) == k:
+                break
+        return results
+
+    def rank_candidates(
+        self,
+        jd: str,
+        top_n: int = 5,
+        fetch_k: Optional[int] = None,
+        application_ids: Optional[List[str]] = None
+    ) -> List[RankedCandidate]:
+        """
+        Ranks candidates (not chunks) against the JD. Every retrieved chunk's relevance
+        score is grouped by candidate and section, then rolled up with the configured aggregator.
+        Args:
+            jd (str): Job description used as the search query.
+            top_n (int): Number of candidates to return.
+            fetch_k (Optional[int]): Chunks to retrieve before grouping.
+            application_ids (Optional[List[str]]): Only rank these candidates.
+
+        Returns:
+            List[RankedCandidate]: Best candidates first.
+        """
+        if not self.vectorstore:
+            raise ValueError("❌ FAISS index not loaded. Run build_faiss_index() or load_faiss_index().")
+
+        fetch_k = fetch_k or (top_n * 10 if self.index_mode == "sections" else top_n)
+        matches = self.search_chunks(jd, k=fetch_k, application_ids=application_ids)
+
+        candidates: Dict[str, RankedCandidate] = {}
+        for doc, score in matches:
+            key = self._candidate_key(doc)
+            candidate = candidates.setdefault(key, RankedCandidate(application_id=key, score=0.0))
+            candidate.matches.append((doc, score))
+            candidate.section_scores.setdefault(doc.metadata.get("section", "full"), []).append(score)
+
+        for candidate in candidates.values():
+            candidate.score = aggregate_section_scores(candidate.section_scores, self.section_aggregator, self.section_weights)
+        ranked = sorted(candidates.values(), key=lambda candidate: candidate.score, reverse=True)
+        return ranked[:top_n]
+
+    def _prescreened_ids(self, requirements: Optional[List[str]]) -> Optional[List[str]]:
+        """Application ids kept by the requirement pre-screen, or None to search the whole pool."""
+        if not requirements or not self.prescreen_top_n:
+            return None
+        shortlist = self.prescreen(requirements)
+        return None if shortlist is None else [result.application_id for result in shortlist]
+
+    def _build_retriever(self, jd: str, top_k: int, application_ids: Optional[List[str]] = None):
+        if self.index_mode == "sections" or self.retrieval_mode == "hybrid" or application_ids is not None:
+            # Only the best-matching chunks of the top (fused / pre-screened) candidates are stuffed into the prompt
+            return CandidateRetriever(pipeline=self, jd=jd, top_n=top_k, application_ids=application_ids)
+        return self.vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": top_k})
+
+    def _qa_chain(self, jd: str, top_k: int, requirements: Optional[List[str]]) -> RetrievalQA:
         if not self.vectorstore:
             raise ValueError("❌ FAISS index not loaded. Run build_faiss_index() or load_faiss_index().")
 
-        retriever = self.vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": top_k})
-        qa_chain = RetrievalQA.from_chain_type(llm=self.llm, retriever=retriever, chain_type="stuff")
+        application_ids = self._prescreened_ids(requirements)
+        retriever = self._build_retriever(jd, top_k, application_ids)
+        return RetrievalQA.from_chain_type(llm=self.llm, retriever=retriever, chain_type="stuff")
+
+    def query(self, jd: str, top_k: int = 1, requirements: Optional[List[str]] = None) -> CandidateSummary:
+        qa_chain = self._qa_chain(jd, top_k, requirements)
 
         
     
@@ -161,26 +719,124 @@ class PDFRAGPipeline:
         # Parse LLM output into Pydantic CandidateSummary
         # candidate_summary = self.CandidateSummaryParser.parse(llm_output)
         print("✅ Query completed.")
-        candidate_summary = self.CandidateSummaryParser.parse(llm_output)
+        candidate_summary = self._repairing(self.CandidateSummaryParser).parse(llm_output)
 
         print(candidate_summary)        # Pydantic object
         print(candidate_summary.email) 
         # Return as JSON
         return candidate_summary
-    
-    def full_run(self, resume_list: List[Dict[str, str]], jd: str) -> CandidateSummary:
-        # 1️⃣ Download PDFs
-        pdf_files = self.download_pdfs(resume_list)
 
-        # 2️⃣ Load into documents
-        docs = self.load_documents(pdf_files)
-
-        # 3️⃣ Build FAISS DB
-        self.build_faiss_index(docs)
+    async def aquery(self, jd: str, top_k: int = 1, requirements: Optional[List[str]] = None) -> CandidateSummary:
+        """Async `query`: the LLM call is awaited instead of blocking the caller's thread."""
+        qa_chain = await asyncio.to_thread(self._qa_chain, jd, top_k, requirements)
+        result = await qa_chain.ainvoke({"query": self.create_query(jd)})
+        print("✅ Query completed.")
+        return await self._repairing(self.CandidateSummaryParser).aparse(result["result"])
+    
+    def shortlist(
+        self,
+        jd: str,
+        n: int = 5,
+        requirements: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        chunks_per_candidate: int = 3
+    ) -> List[ShortlistedCandidate]:
+        """
+        Retrieves the top-n candidates for the JD and scores each one with its own LLM call.
+        The calls run concurrently (at most `max_concurrency` at a time), so wall-clock time
+        grows with n / max_concurrency instead of n, and every prompt holds a single resume.
+        Args:
+            jd (str): Job description.
+            n (int): Number of candidates to score.
+            requirements (Optional[List[str]]): Structured requirements for the pre-screen.
+            max_concurrency (Optional[int]): Simultaneous LLM calls; defaults to `shortlist_concurrency`.
+            chunks_per_candidate (int): Resume chunks given to the LLM per candidate.
+
+        Returns:
+            List[ShortlistedCandidate]: Highest LLM score first. Candidates whose call fails are left out.
+        """
+        candidates, inputs = self._shortlist_inputs(jd, n, requirements, chunks_per_candidate)
+        if not candidates:
+            return []
+
+        concurrency = max_concurrency or self.shortlist_concurrency
+        chain = self.assessment_prompt | self.llm | self._repairing(self.CandidateAssessmentParser)
+        print(f"🧑‍⚖️ Scoring {len(candidates)} candidates with up to {concurrency} concurrent LLM calls ...")
+        start = time.perf_counter()
+        assessments = chain.batch(inputs, config={"max_concurrency": concurrency}, return_exceptions=True)
+        return self._collect_assessments(candidates, assessments, start)
+
+    async def ashortlist(
+        self,
+        jd: str,
+        n: int = 5,
+        requirements: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        chunks_per_candidate: int = 3
+    ) -> List[ShortlistedCandidate]:
+        """Async `shortlist`: the per-candidate LLM calls are awaited concurrently on the event loop."""
+        candidates, inputs = await asyncio.to_thread(self._shortlist_inputs, jd, n, requirements, chunks_per_candidate)
+        if not candidates:
+            return []
+
+        concurrency = max_concurrency or self.shortlist_concurrency
+        chain = self.assessment_prompt | self.llm | self._repairing(self.CandidateAssessmentParser)
+        print(f"🧑‍⚖️ Scoring {len(candidates)} candidates with up to {concurrency} concurrent LLM calls ...")
+        start = time.perf_counter()
+        assessments = await chain.abatch(inputs, config={"max_concurrency": concurrency}, return_exceptions=True)
+        return self._collect_assessments(candidates, assessments, start)
+
+    def _shortlist_inputs(self, jd: str, n: int, requirements: Optional[List[str]], chunks_per_candidate: int):
+        """Top-n candidates for the JD and one assessment prompt input per candidate."""
+        if not self.vectorstore:
+            raise ValueError("❌ FAISS index not loaded. Run build_faiss_index() or load_faiss_index().")
 
-        # 4️⃣ Query the RAG system
-        candidate_summary = self.query(jd)
+        candidates = self.rank_candidates(jd, top_n=n, application_ids=self._prescreened_ids(requirements))
+        resumes = ["\n\n".join(doc.page_content for doc in format_candidate_context(candidate, chunks_per_candidate)) for candidate in candidates]
+        compacted_jd = compact_text(jd, self.max_input_tokens)
+        compacted = [compact_text(resume, self.max_input_tokens) for resume in resumes]
+        before = len(resumes) * estimate_tokens(jd) + sum(estimate_tokens(resume) for resume in resumes)
+        after = len(compacted) * estimate_tokens(compacted_jd) + sum(estimate_tokens(resume) for resume in compacted)
+        print(f"✂️ shortlist: {before} -> {after} input tokens")
+        inputs = [{"jd": compacted_jd, "resume": resume} for resume in compacted]
+        return candidates, inputs
+
+    def _collect_assessments(self, candidates, assessments, start: float) -> List[ShortlistedCandidate]:
+        shortlisted = []
+        for candidate, assessment in zip(candidates, assessments):
+            if isinstance(assessment, Exception):
+                print(f"⚠️ Could not score candidate {candidate.application_id}: {type(assessment).__name__}: {assessment}")
+                continue
+            metadata = candidate.matches[0][0].metadata
+            shortlisted.append(ShortlistedCandidate(
+                # Contact details from the application beat whatever the LLM read off the resume
+                name=metadata.get("name") or assessment.name,
+                email=metadata.get("email") or assessment.email,
+                score=max(0, min(100, assessment.score)),
+                rationale=assessment.rationale,
+                application_id=candidate.application_id,
+                retrieval_score=float(candidate.score),
+            ))
+        shortlisted.sort(key=lambda entry: (entry.score, entry.retrieval_score), reverse=True)
+        print(f"✅ Shortlisted {len(shortlisted)} candidates in {time.perf_counter() - start:.2f}s")
+        self.output_repair_stats.report()
+        return shortlisted
+
+    def _repairing(self, parser: PydanticOutputParser) -> RepairingOutputParser:
+        """Wraps `parser` so malformed answers are repaired (or corrected by `self.llm`) before giving up."""
+        return RepairingOutputParser(parser=parser, llm=self.llm, stats=self.output_repair_stats)
+
+    def full_run(self, resume_list: List[Dict[str, str]], jd: str, requirements: Optional[List[str]] = None) -> CandidateSummary:
+        # 1️⃣ - 3️⃣ Download, load and embed only the applications not indexed yet
+        self.update_index(resume_list)
+
+        # 4️⃣ Pre-screen on the job requirements, then query the RAG system on the shortlist
+        candidate_summary = self.query(jd, requirements=requirements)
         return candidate_summary
+
+    async def afull_run(self, resume_list: List[Dict[str, str]], jd: str, requirements: Optional[List[str]] = None) -> CandidateSummary:
+        await self.aupdate_index(resume_list)
+        return await self.aquery(jd, requirements=requirements)
     
         
 
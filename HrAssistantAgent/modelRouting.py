@@ -0,0 +1,265 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from langchain_cerebras import ChatCerebras
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import Runnable
+
+from HrAssistantAgent.outputRepair import OutputRepairStats, RepairingOutputParser
+from HrAssistantAgent.rateGovernor import govern
+from HrAssistantAgent.tokenBudget import estimate_tokens
+
+
+@dataclass
+class ModelTier:
+    """A model and its list price in USD per million input/output tokens."""
+    model: str
+    input_cost: float = 0.0
+    output_cost: float = 0.0
+
+
+# Cerebras list prices; only used for the cost estimate in the routing report
+DEFAULT_MODEL_TIERS: Dict[str, ModelTier] = {
+    "small": ModelTier("llama3.1-8b", input_cost=0.10, output_cost=0.10),
+    "medium": ModelTier("llama-4-scout-17b-16e-instruct", input_cost=0.65, output_cost=0.85),
+    "large": ModelTier("llama-3.3-70b", input_cost=0.85, output_cost=1.20),
+}
+
+# task -> tiers (or model names) tried in order; a later one is used only when the answer of
+# the previous one cannot be parsed. Override with HR_MODEL_ROUTES (JSON of the same shape)
+DEFAULT_MODEL_ROUTES: Dict[str, List[str]] = {
+    "generation": ["large"],
+    "extraction": ["small", "large"],
+    "review": ["medium", "large"],
+    "tool_calling": ["medium"],
+}
+
+
+def _routes_from_env() -> Dict[str, List[str]]:
+    routes = dict(DEFAULT_MODEL_ROUTES)
+    raw = os.environ.get("HR_MODEL_ROUTES")
+    if raw:
+        routes.update({task: [names] if isinstance(names, str) else list(names) for task, names in json.loads(raw).items()})
+    return routes
+
+
+def cerebras_model(model: str, **kwargs) -> BaseChatModel:
+    """A Cerebras chat model sharing the process-wide limits (HR_RATE_LIMITS); 429s are retried by the governor."""
+    return govern(ChatCerebras(model=model, max_retries=0), "cerebras", model, **kwargs)
+
+
+class RoutingStats(BaseCallbackHandler):
+    """
+    Callback handler that records, per task and model, the calls, errors, answers that
+    could not be parsed, latency, tokens (reported usage, else estimated) and estimated cost.
+    Only runs tagged by `ModelRouter.config` are counted.
+    """
+    run_inline = True
+
+    def __init__(self, tiers: Optional[Dict[str, ModelTier]] = None):
+        self.prices = {tier.model: tier for tier in (tiers or DEFAULT_MODEL_TIERS).values()}
+        self._lock = threading.Lock()
+        # run_id -> (task, model, step, start, estimated prompt tokens)
+        self._runs: Dict[UUID, tuple] = {}
+        # run_id -> (task, model) of parser runs
+        self._parsers: Dict[UUID, tuple] = {}
+        # (task, model) -> counters
+        self.counters: Dict[tuple, Dict[str, float]] = {}
+
+    def _counter(self, task: str, model: str, step: int) -> Dict[str, float]:
+        return self.counters.setdefault((task, model), {
+            "step": step, "calls": 0, "errors": 0, "parse_failures": 0,
+            "seconds": 0.0, "input_tokens": 0, "output_tokens": 0,
+        })
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata: Optional[Dict[str, Any]] = None, **kwargs):
+        if not metadata or "route_task" not in metadata:
+            return
+        prompt_tokens = sum(estimate_tokens(str(message.content)) for message in messages[0])
+        with self._lock:
+            self._runs[run_id] = (metadata["route_task"], metadata["route_model"], metadata["route_step"], time.perf_counter(), prompt_tokens)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs):
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        task, model, step, start, prompt_tokens = run
+        generation = response.generations[0][0] if response.generations and response.generations[0] else None
+        usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+        input_tokens = usage.get("input_tokens") or prompt_tokens
+        output_tokens = usage.get("output_tokens") or estimate_tokens(generation.text if generation else "")
+        with self._lock:
+            counter = self._counter(task, model, step)
+            counter["calls"] += 1
+            counter["seconds"] += time.perf_counter() - start
+            counter["input_tokens"] += input_tokens
+            counter["output_tokens"] += output_tokens
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs):
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+            if run is not None:
+                task, model, step, start, _ = run
+                counter = self._counter(task, model, step)
+                counter["calls"] += 1
+                counter["errors"] += 1
+                counter["seconds"] += time.perf_counter() - start
+
+    def on_chain_start(self, serialized, inputs, *, run_id: UUID, metadata: Optional[Dict[str, Any]] = None, **kwargs):
+        if metadata and "route_task" in metadata:
+            with self._lock:
+                self._parsers[run_id] = (metadata["route_task"], metadata["route_model"], metadata["route_step"])
+
+    def on_chain_end(self, outputs, *, run_id: UUID, **kwargs):
+        with self._lock:
+            self._parsers.pop(run_id, None)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs):
+        with self._lock:
+            run = self._parsers.pop(run_id, None)
+            if run is not None and isinstance(error, OutputParserException):
+                self._counter(*run)["parse_failures"] += 1
+
+    def cost(self, model: str, input_tokens: float, output_tokens: float) -> float:
+        tier = self.prices.get(model)
+        if tier is None:
+            return 0.0
+        return (input_tokens * tier.input_cost + output_tokens * tier.output_cost) / 1e6
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per task: calls, fallbacks, errors, parse failures, mean latency, tokens and cost, with a per-model breakdown."""
+        with self._lock:
+            counters = {key: dict(counter) for key, counter in self.counters.items()}
+        tasks: Dict[str, Dict[str, Any]] = {}
+        for (task, model), c in sorted(counters.items(), key=lambda item: (item[0][0], item[1]["step"])):
+            cost = self.cost(model, c["input_tokens"], c["output_tokens"])
+            entry = tasks.setdefault(task, {
+                "calls": 0, "fallbacks": 0, "errors": 0, "parse_failures": 0,
+                "seconds": 0.0, "tokens": 0, "cost": 0.0, "models": {},
+            })
+            entry["calls"] += c["calls"]
+            entry["fallbacks"] += c["calls"] if c["step"] > 0 else 0
+            entry["errors"] += c["errors"]
+            entry["parse_failures"] += c["parse_failures"]
+            entry["seconds"] += c["seconds"]
+            entry["tokens"] += c["input_tokens"] + c["output_tokens"]
+            entry["cost"] += cost
+            entry["models"][model] = {
+                "calls": c["calls"], "parse_failures": c["parse_failures"],
+                "mean_latency": c["seconds"] / c["calls"] if c["calls"] else 0.0, "cost": cost,
+            }
+        for entry in tasks.values():
+            entry["mean_latency"] = entry["seconds"] / entry["calls"] if entry["calls"] else 0.0
+        return tasks
+
+    def report(self):
+        for task, s in self.stats().items():
+            models = ", ".join(f"{model} x{m['calls']}" for model, m in s["models"].items())
+            print(
+                f"🧭 {task}: {s['calls']} calls ({models}), {s['fallbacks']} fell back, {s['parse_failures']} unparseable, "
+                f"{s['errors']} errors, {s['mean_latency']:.2f}s mean latency, {s['tokens']} tokens, ~${s['cost']:.4f}"
+            )
+
+
+class ModelRouter:
+    """
+    Maps each task (generation, extraction, review, tool_calling) to an ordered list of
+    model tiers, so cheap tasks run on smaller, faster models and only fall back to a
+    bigger one when its answer cannot be parsed. Models are built once per name by
+    `factory` and shared by every task that routes to them.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, List[str]]] = None,
+        tiers: Optional[Dict[str, ModelTier]] = None,
+        factory: Callable[[str], BaseChatModel] = cerebras_model,
+        stats: Optional[RoutingStats] = None,
+    ):
+        self.tiers = dict(DEFAULT_MODEL_TIERS if tiers is None else tiers)
+        self.routes = _routes_from_env() if routes is None else dict(routes)
+        self.factory = factory
+        self.stats = stats or RoutingStats(self.tiers)
+        self._models: Dict[str, BaseChatModel] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def single(cls, llm: BaseChatModel, name: Optional[str] = None) -> "ModelRouter":
+        """Routes every task to `llm` (no fallback); used when a model is injected."""
+        name = name or getattr(llm, "model_name", None) or llm._llm_type
+        return cls(
+            routes={task: ["default"] for task in DEFAULT_MODEL_ROUTES},
+            tiers={"default": ModelTier(name)},
+            factory=lambda _: llm,
+        )
+
+    def model_names(self, task: str) -> List[str]:
+        """Model names tried for `task`, in order."""
+        if task not in self.routes:
+            raise KeyError(f"No model route for task '{task}', expected one of {tuple(self.routes)}")
+        names: List[str] = []
+        for entry in self.routes[task]:
+            name = self.tiers[entry].model if entry in self.tiers else entry
+            if name not in names:
+                names.append(name)
+        return names
+
+    def _model(self, name: str) -> BaseChatModel:
+        with self._lock:
+            if name not in self._models:
+                self._models[name] = self.factory(name)
+            return self._models[name]
+
+    def model(self, task: str, step: int = 0) -> BaseChatModel:
+        """The model used for `task` at fallback `step` (0 = first choice)."""
+        return self._model(self.model_names(task)[step])
+
+    def config(self, task: str, step: int = 0) -> Dict[str, Any]:
+        """Run config that tags a call with its task and model for the routing stats."""
+        return {
+            "callbacks": [self.stats],
+            "metadata": {"route_task": task, "route_model": self.model_names(task)[step], "route_step": step},
+        }
+
+    def chain(
+        self,
+        task: str,
+        prompt: Runnable,
+        parser: Optional[PydanticOutputParser] = None,
+        repair_stats: Optional[OutputRepairStats] = None,
+    ) -> Runnable:
+        """
+        Builds `prompt | model [| parser]` for every model routed to `task`; with a parser,
+        an answer that cannot be parsed (even after repair by the same model) is retried on
+        the next model.
+        Args:
+            task (str): Routing table key.
+            prompt (Runnable): Prompt template of the call.
+            parser (Optional[PydanticOutputParser]): Structured output parser, wrapped in a RepairingOutputParser.
+            repair_stats (Optional[OutputRepairStats]): Where the repair outcomes are counted.
+
+        Returns:
+            Runnable: The chain, with the bigger models as fallbacks.
+        """
+        steps = []
+        for step in range(len(self.model_names(task))):
+            model = self.model(task, step)
+            config = self.config(task, step)
+            chain = prompt | model.with_config(config)
+            if parser is not None:
+                repairing = RepairingOutputParser(parser=parser, llm=model, correction_config=config, stats=repair_stats or OutputRepairStats())
+                chain = chain | repairing.with_config(config)
+            steps.append(chain)
+        if len(steps) == 1 or parser is None:
+            return steps[0]
+        return steps[0].with_fallbacks(steps[1:], exceptions_to_handle=(OutputParserException,))
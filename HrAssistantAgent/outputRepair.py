@@ -0,0 +1,308 @@
+import re
+import json
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple, get_args, get_origin
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.output_parsers import BaseOutputParser, PydanticOutputParser
+from langchain_core.outputs import Generation
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+
+_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+_LIST_SPLIT = re.compile(r"\s*(?:\n|;|,(?![^()]*\)))\s*")
+_BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+CORRECTION_PROMPT = (
+    "Your previous answer could not be parsed.\n"
+    "Error: {error}\n"
+    "Answer:\n{output}\n\n"
+    "Reply with only the corrected JSON object, no explanation. {format_instructions}"
+)
+
+
+class OutputRepairStats:
+    """
+    Thread-safe counters of how model outputs were parsed: clean, repaired locally (per
+    repair kind), corrected by an extra LLM call, or failed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.outcomes: Counter = Counter()
+        self.repairs: Counter = Counter()
+
+    def record(self, outcome: str, repairs: Tuple[str, ...] = ()):
+        with self._lock:
+            self.outcomes[outcome] += 1
+            self.repairs.update(repairs)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            outcomes, repairs = dict(self.outcomes), dict(self.repairs)
+        total = sum(outcomes.values())
+        return {
+            "parsed": total,
+            "clean": outcomes.get("clean", 0),
+            "repaired": outcomes.get("repaired", 0),
+            "corrected": outcomes.get("corrected", 0),
+            "failed": outcomes.get("failed", 0),
+            "failure_rate": outcomes.get("failed", 0) / total if total else 0.0,
+            "repair_rate": (outcomes.get("repaired", 0) + outcomes.get("corrected", 0)) / total if total else 0.0,
+            "repairs": repairs,
+        }
+
+    def report(self):
+        stats = self.stats()
+        kinds = ", ".join(f"{kind} {count}" for kind, count in sorted(stats["repairs"].items())) or "none"
+        print(
+            f"🩹 Output repair: {stats['parsed']} parsed, {stats['clean']} clean, {stats['repaired']} repaired locally, "
+            f"{stats['corrected']} corrected by LLM, {stats['failed']} failed (repairs: {kinds})"
+        )
+
+
+# ------------------------
+# Local repairs
+# ------------------------
+def _strip_fences(text: str) -> str:
+    match = _FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def _extract_object(text: str) -> str:
+    """Drops prose around the outermost JSON object (or array)."""
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        return text
+    start = min(starts)
+    closer = "}" if text[start] == "{" else "]"
+    end = text.rfind(closer)
+    return text[start:end + 1] if end > start else text[start:]
+
+
+def _close_structure(text: str) -> str:
+    """
+    String-aware pass that drops trailing commas, turns Python literals into JSON ones and
+    closes whatever a truncated answer left open (a string, then brackets innermost first).
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = escaped = False
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            i += 1
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+            else:
+                i += 1
+                continue
+        elif ch.isalpha():
+            word = re.match(r"\w+", text[i:]).group(0)
+            out.append(_PY_LITERALS.get(word, word))
+            i += len(word)
+            continue
+        out.append(ch)
+        i += 1
+
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+    while stack:
+        while out and out[-1].isspace():
+            out.pop()
+        if out and out[-1] == ",":
+            out.pop()
+        elif out and out[-1] == ":":
+            # The value was cut off entirely
+            out.append("null")
+        out.append(stack.pop())
+    return "".join(out)
+
+
+def _coerce_value(value: Any, annotation: Any) -> Any:
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is not None and type(None) in args:
+        # Optional[X]
+        inner = [arg for arg in args if arg is not type(None)]
+        return value if value is None or len(inner) != 1 else _coerce_value(value, inner[0])
+    if origin in (list, List):
+        if isinstance(value, str):
+            items = [_BULLET.sub("", item).strip() for item in _LIST_SPLIT.split(value)]
+            return [item for item in items if item]
+        if isinstance(value, dict):
+            return [f"{key}: {item}" for key, item in value.items()]
+        return value
+    if annotation is str:
+        if isinstance(value, list):
+            return ", ".join(str(item) for item in value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        return value
+    if annotation in (int, float) and isinstance(value, str):
+        match = _NUMBER.search(value)
+        if match:
+            number = float(match.group(0))
+            return int(round(number)) if annotation is int else number
+    if annotation is int and isinstance(value, float):
+        return int(round(value))
+    return value
+
+
+def coerce_fields(data: Dict[str, Any], model: type) -> Dict[str, Any]:
+    """Maps keys case-insensitively onto the model's fields and coerces obvious type slips."""
+    fields = model.model_fields
+    by_lower = {name.lower().replace(" ", "_"): name for name in fields}
+    coerced = {}
+    for key, value in data.items():
+        name = key if key in fields else by_lower.get(str(key).lower().replace(" ", "_").replace("-", "_"), key)
+        coerced[name] = _coerce_value(value, fields[name].annotation) if name in fields else value
+    return coerced
+
+
+def repair_json(text: str) -> Tuple[Any, Tuple[str, ...]]:
+    """
+    Loads JSON from a model answer, applying the cheapest repairs first.
+
+    Returns:
+        Tuple[Any, Tuple[str, ...]]: The parsed value and the names of the repairs applied.
+    Raises:
+        ValueError: If the text still isn't JSON after every repair.
+    """
+    repairs = []
+    candidate = text.strip()
+    for name, repair in (
+        ("fences", _strip_fences),
+        ("extracted", _extract_object),
+        ("quotes", lambda s: s.translate(_SMART_QUOTES)),
+        ("structure", _close_structure),
+    ):
+        try:
+            return json.loads(candidate), tuple(repairs)
+        except json.JSONDecodeError:
+            pass
+        repaired = repair(candidate).strip()
+        if repaired != candidate:
+            repairs.append(name)
+            candidate = repaired
+    try:
+        return json.loads(candidate), tuple(repairs)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"not valid JSON after repairs {repairs}: {e}") from e
+
+
+class RepairingOutputParser(BaseOutputParser[Any]):
+    """
+    Drop-in replacement for a `PydanticOutputParser` in a chain. A malformed answer is
+    repaired locally (code fences, surrounding prose, smart quotes, trailing commas,
+    truncated brackets, field name/type slips); only if that fails is `llm` asked once
+    for a corrected answer, given just the error and the broken output rather than the
+    original prompt, with `correction_config` (e.g. the routing callbacks). Outcomes are
+    counted in `stats`.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    parser: PydanticOutputParser
+    llm: Optional[BaseLanguageModel] = None
+    correction_config: Optional[RunnableConfig] = None
+    stats: OutputRepairStats
+    max_corrections: int = 1
+
+    @property
+    def _type(self) -> str:
+        return "repairing_pydantic"
+
+    def get_format_instructions(self) -> str:
+        return self.parser.get_format_instructions()
+
+    def _local(self, text: str) -> Tuple[BaseModel, Tuple[str, ...]]:
+        model = self.parser.pydantic_object
+        data, repairs = repair_json(text)
+        if isinstance(data, list) and len(data) == 1 and isinstance(data[0], dict):
+            data, repairs = data[0], repairs + ("unwrapped",)
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+        try:
+            return model.model_validate(data), repairs
+        except ValidationError:
+            coerced = coerce_fields(data, model)
+            return model.model_validate(coerced), repairs + ("coerced",)
+
+    def _try(self, text: str) -> Tuple[Optional[BaseModel], Tuple[str, ...], Optional[Exception]]:
+        try:
+            return self.parser.parse(text), (), None
+        except OutputParserException:
+            pass
+        try:
+            parsed, repairs = self._local(text)
+            return parsed, repairs, None
+        except ValueError as e:
+            # pydantic's ValidationError is a ValueError too
+            return None, (), e
+
+    def _correction_prompt(self, text: str, error: Exception) -> str:
+        return CORRECTION_PROMPT.format(
+            error=str(error).splitlines()[0][:500],
+            output=text[-4000:],
+            format_instructions=self.parser.get_format_instructions(),
+        )
+
+    def _finish(self, parsed: Optional[BaseModel], repairs: Tuple[str, ...], error: Optional[Exception], text: str, corrected: bool = False):
+        if parsed is None:
+            self.stats.record("failed")
+            raise OutputParserException(f"Could not parse or repair model output: {error}", llm_output=text)
+        self.stats.record("corrected" if corrected else ("repaired" if repairs else "clean"), repairs)
+        return parsed
+
+    def parse(self, text: str) -> Any:
+        parsed, repairs, error = self._try(text)
+        attempts = 0
+        while parsed is None and self.llm is not None and attempts < self.max_corrections:
+            attempts += 1
+            print(f"🩹 Asking the model to correct unparseable output ({type(error).__name__})")
+            answer = self.llm.invoke(self._correction_prompt(text, error), config=self.correction_config)
+            text = getattr(answer, "content", answer)
+            parsed, repairs, error = self._try(text)
+        return self._finish(parsed, repairs, error, text, corrected=attempts > 0)
+
+    async def aparse(self, text: str) -> Any:
+        parsed, repairs, error = self._try(text)
+        attempts = 0
+        while parsed is None and self.llm is not None and attempts < self.max_corrections:
+            attempts += 1
+            print(f"🩹 Asking the model to correct unparseable output ({type(error).__name__})")
+            answer = await self.llm.ainvoke(self._correction_prompt(text, error), config=self.correction_config)
+            text = getattr(answer, "content", answer)
+            parsed, repairs, error = self._try(text)
+        return self._finish(parsed, repairs, error, text, corrected=attempts > 0)
+
+    def parse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        return self.parse(result[0].text)
+
+    async def aparse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        return await self.aparse(result[0].text)
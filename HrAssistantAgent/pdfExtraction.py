@@ -0,0 +1,195 @@
+import io
+import time
+import signal
+import threading
+import multiprocessing
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pypdf import PdfReader
+
+
+PDFSource = Union[str, bytes]
+
+# Seconds allowed for spawning the worker processes on top of the per-document timeouts
+POOL_STARTUP_GRACE = 10.0
+
+
+@dataclass
+class ExtractionResult:
+    """
+    Text extracted from one PDF, or the reason it could not be extracted.
+    """
+    text: str = ""
+    pages: int = 0
+    truncated: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _ExtractionTimeout(Exception):
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise _ExtractionTimeout()
+
+
+def extract_pdf_text(source: PDFSource, max_pages: Optional[int] = None) -> ExtractionResult:
+    """
+    Extracts the text of a PDF given as a file path or as raw bytes.
+    Args:
+        source (Union[str, bytes]): Path to the PDF or its content.
+        max_pages (Optional[int]): Stop after this many pages.
+
+    Returns:
+        ExtractionResult: Joined page text and page count.
+    """
+    reader = PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+    total_pages = len(reader.pages)
+    limit = total_pages if max_pages is None else min(total_pages, max_pages)
+    texts = [reader.pages[i].extract_text() or "" for i in range(limit)]
+    return ExtractionResult(text="\n".join(texts), pages=limit, truncated=limit < total_pages)
+
+
+def _extract_worker(source: PDFSource, max_pages: Optional[int], timeout: Optional[float]) -> ExtractionResult:
+    """Runs in a pool process. Uses SIGALRM (where available) so a hung parse frees the worker."""
+    use_alarm = timeout and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return extract_pdf_text(source, max_pages)
+    except _ExtractionTimeout:
+        return ExtractionResult(error=f"timed out after {timeout}s")
+    except Exception as e:
+        return ExtractionResult(error=f"{type(e).__name__}: {e}")
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class ParallelPDFExtractor:
+    """
+    Extracts PDF text on a process pool so large batches use every core.
+
+    Every document gets a timeout and a page cap, so one pathological PDF cannot stall
+    the batch; results always come back in input order. The pool is created lazily and
+    shared by concurrent calls until `close()` or a hung worker retires it.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: float = 30.0, max_pages: Optional[int] = 20):
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self._pool = None
+        # Callers still waiting on each pool; a retired pool is terminated once it has none
+        self._users: Dict[Any, int] = {}
+        self._pool_lock = threading.Lock()
+
+    def _acquire(self):
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn keeps workers independent of the threads in the parent (Streamlit, LangGraph)
+                self._pool = multiprocessing.get_context("spawn").Pool(self.max_workers)
+                self._users[self._pool] = 0
+            self._users[self._pool] += 1
+            return self._pool
+
+    def _release(self, pool, hung: bool = False):
+        """
+        Gives back a pool taken by `_acquire`. A hung worker retires the pool: later callers
+        get a fresh one, and the old one is terminated once the callers still using it finish.
+        """
+        with self._pool_lock:
+            if hung and pool is self._pool:
+                self._pool = None
+            self._users[pool] -= 1
+            retired = pool is not self._pool and self._users[pool] == 0
+            if retired:
+                del self._users[pool]
+        if retired:
+            pool.terminate()
+            pool.join()
+
+    def close(self):
+        """Retires the pool; it is terminated now, or as soon as the calls still using it return."""
+        with self._pool_lock:
+            self._pool = None
+            idle = [pool for pool, users in self._users.items() if users == 0]
+            for pool in idle:
+                del self._users[pool]
+        for pool in idle:
+            pool.terminate()
+            pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def extract(self, sources: List[PDFSource]) -> List[ExtractionResult]:
+        """
+        Extracts all sources in parallel.
+        Args:
+            sources (List[Union[str, bytes]]): File paths and/or PDF bytes.
+
+        Returns:
+            List[ExtractionResult]: One result per source, in the same order.
+        """
+        pool = self._acquire()
+        hung = False
+        try:
+            pending = [pool.apply_async(_extract_worker, (source, self.max_pages, self.timeout)) for source in sources]
+
+            # Workers enforce the timeout themselves; the batch deadline only covers queueing
+            # behind other documents, pool start-up and platforms without SIGALRM.
+            deadline = time.monotonic() + POOL_STARTUP_GRACE + self.timeout * (1 + len(sources) / self.max_workers)
+            results = []
+            for async_result in pending:
+                try:
+                    results.append(async_result.get(timeout=max(0.0, deadline - time.monotonic())))
+                except multiprocessing.TimeoutError:
+                    hung = True
+                    results.append(ExtractionResult(error=f"timed out after {self.timeout}s"))
+        finally:
+            # A worker stuck in native code: replace the pool rather than leak it
+            self._release(pool, hung)
+        return results
+
+    def extract_one(self, source: PDFSource) -> ExtractionResult:
+        """
+        Extracts a single document on the pool. Safe to call from several threads, which is
+        how the streaming ingest pipeline feeds documents in as they arrive.
+        """
+        pool = self._acquire()
+        hung = False
+        try:
+            async_result = pool.apply_async(_extract_worker, (source, self.max_pages, self.timeout))
+            return async_result.get(timeout=POOL_STARTUP_GRACE + self.timeout)
+        except multiprocessing.TimeoutError:
+            hung = True
+            return ExtractionResult(error=f"timed out after {self.timeout}s")
+        finally:
+            self._release(pool, hung)
+
+
+_EXTRACTORS: Dict[Tuple[int, float, Optional[int]], ParallelPDFExtractor] = {}
+_EXTRACTORS_LOCK = threading.Lock()
+
+
+def shared_extractor(max_workers: int, timeout: float = 30.0, max_pages: Optional[int] = 20) -> ParallelPDFExtractor:
+    """
+    Returns the process-wide extractor for these settings. The RAG pipelines (one per job)
+    share it, so the process keeps one pool of `max_workers` workers rather than one per
+    cached pipeline.
+    """
+    key = (max_workers, timeout, max_pages)
+    with _EXTRACTORS_LOCK:
+        if key not in _EXTRACTORS:
+            _EXTRACTORS[key] = ParallelPDFExtractor(max_workers, timeout, max_pages)
+        return _EXTRACTORS[key]
@@ -0,0 +1,510 @@
+import os
+import json
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, Field
+
+from HrAssistantAgent.tokenBudget import estimate_tokens, pack_batches
+
+
+@dataclass
+class RateLimits:
+    """
+    Client-side quota of one provider/model. `burst_seconds` is how much of the per-minute
+    rate may be spent at once; providers enforce per-minute quotas over shorter windows.
+    `burst_tokens` raises the token burst to at least that many, so the largest single
+    request (e.g. an embedding batch) doesn't have to wait for the bucket to fill.
+    """
+    requests_per_minute: float = 0      # 0 = unlimited
+    tokens_per_minute: float = 0        # 0 = unlimited
+    max_concurrency: int = 0            # 0 = unlimited
+    burst_seconds: float = 1.0
+    max_retries: int = 5
+    burst_tokens: float = 0
+
+
+# Tokens per governed embedding request; GovernedEmbeddings splits larger calls
+EMBEDDING_BATCH_TOKENS = 50000
+
+
+# "provider/model" or "provider/*" -> limits. Override with HR_RATE_LIMITS (JSON of the same shape)
+DEFAULT_RATE_LIMITS: Dict[str, RateLimits] = {
+    "cerebras/*": RateLimits(requests_per_minute=30, tokens_per_minute=60000, max_concurrency=8),
+    "openai/*": RateLimits(requests_per_minute=500, tokens_per_minute=200000, max_concurrency=16, burst_tokens=EMBEDDING_BATCH_TOKENS),
+}
+
+# Completion tokens reserved per chat call until the real usage is known
+DEFAULT_COMPLETION_TOKENS = 512
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429 or type(error).__name__ == "RateLimitError"
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Refills at `rate_per_minute * scale`, holds at most `capacity`. Reservations may run
+    the bucket into debt, which turns into a wait for the caller, so waiters queue up in
+    reservation order instead of polling.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, scale: float, now: float) -> float:
+        rate = self.rate * scale
+        self.level = min(self.capacity, self.level + (now - self.updated) * rate)
+        self.updated = now
+        self.level -= amount
+        return 0.0 if self.level >= 0 else -self.level / rate
+
+    def refund(self, amount: float):
+        self.level = min(self.capacity, self.level + amount)
+
+
+class _Lane:
+    """State of one provider/model key: buckets, concurrency slots, backoff and metrics."""
+
+    def __init__(self, key: str, limits: RateLimits):
+        self.key = key
+        self.limits = limits
+        self.requests = None
+        self.tokens = None
+        if limits.requests_per_minute:
+            rate = limits.requests_per_minute
+            self.requests = TokenBucket(rate, max(1.0, rate / 60.0 * limits.burst_seconds))
+        if limits.tokens_per_minute:
+            rate = limits.tokens_per_minute
+            self.tokens = TokenBucket(rate, max(1.0, rate / 60.0 * limits.burst_seconds, limits.burst_tokens))
+        self.scale = 1.0
+        self.paused_until = 0.0
+        self.in_flight = 0
+        self.slots = threading.Condition(threading.Lock())
+        # Async callers waiting for a slot: (their event loop, future set when one frees up)
+        self.async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self.metrics: Dict[str, float] = {
+            "requests": 0, "tokens": 0, "rate_limited": 0, "retries": 0, "failures": 0,
+            "throttle_seconds": 0.0, "queue_seconds": 0.0, "max_in_flight": 0,
+        }
+
+
+class Lease:
+    """One admitted request. Release it when the call ends (success or not)."""
+
+    def __init__(self, governor: "RateGovernor", lane: _Lane, tokens: int):
+        self.governor = governor
+        self.lane = lane
+        self.tokens = tokens
+        self.attempt = 0
+        self.released = False
+
+    def release(self, actual_tokens: Optional[int] = None):
+        if not self.released:
+            self.released = True
+            self.governor._release(self, actual_tokens)
+
+
+class RateGovernor:
+    """
+    Process-wide gate for model calls. Every call to a provider/model first takes a slot
+    (at most `max_concurrency` in flight) and then waits for its request and token
+    budgets. A 429 pauses the whole lane for the Retry-After (or an exponential
+    backoff), halves its admitted rate and retries; successes restore the rate step by
+    step (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, limits: Optional[Dict[str, RateLimits]] = None):
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self._lanes: Dict[str, _Lane] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, key: str, limits: RateLimits):
+        """Sets the limits of "provider/model" (or "provider/*"); applies to lanes created afterwards."""
+        with self._lock:
+            self.limits[key] = limits
+            for lane_key in [k for k in self._lanes if k == key or (key.endswith("/*") and k.startswith(key[:-1]))]:
+                del self._lanes[lane_key]
+
+    def _lane(self, provider: str, model: str) -> _Lane:
+        key = f"{provider}/{model}"
+        lane = self._lanes.get(key)
+        if lane is None:
+            with self._lock:
+                lane = self._lanes.get(key)
+                if lane is None:
+                    limits = self.limits.get(key) or self.limits.get(f"{provider}/*") or RateLimits()
+                    lane = self._lanes[key] = _Lane(key, limits)
+        return lane
+
+    # ------------------------
+    # Admission
+    # ------------------------
+    def _reserve(self, lane: _Lane, tokens: int) -> float:
+        """Takes the request's budget; returns how long the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, lane.paused_until - now)
+            if lane.requests is not None:
+                wait = max(wait, lane.requests.reserve(1, lane.scale, now))
+            if lane.tokens is not None:
+                wait = max(wait, lane.tokens.reserve(tokens, lane.scale, now))
+            lane.metrics["throttle_seconds"] += wait
+            return wait
+
+    def acquire(self, provider: str, model: str, tokens: int) -> Lease:
+        lane = self._lane(provider, model)
+        start = time.monotonic()
+        with lane.slots:
+            while lane.limits.max_concurrency and lane.in_flight >= lane.limits.max_concurrency:
+                lane.slots.wait()
+            lane.in_flight += 1
+            lane.metrics["max_in_flight"] = max(lane.metrics["max_in_flight"], lane.in_flight)
+        lane.metrics["queue_seconds"] += time.monotonic() - start
+        wait = self._reserve(lane, tokens)
+        if wait:
+            time.sleep(wait)
+        return Lease(self, lane, tokens)
+
+    async def aacquire(self, provider: str, model: str, tokens: int) -> Lease:
+        lane = self._lane(provider, model)
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        while True:
+            with lane.slots:
+                if not lane.limits.max_concurrency or lane.in_flight < lane.limits.max_concurrency:
+                    lane.in_flight += 1
+                    lane.metrics["max_in_flight"] = max(lane.metrics["max_in_flight"], lane.in_flight)
+                    break
+                waiter = loop.create_future()
+                lane.async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with lane.slots:
+                    if (loop, waiter) in lane.async_waiters:
+                        lane.async_waiters.remove((loop, waiter))
+                    elif not waiter.cancelled():
+                        # Woken but cancelled before taking the slot: pass the wake-up on
+                        self._wake_async_waiter(lane)
+                raise
+        lane.metrics["queue_seconds"] += time.monotonic() - start
+        wait = self._reserve(lane, tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        return Lease(self, lane, tokens)
+
+    def _release(self, lease: Lease, actual_tokens: Optional[int]):
+        lane = lease.lane
+        with self._lock:
+            lane.metrics["requests"] += 1
+            lane.metrics["tokens"] += actual_tokens if actual_tokens is not None else lease.tokens
+            if actual_tokens is not None and lane.tokens is not None and actual_tokens < lease.tokens:
+                # Hand back what the estimate over-reserved
+                lane.tokens.refund(lease.tokens - actual_tokens)
+            elif actual_tokens is not None and lane.tokens is not None:
+                lane.tokens.reserve(actual_tokens - lease.tokens, lane.scale, time.monotonic())
+        with lane.slots:
+            lane.in_flight -= 1
+            lane.slots.notify()
+            self._wake_async_waiter(lane)
+
+    @staticmethod
+    def _deliver(lane: _Lane, waiter: asyncio.Future):
+        if waiter.done():
+            # Cancelled while the wake-up was on its way: it goes to the next waiter
+            with lane.slots:
+                RateGovernor._wake_async_waiter(lane)
+        else:
+            waiter.set_result(None)
+
+    @staticmethod
+    def _wake_async_waiter(lane: _Lane):
+        """Wakes the longest-waiting async caller of the lane (called with `lane.slots` held)."""
+        while lane.async_waiters:
+            loop, waiter = lane.async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(RateGovernor._deliver, lane, waiter)
+                return
+            except RuntimeError:
+                # Its event loop is closed
+                continue
+
+    # ------------------------
+    # Outcomes
+    # ------------------------
+    def _on_success(self, lane: _Lane):
+        if lane.scale < 1.0:
+            with self._lock:
+                lane.scale = min(1.0, lane.scale + 0.05)
+
+    def _retry_delay(self, lease: Lease, error: BaseException) -> Optional[float]:
+        """Registers a failed attempt; returns how long to wait before retrying, or None to give up."""
+        lane = lease.lane
+        if not is_rate_limit_error(error) or lease.attempt >= lane.limits.max_retries:
+            with self._lock:
+                lane.metrics["failures"] += 1
+                lane.metrics["rate_limited"] += is_rate_limit_error(error)
+            return None
+        lease.attempt += 1
+        with self._lock:
+            lane.metrics["rate_limited"] += 1
+            lane.metrics["retries"] += 1
+            lane.scale = max(0.1, lane.scale / 2)
+            delay = _retry_after(error)
+            if delay is None:
+                delay = min(30.0, 0.5 * 2 ** (lease.attempt - 1)) * random.uniform(0.8, 1.2)
+            # Everyone on this lane backs off, not just the caller that saw the 429
+            lane.paused_until = max(lane.paused_until, time.monotonic() + delay)
+        # The retry needs quota again; the wait includes the pause
+        return self._reserve(lane, lease.tokens)
+
+    def call(self, provider: str, model: str, fn: Callable[[], Any], tokens: int, usage: Callable[[Any], Optional[int]] = lambda result: None) -> Any:
+        """Runs `fn()` within the provider/model limits, retrying rate-limited attempts."""
+        lease = self.acquire(provider, model, tokens)
+        try:
+            while True:
+                try:
+                    result = fn()
+                except Exception as e:
+                    delay = self._retry_delay(lease, e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+                self._on_success(lease.lane)
+                lease.release(usage(result))
+                return result
+        finally:
+            lease.release()
+
+    async def acall(self, provider: str, model: str, fn: Callable[[], Any], tokens: int, usage: Callable[[Any], Optional[int]] = lambda result: None) -> Any:
+        """Async `call`; `fn()` returns an awaitable."""
+        lease = await self.aacquire(provider, model, tokens)
+        try:
+            while True:
+                try:
+                    result = await fn()
+                except Exception as e:
+                    delay = self._retry_delay(lease, e)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+                self._on_success(lease.lane)
+                lease.release(usage(result))
+                return result
+        finally:
+            lease.release()
+
+    # ------------------------
+    # Metrics
+    # ------------------------
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                key: {**lane.metrics, "in_flight": lane.in_flight, "rate_scale": lane.scale}
+                for key, lane in self._lanes.items()
+            }
+
+    def report(self):
+        for key, m in self.metrics().items():
+            print(
+                f"🚦 {key}: {m['requests']:.0f} requests, {m['tokens']:.0f} tokens, {m['rate_limited']:.0f} rate-limited, "
+                f"{m['failures']:.0f} failed, waited {m['throttle_seconds']:.1f}s for quota and {m['queue_seconds']:.1f}s for a slot "
+                f"(max {m['max_in_flight']:.0f} in flight, rate at {m['rate_scale']:.0%})"
+            )
+
+
+def _limits_from_env() -> Optional[Dict[str, RateLimits]]:
+    raw = os.environ.get("HR_RATE_LIMITS")
+    if not raw:
+        return None
+    limits = dict(DEFAULT_RATE_LIMITS)
+    limits.update({key: RateLimits(**value) for key, value in json.loads(raw).items()})
+    return limits
+
+
+_governor: Optional[RateGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> RateGovernor:
+    """The process-wide governor shared by every model and embedding client."""
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = RateGovernor(_limits_from_env())
+    return _governor
+
+
+# ------------------------
+# LangChain adapters
+# ------------------------
+def _message_tokens(messages: List[BaseMessage]) -> int:
+    return sum(estimate_tokens(message.content if isinstance(message.content, str) else str(message.content)) for message in messages)
+
+
+def _result_tokens(result: ChatResult) -> Optional[int]:
+    usage = (result.llm_output or {}).get("token_usage") or {}
+    if usage.get("total_tokens"):
+        return int(usage["total_tokens"])
+    metadata = getattr(result.generations[0].message, "usage_metadata", None) if result.generations else None
+    return int(metadata["total_tokens"]) if metadata else None
+
+
+class GovernedChatModel(BaseChatModel):
+    """
+    Routes a chat model's calls through the governor, reporting the wrapped model's type
+    and parameters as its own. Give the cache to the wrapper (cached answers then use no
+    quota) and disable the wrapped client's own retries (`max_retries=0`) so 429s reach
+    the governor.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model: BaseChatModel
+    provider: str
+    model_name: str
+    governor: Optional[RateGovernor] = Field(default=None, exclude=True)
+    completion_tokens: int = DEFAULT_COMPLETION_TOKENS
+
+    @property
+    def _llm_type(self) -> str:
+        return self.model._llm_type
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return self.model._identifying_params
+
+    def _gov(self) -> RateGovernor:
+        return self.governor or get_governor()
+
+    def bind_tools(self, tools, **kwargs):
+        # Tools are formatted by the wrapped model and passed through to it on every call
+        return self.bind(**self.model.bind_tools(tools, **kwargs).kwargs)
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        return self._gov().call(
+            self.provider, self.model_name,
+            lambda: self.model._generate(messages, stop=stop, run_manager=run_manager, **kwargs),
+            _message_tokens(messages) + self.completion_tokens, _result_tokens,
+        )
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        return await self._gov().acall(
+            self.provider, self.model_name,
+            lambda: self.model._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs),
+            _message_tokens(messages) + self.completion_tokens, _result_tokens,
+        )
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        governor = self._gov()
+        lease = governor.acquire(self.provider, self.model_name, _message_tokens(messages) + self.completion_tokens)
+        try:
+            started = False
+            while True:
+                try:
+                    for chunk in self.model._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                        started = True
+                        yield chunk
+                    break
+                except Exception as e:
+                    # Only a stream that produced nothing yet can be retried transparently
+                    delay = None if started else governor._retry_delay(lease, e)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+            governor._on_success(lease.lane)
+        finally:
+            lease.release()
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        governor = self._gov()
+        lease = await governor.aacquire(self.provider, self.model_name, _message_tokens(messages) + self.completion_tokens)
+        try:
+            started = False
+            while True:
+                try:
+                    async for chunk in self.model._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                        started = True
+                        yield chunk
+                    break
+                except Exception as e:
+                    delay = None if started else governor._retry_delay(lease, e)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+            governor._on_success(lease.lane)
+        finally:
+            lease.release()
+
+
+class GovernedEmbeddings(Embeddings):
+    """
+    Routes an embedding client's calls through the governor. `embed_documents` is sent in
+    batches of at most `batch_tokens` (one request each), so a large ingest starts at once
+    and is paced batch by batch instead of waiting for quota for all of it.
+    """
+
+    def __init__(self, embeddings: Embeddings, provider: str, model_name: str, governor: Optional[RateGovernor] = None,
+                 batch_tokens: int = EMBEDDING_BATCH_TOKENS):
+        self.embeddings = embeddings
+        self.provider = provider
+        self.model_name = model_name
+        self.governor = governor
+        self.batch_tokens = batch_tokens
+        # CachedEmbeddings keys its cache on the model name
+        self.model = getattr(embeddings, "model", model_name)
+
+    def _gov(self) -> RateGovernor:
+        return self.governor or get_governor()
+
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        return [[texts[i] for i in batch] for batch in pack_batches(texts, self.batch_tokens)]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for batch in self._batches(texts):
+            tokens = sum(estimate_tokens(text) for text in batch)
+            vectors.extend(self._gov().call(self.provider, self.model_name, lambda: self.embeddings.embed_documents(batch), tokens))
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._gov().call(self.provider, self.model_name, lambda: self.embeddings.embed_query(text), estimate_tokens(text))
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for batch in self._batches(texts):
+            tokens = sum(estimate_tokens(text) for text in batch)
+            vectors.extend(await self._gov().acall(self.provider, self.model_name, lambda: self.embeddings.aembed_documents(batch), tokens))
+        return vectors
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self._gov().acall(self.provider, self.model_name, lambda: self.embeddings.aembed_query(text), estimate_tokens(text))
+
+
+def govern(model: BaseChatModel, provider: str, model_name: str, **kwargs) -> GovernedChatModel:
+    """Wraps `model` so its calls share the process-wide limits of provider/model_name."""
+    return GovernedChatModel(model=model, provider=provider, model_name=model_name, **kwargs)
@@ -0,0 +1,173 @@
+import os
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from HrAssistantAgent.bm25Index import tokenize
+
+
+# Words that make up the phrasing of a requirement ("5+ years of hands-on experience
+# with ...") rather than the skill itself
+REQUIREMENT_FILLER = frozenset(
+    "ability able advanced background basic bonus can closely demonstrated deep degree desired "
+    "equivalent excellent experience experienced familiarity familiar field good hands-on ideally "
+    "including knowledge least minimum must nice plus preferred proficiency proficient proven "
+    "related relevant required s skills solid strong understanding using work working year years".split()
+)
+
+
+def extract_terms(text: str) -> Set[str]:
+    """Distinct lower-cased terms of a resume (same tokenizer as the BM25 index)."""
+    return set(tokenize(text))
+
+
+def requirement_terms(requirement: str) -> List[str]:
+    """
+    Key terms of one requirement, e.g. "3+ years of experience with PyTorch and CUDA"
+    -> ["pytorch", "cuda"]. Numbers and filler words are dropped.
+    """
+    terms = []
+    for token in tokenize(requirement):
+        if token in REQUIREMENT_FILLER or token.rstrip("+").isdigit() or token in terms:
+            continue
+        terms.append(token)
+    return terms
+
+
+@dataclass
+class PrescreenResult:
+    """
+    Deterministic requirement score of one candidate: the mean share of each
+    requirement's terms found in the resume.
+    """
+    application_id: str
+    score: float
+    matched: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+
+class RequirementIndex:
+    """
+    Inverted index of resume terms used to pre-screen candidates against the structured
+    job requirements before any embedding search or LLM call.
+
+    Terms are extracted once per resume at ingest time. Scoring marks a candidates x terms
+    hit matrix from the postings and multiplies it with a terms x requirements matrix, so
+    the whole pool is scored in a few numpy operations.
+    """
+
+    def __init__(self):
+        # term -> rows of the candidates whose resume contains it
+        self.postings: Dict[str, Set[int]] = {}
+        self.application_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._terms: Dict[int, Set[str]] = {}
+        self._free_rows: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, application_id: str) -> bool:
+        return application_id in self._rows
+
+    def add(self, application_id: str, text: str):
+        """Indexes (or re-indexes) one candidate from the full resume text."""
+        self.add_terms(application_id, extract_terms(text))
+
+    def add_terms(self, application_id: str, terms: Iterable[str]):
+        self.remove(application_id)
+        row = self._free_rows.pop() if self._free_rows else len(self.application_ids)
+        if row == len(self.application_ids):
+            self.application_ids.append(application_id)
+        else:
+            self.application_ids[row] = application_id
+        self._rows[application_id] = row
+        self._terms[row] = set(terms)
+        for term in self._terms[row]:
+            self.postings.setdefault(term, set()).add(row)
+
+    def remove(self, application_id: str):
+        row = self._rows.pop(application_id, None)
+        if row is None:
+            return
+        for term in self._terms.pop(row):
+            rows = self.postings[term]
+            rows.discard(row)
+            if not rows:
+                del self.postings[term]
+        self.application_ids[row] = None
+        self._free_rows.append(row)
+
+    def score(
+        self,
+        requirements: List[str],
+        top_n: Optional[int] = None,
+        min_score: float = 0.0,
+    ) -> Optional[List[PrescreenResult]]:
+        """
+        Scores every indexed candidate against the requirements.
+        Args:
+            requirements (List[str]): Requirement strings, e.g. `JobListing.requirements`.
+            top_n (Optional[int]): Keep only the best `top_n` candidates.
+            min_score (float): Drop candidates scoring at or below this value.
+
+        Returns:
+            Optional[List[PrescreenResult]]: Best candidates first (ties broken by application
+            id, so the order is reproducible), or None when the requirements carry no usable terms.
+        """
+        parsed = [(requirement, requirement_terms(requirement)) for requirement in requirements]
+        parsed = [(requirement, terms) for requirement, terms in parsed if terms]
+        if not parsed or not self._rows:
+            return None if not parsed else []
+
+        vocabulary = sorted({term for _, terms in parsed for term in terms})
+        columns = {term: i for i, term in enumerate(vocabulary)}
+        hits = np.zeros((len(self.application_ids), len(vocabulary)), dtype=np.float32)
+        for term, column in columns.items():
+            rows = self.postings.get(term)
+            if rows:
+                hits[np.fromiter(rows, dtype=np.int64, count=len(rows)), column] = 1.0
+
+        weights = np.zeros((len(vocabulary), len(parsed)), dtype=np.float32)
+        for j, (_, terms) in enumerate(parsed):
+            for term in terms:
+                weights[columns[term], j] = 1.0 / len(terms)
+        coverage = hits @ weights
+        scores = coverage.mean(axis=1)
+
+        live = np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows))
+        live = live[scores[live] > min_score]
+        order = sorted(live.tolist(), key=lambda row: (-scores[row], self.application_ids[row]))
+        if top_n is not None:
+            order = order[:top_n]
+
+        results = []
+        for row in order:
+            met = coverage[row] >= 1.0 - 1e-6
+            results.append(PrescreenResult(
+                application_id=self.application_ids[row],
+                score=float(scores[row]),
+                matched=[requirement for (requirement, _), ok in zip(parsed, met) if ok],
+                missing=[requirement for (requirement, _), ok in zip(parsed, met) if not ok],
+            ))
+        return results
+
+    # ------------------------
+    # Persistence
+    # ------------------------
+    def save(self, path: str):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({key: sorted(self._terms[row]) for key, row in self._rows.items()}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "RequirementIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls()
+        for application_id, terms in data.items():
+            index.add_terms(application_id, terms)
+        return index
@@ -0,0 +1,252 @@
+import os
+import time
+import hashlib
+import asyncio
+import httpx
+import requests
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+
+# Status codes worth retrying: throttling and transient server/gateway errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Body bytes the async path collects before handing them to a worker thread to write
+ASYNC_WRITE_BYTES = 1024 * 1024
+
+
+def url_hash(url: str) -> str:
+    """Short stable hash of a URL, to tell apart files from URLs with the same basename."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+
+
+def part_path(file_path: str, url: str) -> str:
+    """Temporary name a download is written to before it is moved to `file_path`."""
+    return f"{file_path}.{url_hash(url)}.part"
+
+
+@dataclass
+class DownloadResult:
+    """
+    Outcome of a single resume download, including timing information.
+    """
+    url: str
+    path: Optional[str] = None
+    content: Optional[bytes] = None
+    ok: bool = False
+    status_code: Optional[int] = None
+    num_bytes: int = 0
+    elapsed: float = 0.0
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+class ResumeDownloader:
+    """
+    Downloads resumes concurrently over a shared keep-alive session.
+
+    Bodies are streamed in chunks (to disk or to memory), transient failures
+    are retried with exponential backoff and every file reports its own timing.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 30.0,
+        chunk_size: int = 64 * 1024,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+
+        # One connection pool shared by every worker thread
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------
+    # Single file
+    # ------------------------
+    def _fetch(self, url: str, file_path: Optional[str] = None) -> DownloadResult:
+        """
+        Fetches one URL, streaming the body to `file_path` or into memory.
+        Args:
+            url (str): Resume URL.
+            file_path (Optional[str]): Destination file. When None the body is kept in memory.
+
+        Returns:
+            DownloadResult: Outcome with timing and attempt count.
+        """
+        result = DownloadResult(url=url, path=file_path)
+        start = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            result.attempts = attempt + 1
+            try:
+                with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                    result.status_code = response.status_code
+                    if response.status_code == 200:
+                        result.num_bytes = self._consume(response, result, file_path)
+                        result.ok = True
+                        result.error = None
+                        break
+                    result.error = f"HTTP {response.status_code}"
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        break
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                result.error = str(e)
+            except Exception as e:
+                # Bad URL, disk full, ...: fail this resume, not the whole batch
+                result.error = f"{type(e).__name__}: {e}"
+                break
+
+            if attempt < self.max_retries:
+                time.sleep(self.backoff_factor * (2 ** attempt))
+
+        if not result.ok and file_path and os.path.exists(part_path(file_path, url)):
+            os.remove(part_path(file_path, url))
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def _consume(self, response: requests.Response, result: DownloadResult, file_path: Optional[str]) -> int:
+        num_bytes = 0
+        if file_path is None:
+            chunks = []
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                chunks.append(chunk)
+                num_bytes += len(chunk)
+            result.content = b"".join(chunks)
+            return num_bytes
+
+        # Write to a temporary name so a failed attempt never leaves a truncated PDF behind
+        temp_path = part_path(file_path, result.url)
+        with open(temp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                f.write(chunk)
+                num_bytes += len(chunk)
+        os.replace(temp_path, file_path)
+        return num_bytes
+
+    def download_to_file(self, url: str, file_path: str) -> DownloadResult:
+        return self._fetch(url, file_path)
+
+    def fetch_bytes(self, url: str) -> DownloadResult:
+        return self._fetch(url)
+
+    # ------------------------
+    # Batch
+    # ------------------------
+    def download_all(self, jobs: List[Tuple[str, str]]) -> List[DownloadResult]:
+        """
+        Downloads many files concurrently on a bounded thread pool.
+        Args:
+            jobs (List[Tuple[str, str]]): (url, file_path) pairs.
+
+        Returns:
+            List[DownloadResult]: Results in the same order as `jobs`.
+        """
+        if self.max_workers == 1 or len(jobs) <= 1:
+            return [self.download_to_file(url, path) for url, path in jobs]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda job: self.download_to_file(*job), jobs))
+
+    # ------------------------
+    # Async
+    # ------------------------
+    async def _afetch(self, client: httpx.AsyncClient, url: str, file_path: Optional[str] = None) -> DownloadResult:
+        """Async counterpart of `_fetch` (same retries, backoff and .part handling)."""
+        result = DownloadResult(url=url, path=file_path)
+        start = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            result.attempts = attempt + 1
+            try:
+                async with client.stream("GET", url) as response:
+                    result.status_code = response.status_code
+                    if response.status_code == 200:
+                        result.num_bytes = await self._aconsume(response, result, file_path)
+                        result.ok = True
+                        result.error = None
+                        break
+                    result.error = f"HTTP {response.status_code}"
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        break
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                result.error = str(e) or type(e).__name__
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+                break
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+        if not result.ok and file_path and os.path.exists(part_path(file_path, url)):
+            os.remove(part_path(file_path, url))
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    async def _aconsume(self, response: httpx.Response, result: DownloadResult, file_path: Optional[str]) -> int:
+        if file_path is None:
+            chunks = []
+            async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                chunks.append(chunk)
+            result.content = b"".join(chunks)
+            return len(result.content)
+
+        # Streamed to the .part file as it arrives; writes run in a worker thread, a few
+        # chunks at a time, so at most ~ASYNC_WRITE_BYTES of the body is held in memory
+        num_bytes = 0
+        pending: List[bytes] = []
+        pending_bytes = 0
+        temp_path = part_path(file_path, result.url)
+        f = await asyncio.to_thread(open, temp_path, "wb")
+        try:
+            async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                pending.append(chunk)
+                pending_bytes += len(chunk)
+                num_bytes += len(chunk)
+                if pending_bytes >= ASYNC_WRITE_BYTES:
+                    await asyncio.to_thread(f.write, b"".join(pending))
+                    pending, pending_bytes = [], 0
+            if pending:
+                await asyncio.to_thread(f.write, b"".join(pending))
+        finally:
+            await asyncio.to_thread(f.close)
+        os.replace(temp_path, file_path)
+        return num_bytes
+
+    async def adownload_all(self, jobs: List[Tuple[str, Optional[str]]]) -> List[DownloadResult]:
+        """
+        Downloads many files concurrently on the event loop, at most `max_workers` at a time.
+        Args:
+            jobs (List[Tuple[str, Optional[str]]]): (url, file_path) pairs; a None path keeps the body in memory.
+
+        Returns:
+            List[DownloadResult]: Results in the same order as `jobs`.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        limits = httpx.Limits(max_connections=self.max_workers, max_keepalive_connections=self.max_workers)
+
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits, follow_redirects=True) as client:
+            async def bounded(url: str, path: Optional[str]) -> DownloadResult:
+                async with semaphore:
+                    return await self._afetch(client, url, path)
+
+            return list(await asyncio.gather(*(bounded(url, path) for url, path in jobs)))
@@ -0,0 +1,136 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+from langchain.docstore.document import Document
+
+
+# Heading patterns per canonical section. A line counts as a heading when it is short
+# and matches one of these (optionally followed by a colon).
+SECTION_HEADINGS = {
+    "summary": r"(professional\s+)?(summary|profile|objective|about\s+me)",
+    "experience": r"(professional\s+|work\s+)?(experience|employment(\s+history)?|work\s+history|career\s+history)",
+    "skills": r"(technical\s+|core\s+|key\s+)?(skills|competencies|technologies|tech\s+stack)",
+    "education": r"(education|academics?|academic\s+background|qualifications)",
+    "projects": r"(personal\s+|key\s+|selected\s+)?projects",
+    "certifications": r"(certifications?|licenses?|courses)",
+    "achievements": r"(achievements|awards|honou?rs|publications)",
+}
+_HEADING_RE = {
+    section: re.compile(rf"^\s*{pattern}\s*:?\s*$", re.IGNORECASE)
+    for section, pattern in SECTION_HEADINGS.items()
+}
+
+# Relative importance of each section for the weighted_sum aggregator
+DEFAULT_SECTION_WEIGHTS = {
+    "experience": 0.35,
+    "skills": 0.3,
+    "projects": 0.15,
+    "summary": 0.1,
+    "education": 0.05,
+    "certifications": 0.05,
+    "achievements": 0.05,
+    "header": 0.0,
+}
+
+AGGREGATORS = ("max", "mean", "weighted_sum")
+
+
+def _heading_section(line: str) -> Optional[str]:
+    if len(line.split()) > 5:
+        return None
+    for section, pattern in _HEADING_RE.items():
+        if pattern.match(line):
+            return section
+    return None
+
+
+def split_resume_sections(text: str, max_chars: int = 2000) -> List[Tuple[str, str]]:
+    """
+    Splits resume text into (section, text) pairs using common headings.
+    Text before the first heading becomes the "header" section (name, contact details).
+    Sections longer than `max_chars` are split further on paragraph/line boundaries.
+    Args:
+        text (str): Full resume text.
+        max_chars (int): Upper bound for one section chunk.
+
+    Returns:
+        List[Tuple[str, str]]: Sections in document order.
+    """
+    sections: List[Tuple[str, List[str]]] = [("header", [])]
+    for line in text.splitlines():
+        section = _heading_section(line)
+        if section:
+            sections.append((section, []))
+        else:
+            sections[-1][1].append(line)
+
+    chunks = []
+    for section, lines in sections:
+        body = "\n".join(lines).strip()
+        if not body:
+            continue
+        current = ""
+        for line in body.splitlines():
+            if current and len(current) + len(line) + 1 > max_chars:
+                chunks.append((section, current))
+                current = ""
+            current = f"{current}\n{line}" if current else line
+        if current:
+            chunks.append((section, current))
+    return chunks
+
+
+def candidate_header(text: str, max_lines: int = 3) -> str:
+    """First non-empty lines of a resume, usually the name and contact details."""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return "\n".join(lines[:max_lines])
+
+
+def split_document_sections(doc: Document, max_chars: int = 2000) -> List[Document]:
+    """
+    Turns one full-resume Document into one Document per section. Metadata is copied and
+    extended with `section`, `chunk_index`, `candidate_header` and a per-chunk `doc_id`.
+    """
+    sections = split_resume_sections(doc.page_content, max_chars)
+    header_text = next((body for section, body in sections if section == "header"), doc.page_content)
+    header = candidate_header(header_text)
+    section_docs = []
+    for index, (section, body) in enumerate(sections):
+        metadata = dict(doc.metadata)
+        metadata.update({
+            "section": section,
+            "chunk_index": index,
+            "candidate_header": header,
+        })
+        if "doc_id" in doc.metadata:
+            metadata["doc_id"] = f"{doc.metadata['doc_id']}#{index}"
+        section_docs.append(Document(page_content=body, metadata=metadata))
+    return section_docs
+
+
+def aggregate_section_scores(
+    section_scores: Dict[str, List[float]],
+    aggregator: str = "max",
+    weights: Optional[Dict[str, float]] = None,
+) -> float:
+    """
+    Rolls the similarity scores of one candidate's sections up to a single score.
+    Args:
+        section_scores (Dict[str, List[float]]): Retrieved scores grouped by section.
+        aggregator (str): "max", "mean" or "weighted_sum" (best score per section times its weight).
+        weights (Optional[Dict[str, float]]): Section weights for "weighted_sum".
+
+    Returns:
+        float: The candidate score.
+    """
+    scores = [score for values in section_scores.values() for score in values]
+    if not scores:
+        return 0.0
+    if aggregator == "max":
+        return max(scores)
+    if aggregator == "mean":
+        return sum(scores) / len(scores)
+    if aggregator == "weighted_sum":
+        weights = weights or DEFAULT_SECTION_WEIGHTS
+        return sum(weights.get(section, 0.0) * max(values) for section, values in section_scores.items() if values)
+    raise ValueError(f"Unknown aggregator '{aggregator}', expected one of {AGGREGATORS}")
@@ -0,0 +1,96 @@
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SpeculativeResults:
+    """
+    Runs `compute(text)` in the background ahead of need, keyed by a hash of the text, so
+    a later `take` of the same text gets the finished (or in-flight) result instead of
+    paying for the call again. Results for texts that will never be used are dropped with
+    `discard`; at most `max_entries` are kept, oldest dropped first.
+    """
+
+    def __init__(self, compute: Callable[[str], Any], max_workers: int = 2, max_entries: int = 64, name: str = "result"):
+        self.compute = compute
+        self.max_entries = max_entries
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculative")
+        self._futures: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.counts: Counter = Counter()
+
+    def _count(self, event: str):
+        with self._lock:
+            self.counts[event] += 1
+
+    def start(self, text: str) -> str:
+        """Starts computing the result for `text` unless it already is; returns its key."""
+        key = text_key(text)
+        with self._lock:
+            if key in self._futures:
+                return key
+            print(f"⚡ Speculatively computing {self.name} {key[:8]}")
+            self._futures[key] = self._executor.submit(self.compute, text)
+            self.counts["started"] += 1
+            while len(self._futures) > self.max_entries:
+                _, oldest = self._futures.popitem(last=False)
+                oldest.cancel()
+                self.counts["evicted"] += 1
+        return key
+
+    def take(self, text: str, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        Removes and returns the result for `text`, waiting for it if it is still running
+        (never longer than computing it afresh would take). Returns None when nothing was
+        started for this exact text or the background call failed.
+        """
+        key = text_key(text)
+        with self._lock:
+            future = self._futures.pop(key, None)
+        if future is None:
+            self._count("missed")
+            return None
+        try:
+            result = future.result(timeout=timeout)
+        except Exception as e:
+            self._count("failed")
+            print(f"⚠️ Speculative {self.name} {key[:8]} failed, computing it now: {type(e).__name__}: {e}")
+            return None
+        self._count("reused")
+        print(f"⚡ Reusing speculative {self.name} {key[:8]}")
+        return result
+
+    def discard(self, text: str) -> bool:
+        """Drops the result for `text` (cancelling it if it hasn't started); True if there was one."""
+        with self._lock:
+            future = self._futures.pop(text_key(text), None)
+        if future is None:
+            return False
+        future.cancel()
+        self._count("discarded")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pending = len(self._futures)
+        return {
+            "started": self.counts["started"], "reused": self.counts["reused"], "discarded": self.counts["discarded"],
+            "missed": self.counts["missed"], "failed": self.counts["failed"], "evicted": self.counts["evicted"], "pending": pending,
+        }
+
+    def report(self):
+        s = self.stats()
+        print(
+            f"⚡ Speculative {self.name}s: {s['started']} started, {s['reused']} reused, {s['discarded']} discarded, "
+            f"{s['missed']} missed, {s['failed']} failed, {s['pending']} pending"
+        )
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
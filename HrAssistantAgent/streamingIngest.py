@@ -0,0 +1,233 @@
+import queue
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from langchain.docstore.document import Document
+from langchain_core.embeddings import Embeddings
+
+from HrAssistantAgent.resumeDownloader import ResumeDownloader
+from HrAssistantAgent.pdfExtraction import ParallelPDFExtractor, extract_pdf_text
+
+
+_DONE = object()
+
+
+@dataclass
+class IngestStats:
+    """
+    Per-stage timings of one streaming ingest run.
+    """
+    wall_time: float = 0.0
+    download_time: float = 0.0
+    parse_time: float = 0.0
+    embed_time: float = 0.0
+    downloaded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    embedded: int = 0
+    embed_batches: int = 0
+    peak_buffered: int = 0
+
+    def report(self):
+        print(
+            f"🌊 Streamed {self.embedded} documents in {self.wall_time:.2f}s "
+            f"(download {self.download_time:.2f}s, parse {self.parse_time:.2f}s, embed {self.embed_time:.2f}s of busy time; "
+            f"{self.embed_batches} embedding batches, {self.skipped} unchanged, {self.failed} failed, "
+            f"peak {self.peak_buffered} resumes buffered)"
+        )
+
+
+@dataclass
+class IngestResult:
+    documents: List[Document] = field(default_factory=list)
+    vectors: List[List[float]] = field(default_factory=list)
+    stats: IngestStats = field(default_factory=IngestStats)
+
+
+class StreamingIngestor:
+    """
+    Overlapped download -> parse -> embed pipeline connected by bounded queues.
+
+    PDFs are parsed straight from the downloaded bytes (nothing touches disk) as soon as
+    they arrive, and embeddings are requested in micro-batches while downloads continue.
+    The bounded queues apply back-pressure, so at most `queue_size` resumes per stage are
+    held in memory and the end-to-end time approaches that of the slowest stage.
+    """
+
+    def __init__(
+        self,
+        downloader: ResumeDownloader,
+        embeddings: Embeddings,
+        parse_workers: int = 2,
+        embed_batch_size: int = 16,
+        embed_flush_interval: float = 0.5,
+        queue_size: int = 32,
+        max_pages: Optional[int] = 20,
+        extractor: Optional[ParallelPDFExtractor] = None,
+        splitter: Optional[Callable[[Document], List[Document]]] = None,
+    ):
+        self.downloader = downloader
+        self.embeddings = embeddings
+        self.parse_workers = parse_workers
+        self.embed_batch_size = embed_batch_size
+        self.embed_flush_interval = embed_flush_interval
+        self.queue_size = queue_size
+        self.max_pages = max_pages
+        self.extractor = extractor
+        self.splitter = splitter
+
+    def run(
+        self,
+        items: List[Dict[str, str]],
+        make_metadata: Callable[[Dict[str, str], str], Optional[Dict]],
+    ) -> IngestResult:
+        """
+        Streams the given applications through download, parse and embed.
+        Args:
+            items (List[Dict[str, str]]): Applications with a `resume_url`.
+            make_metadata (Callable): Called with (application, content hash) once the bytes
+                arrive; returns the document metadata, or None to skip the resume.
+
+        Returns:
+            IngestResult: Documents and their vectors (in completion order) plus stage timings.
+        """
+        result = IngestResult()
+        stats = result.stats
+        lock = threading.Lock()
+        url_queue: "queue.Queue" = queue.Queue()
+        parse_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        embed_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        errors: List[BaseException] = []
+
+        for item in items:
+            url_queue.put(item)
+
+        def track_buffered():
+            buffered = parse_queue.qsize() + embed_queue.qsize()
+            if buffered > stats.peak_buffered:
+                stats.peak_buffered = buffered
+
+        def download_one(item):
+            download = self.downloader.fetch_bytes(item["resume_url"])
+            with lock:
+                stats.download_time += download.elapsed
+                if not download.ok:
+                    stats.failed += 1
+                    print(f"⚠️ Failed to download {download.url}: {download.error}")
+                    return
+                stats.downloaded += 1
+            parse_queue.put((item, download.content))
+            with lock:
+                track_buffered()
+
+        def parse_one(item, content):
+            start = time.perf_counter()
+            metadata = make_metadata(item, hashlib.sha256(content).hexdigest())
+            if metadata is None:
+                with lock:
+                    stats.skipped += 1
+                return
+            if self.extractor is not None:
+                extracted = self.extractor.extract_one(content)
+            else:
+                try:
+                    extracted = extract_pdf_text(content, self.max_pages)
+                except Exception as e:
+                    extracted = None
+                    print(f"⚠️ Could not parse {item['resume_url']}: {type(e).__name__}: {e}")
+            with lock:
+                stats.parse_time += time.perf_counter() - start
+                if extracted is None or not extracted.ok:
+                    stats.failed += 1
+                    return
+            doc = Document(page_content=extracted.text, metadata=metadata)
+            for chunk in (self.splitter(doc) if self.splitter else [doc]):
+                embed_queue.put(chunk)
+
+        def record_failure(stage: str, item, e: Exception):
+            with lock:
+                stats.failed += 1
+            print(f"⚠️ Could not {stage} {item.get('resume_url')}: {type(e).__name__}: {e}")
+
+        # A failing item is counted and skipped; a stage thread that died would leave the
+        # queues full and run() blocked
+        def download_stage():
+            while True:
+                try:
+                    item = url_queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    download_one(item)
+                except Exception as e:
+                    record_failure("download", item, e)
+
+        def parse_stage():
+            while True:
+                entry = parse_queue.get()
+                if entry is _DONE:
+                    return
+                item, content = entry
+                try:
+                    parse_one(item, content)
+                except Exception as e:
+                    record_failure("parse", item, e)
+
+        def embed_stage():
+            batch: List[Document] = []
+            done = False
+            while not done:
+                deadline = time.monotonic() + self.embed_flush_interval
+                while len(batch) < self.embed_batch_size:
+                    try:
+                        doc = embed_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    if doc is _DONE:
+                        done = True
+                        break
+                    batch.append(doc)
+                if not batch:
+                    continue
+                start = time.perf_counter()
+                try:
+                    vectors = self.embeddings.embed_documents([doc.page_content for doc in batch])
+                except BaseException as e:
+                    errors.append(e)
+                    # Keep draining so the upstream stages never block on a full queue
+                    vectors = None
+                stats.embed_time += time.perf_counter() - start
+                stats.embed_batches += 1
+                if vectors is not None:
+                    result.documents.extend(batch)
+                    result.vectors.extend(vectors)
+                    stats.embedded += len(batch)
+                batch = []
+
+        start = time.perf_counter()
+        downloaders = [threading.Thread(target=download_stage, daemon=True) for _ in range(self.downloader.max_workers)]
+        parsers = [threading.Thread(target=parse_stage, daemon=True) for _ in range(self.parse_workers)]
+        embedder = threading.Thread(target=embed_stage, daemon=True)
+        for thread in downloaders + parsers + [embedder]:
+            thread.start()
+
+        try:
+            for thread in downloaders:
+                thread.join()
+        finally:
+            for _ in parsers:
+                parse_queue.put(_DONE)
+            try:
+                for thread in parsers:
+                    thread.join()
+            finally:
+                embed_queue.put(_DONE)
+                embedder.join()
+        stats.wall_time = time.perf_counter() - start
+
+        if errors:
+            raise errors[0]
+        return result
@@ -0,0 +1,101 @@
+import re
+from collections import Counter
+from typing import Callable, List, Set
+
+# Llama/GPT tokenizers average ~4 characters of English per token; close enough for budgeting
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap, tokenizer-free estimate of the prompt tokens `text` will use."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+_SPACES = re.compile(r"[ \t\u00a0]+")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z*\"'(])")
+_NON_WORD = re.compile(r"\W+")
+# Shorter sentences ("Skills", "**Requirements:**") are kept even when repeated
+MIN_DEDUP_CHARS = 20
+# A paragraph this long that is part of another one (a cut-off copy) is dropped
+MIN_FRAGMENT_CHARS = 40
+
+
+def _key(text: str) -> str:
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def compact_text(text: str, max_tokens: int = 0) -> str:
+    """
+    Shrinks prompt input without changing its meaning: normalizes whitespace, drops
+    paragraphs and sentences that already appeared earlier in the text, cut-off copies of
+    other paragraphs and, when `max_tokens` is set, truncates what is left to that budget.
+    """
+    lines = [_SPACES.sub(" ", line).strip() for line in text.replace("\r\n", "\n").split("\n")]
+    paragraphs = _BLANK_LINES.split("\n".join(lines).strip())
+    keys = [_key(paragraph) for paragraph in paragraphs]
+    # Keys hold no newlines, so a match in the joined text lies inside a single paragraph
+    all_keys, key_counts = "\n".join(keys), Counter(keys)
+
+    seen_paragraphs: Set[str] = set()
+    seen_sentences: Set[str] = set()
+    kept = []
+    for paragraph, key in zip(paragraphs, keys):
+        if not key or key in seen_paragraphs:
+            continue
+        if len(key) >= MIN_FRAGMENT_CHARS and all_keys.count(key) > key_counts[key]:
+            continue
+        seen_paragraphs.add(key)
+        kept_lines = []
+        for line in paragraph.split("\n"):
+            sentences = []
+            for sentence in _SENTENCE_END.split(line):
+                sentence_key = _key(sentence)
+                if len(sentence_key) >= MIN_DEDUP_CHARS:
+                    if sentence_key in seen_sentences:
+                        continue
+                    seen_sentences.add(sentence_key)
+                sentences.append(sentence)
+            if sentences:
+                kept_lines.append(" ".join(sentences))
+        if kept_lines:
+            kept.append("\n".join(kept_lines))
+
+    compacted = "\n\n".join(kept)
+    return truncate_to_tokens(compacted, max_tokens) if max_tokens else compacted
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cuts `text` to roughly `max_tokens`, at a line break when one is close to the cut."""
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", int(limit * 0.9), limit)
+    return text[:cut if cut > 0 else limit]
+
+
+def pack_batches(texts: List[str], budget: int, cost: Callable[[str], int] = estimate_tokens) -> List[List[int]]:
+    """
+    Greedily packs texts, in order, into batches whose total cost stays within `budget`.
+    A text that alone exceeds the budget gets a batch of its own (callers truncate it).
+    Args:
+        texts (List[str]): Texts to pack.
+        budget (int): Token budget per batch.
+        cost (Callable[[str], int]): Token estimate of one text.
+
+    Returns:
+        List[List[int]]: Indices into `texts`, one list per batch.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for i, text in enumerate(texts):
+        tokens = cost(text)
+        if current and used + tokens > budget:
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
@@ -0,0 +1,231 @@
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from langgraph.types import Command
+
+# Workflow statuses
+QUEUED, RUNNING, PAUSED, COMPLETED, FAILED, CANCELLED = "queued", "running", "paused", "completed", "failed", "cancelled"
+
+
+def new_thread_id(position: str) -> str:
+    """A checkpoint thread id for a new requisition, e.g. "ml-engineer-3f9c2a1b"."""
+    slug = re.sub(r"[^a-z0-9]+", "-", position.lower()).strip("-")[:40] or "requisition"
+    return f"{slug}-{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class Workflow:
+    """One requisition's run of the recruiting graph, on its own checkpoint thread."""
+    thread_id: str
+    position: str
+    status: str = QUEUED
+    node: Optional[str] = None          # node it is paused at
+    interrupt: Optional[Any] = None     # what that node asks the recruiter
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    cancel_requested: bool = False
+    # A wake-up from the application wait scheduler that arrived before the workflow paused
+    pending_resume: Optional[Any] = None
+    future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return {"configurable": {"thread_id": self.thread_id}}
+
+
+class WorkflowManager:
+    """
+    Runs many requisitions through one HRRecruitingGraph concurrently. Each workflow gets
+    its own checkpoint thread id, and its steps (the start and every resume) run on a pool
+    of `max_workers` threads; the rest wait in the pool's queue. A paused workflow holds no
+    thread. The application wait scheduler's resumes go through the same pool.
+
+    `on_change(workflow)` is called whenever a workflow stops running (paused, completed,
+    failed or cancelled), e.g. to answer its interrupt. `run_config` is added to the config
+    of every step, e.g. {"callbacks": [...]}.
+    """
+
+    def __init__(self, hr_graph, max_workers: int = 8, on_change: Optional[Callable[[Workflow], Any]] = None,
+                 run_config: Optional[Dict[str, Any]] = None):
+        self.hr_graph = hr_graph
+        self.on_change = on_change
+        self.run_config = run_config or {}
+        self._workflows: Dict[str, Workflow] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow")
+        self._scheduler_resume = hr_graph.application_waits.resume
+        hr_graph.application_waits.resume = self._resume_from_scheduler
+
+    # ------------------------
+    # Operations
+    # ------------------------
+    def start(self, position: str, thread_id: Optional[str] = None, **state) -> str:
+        """
+        Queues a new requisition.
+        Args:
+            position (str): Position to recruit for.
+            thread_id (str): Checkpoint thread id; a new one is allocated if not given.
+            **state: Further initial state, e.g. application_threshhold.
+
+        Returns:
+            str: The workflow's thread id.
+        """
+        thread_id = thread_id or new_thread_id(position)
+        workflow = Workflow(thread_id=thread_id, position=position)
+        with self._lock:
+            if thread_id in self._workflows:
+                raise ValueError(f"Workflow {thread_id} already exists")
+            self._workflows[thread_id] = workflow
+            workflow.future = self._executor.submit(self._step, workflow, {"position": position, **state})
+        print(f"🗂️ Workflow {thread_id} queued for '{position}'")
+        return thread_id
+
+    def resume(self, thread_id: str, value: Any) -> Future:
+        """Answers the interrupt a workflow is paused at; its next steps are queued on the pool."""
+        with self._lock:
+            workflow = self._get(thread_id)
+            if workflow.status != PAUSED:
+                raise ValueError(f"Workflow {thread_id} is {workflow.status}, not paused")
+            # Answering the application wait by hand: take it off the scheduler first
+            if workflow.node == "wait_for_applications" and not self.hr_graph.application_waits.claim(thread_id):
+                raise ValueError(f"Workflow {thread_id} is being woken by the application wait scheduler")
+            return self._queue_resume(workflow, value)
+
+    def _queue_resume(self, workflow: Workflow, value: Any) -> Future:
+        self._set(workflow, QUEUED)
+        workflow.future = self._executor.submit(self._step, workflow, Command(resume=value))
+        return workflow.future
+
+    def cancel(self, thread_id: str) -> bool:
+        """
+        Cancels a workflow: a queued or paused one at once, a running one after its current
+        step. Returns False if it had already finished.
+        """
+        with self._lock:
+            workflow = self._get(thread_id)
+            if workflow.status in (COMPLETED, FAILED, CANCELLED):
+                return False
+            workflow.cancel_requested = True
+            if workflow.status == RUNNING:
+                return True
+            if workflow.future is not None:
+                workflow.future.cancel()
+            self._set(workflow, CANCELLED)
+        self.hr_graph.application_waits.remove(thread_id)
+        print(f"🛑 Workflow {thread_id} cancelled")
+        self._notify(workflow)
+        return True
+
+    def status(self, thread_id: str) -> Workflow:
+        with self._lock:
+            return self._get(thread_id)
+
+    def list(self, status: Optional[str] = None) -> List[Workflow]:
+        with self._lock:
+            return [w for w in self._workflows.values() if status is None or w.status == status]
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for workflow in self.list():
+            counts[workflow.status] = counts.get(workflow.status, 0) + 1
+        return counts
+
+    def wait(self, thread_id: str, timeout: Optional[float] = None) -> Workflow:
+        """Blocks until the workflow's queued steps have run; returns the workflow."""
+        while True:
+            future = self.status(thread_id).future
+            if future is not None and not future.cancelled():
+                future.result(timeout)
+            workflow = self.status(thread_id)
+            # A step may have queued another (a wake-up that arrived while it ran)
+            if workflow.future is future:
+                return workflow
+
+    def shutdown(self, wait: bool = True):
+        self.hr_graph.application_waits.resume = self._scheduler_resume
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    # ------------------------
+    # Running
+    # ------------------------
+    def _get(self, thread_id: str) -> Workflow:
+        if thread_id not in self._workflows:
+            raise KeyError(f"Unknown workflow {thread_id}")
+        return self._workflows[thread_id]
+
+    @staticmethod
+    def _set(workflow: Workflow, status: str, **changes):
+        workflow.status = status
+        for key, value in changes.items():
+            setattr(workflow, key, value)
+        workflow.updated_at = time.time()
+
+    def _step(self, workflow: Workflow, graph_input: Any):
+        with self._lock:
+            if workflow.cancel_requested:
+                return
+            self._set(workflow, RUNNING, node=None, interrupt=None)
+        try:
+            # Streamed rather than invoked, so a cancel takes effect between steps
+            config = {**self.run_config, **workflow.config}
+            for _ in self.hr_graph.graph.stream(graph_input, config=config, stream_mode="updates"):
+                if workflow.cancel_requested:
+                    break
+        except Exception as e:
+            print(f"❌ Workflow {workflow.thread_id} failed: {type(e).__name__}: {e}")
+            with self._lock:
+                self._set(workflow, FAILED, error=f"{type(e).__name__}: {e}")
+        else:
+            self._refresh(workflow)
+        if workflow.status != QUEUED:
+            self._notify(workflow)
+
+    def _refresh(self, workflow: Workflow):
+        """Sets the status of a workflow that just ran from its latest checkpoint."""
+        snapshot = self.hr_graph.graph.get_state(workflow.config)
+        interrupts = [item for task in snapshot.tasks for item in task.interrupts]
+        with self._lock:
+            if workflow.cancel_requested:
+                self._set(workflow, CANCELLED)
+            elif interrupts and workflow.pending_resume is not None and snapshot.next[0] == "wait_for_applications":
+                self._queue_resume(workflow, workflow.pending_resume)
+                workflow.pending_resume = None
+                return
+            elif interrupts:
+                self._set(workflow, PAUSED, node=snapshot.next[0], interrupt=interrupts[0].value)
+            elif snapshot.next:
+                # Stopped between steps without an interrupt (e.g. interrupt_after)
+                self._set(workflow, PAUSED, node=snapshot.next[0])
+            else:
+                self._set(workflow, COMPLETED)
+        if workflow.status == CANCELLED:
+            self.hr_graph.application_waits.remove(workflow.thread_id)
+
+    def _notify(self, workflow: Workflow):
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(workflow)
+        except Exception as e:
+            print(f"⚠️ Workflow callback failed for {workflow.thread_id}: {type(e).__name__}: {e}")
+
+    def _resume_from_scheduler(self, thread_id: str, value: Dict[str, Any]):
+        # Workflows this manager didn't start (e.g. restored after a restart) resume directly
+        with self._lock:
+            workflow = self._workflows.get(thread_id)
+            if workflow is not None:
+                if workflow.status == PAUSED and workflow.node == "wait_for_applications":
+                    return self._queue_resume(workflow, value)
+                if workflow.status in (QUEUED, RUNNING):
+                    # Woken before the step that posted the job finished; resumed once it pauses
+                    workflow.pending_resume = value
+                    return None
+                print(f"⚠️ Not waking workflow {thread_id}: it is {workflow.status}")
+                return None
+        return self._scheduler_resume(thread_id, value)
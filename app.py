@@ -1,12 +1,10 @@
 import streamlit as st
-import time
 # Assuming HrAssistantAgent is the folder name, and graphUtil is the file
 from HrAssistantAgent.graphUtil import HRRecruitingGraph 
+from HrAssistantAgent.workflowManager import new_thread_id
 from langgraph.types import Command, Interrupt # Import both Command and Interrupt
 
 # --- 1. Initialize session state variables for graph management ---
-THREAD_ID = "streamlit-hr-thread"
-
 if 'hr_graph' not in st.session_state:
     st.session_state.hr_graph = HRRecruitingGraph()
 if 'current_state' not in st.session_state:
@@ -19,6 +17,9 @@ if 'interruption_node' not in st.session_state:
     st.session_state.interruption_node = None 
 if 'interruption_message' not in st.session_state:
     st.session_state.interruption_message = None 
+# Checkpoint thread of the current requisition; every run gets its own
+if 'thread_id' not in st.session_state:
+    st.session_state.thread_id = None
 
 st.title("🤖 HR Assistant Agent Workflow")
 
@@ -65,21 +66,44 @@ def _extract_interruption_data(step: dict) -> tuple[str, str]:
     return node_name, pause_message
 
 
+def _refresh_from_graph():
+    """Picks up progress made in the background, e.g. the application wait woken by its scheduler."""
+    snapshot = st.session_state.hr_graph.graph.get_state({"configurable": {"thread_id": st.session_state.thread_id}})
+    st.session_state.current_state.update(snapshot.values)
+    interrupts = [item for task in snapshot.tasks for item in task.interrupts]
+    if interrupts:
+        st.session_state.interruption_node = snapshot.next[0]
+        st.session_state.interruption_message = interrupts[0].value
+    else:
+        st.session_state.interruption_node = None
+        st.session_state.interruption_message = None
+
+
 # --- Define the function to run the graph or resume it ---
 def run_workflow_stream(initial_input):
     """
     Runs or resumes the graph, yielding steps until completion or human intervention.
     initial_input can be a dict (for start) or a Command (for resume).
+    Yields ("token", node_name, text_so_far) while a node is generating text and
+    ("log", log_message) once a node finishes.
     """
     hr_graph_instance = st.session_state.hr_graph.graph 
-    config = {"configurable": {"thread_id": THREAD_ID}}
+    config = {"configurable": {"thread_id": st.session_state.thread_id}}
+    streamed_text = {}
     
-    # Stream the graph execution
-    for step in hr_graph_instance.stream(initial_input, config=config):
+    # Stream the graph execution: node updates plus the tokens nodes forward while generating
+    for mode, step in hr_graph_instance.stream(initial_input, config=config, stream_mode=["updates", "custom"]):
         
         if step is None:
             continue 
 
+        if mode == "custom":
+            node_name = step.get("node", "unknown_node")
+            streamed_text[node_name] = streamed_text.get(node_name, "") + step.get("token", "")
+            yield ("token", node_name, streamed_text[node_name])
+            continue
+        streamed_text.clear()
+
         # Check for interruption command in the stream output first
         if '__interrupt__' in step:
              
@@ -94,7 +118,7 @@ def run_workflow_stream(initial_input):
              log_message = f"### Node: `{node_name}`\n"
              log_message += f"⚠️ **Workflow PAUSED!** {pause_message}\n"
              st.session_state.workflow_log.append(log_message)
-             yield log_message 
+             yield ("log", log_message)
              return # Stop the generator
              
         # Normal step logging
@@ -125,7 +149,32 @@ def run_workflow_stream(initial_input):
                 log_message += f"- **{k}**: `{v_display}`\n"
 
         st.session_state.workflow_log.append(log_message)
-        yield log_message
+        yield ("log", log_message)
+
+
+def render_workflow_stream(workflow_input, status_messages):
+    """Renders tokens into a live message as they arrive and each finished node as its own message."""
+    status_placeholder = st.empty() # Create a placeholder for the status message
+    live_node, live_placeholder = None, None
+    for i, event in enumerate(run_workflow_stream(workflow_input)):
+        # Update the dynamic status on each step
+        status_placeholder.subheader(status_messages[i % len(status_messages)])
+        if event[0] == "token":
+            _, node_name, text = event
+            if node_name != live_node:
+                with st.chat_message("Agent"):
+                    live_node, live_placeholder = node_name, st.empty()
+            live_placeholder.markdown(f"### Node: `{node_name}` ✍️\n{text}")
+            continue
+
+        if live_placeholder is not None:
+            live_placeholder.empty()
+            live_node, live_placeholder = None, None
+        with st.chat_message("Agent"):
+            st.markdown(event[1])
+
+    # Clear the dynamic status placeholder after the loop finishes
+    status_placeholder.empty()
 
 
 # --- Main Run Button ---
@@ -138,29 +187,19 @@ if st.button(
     st.session_state.workflow_log = []
     st.session_state.interruption_node = None # Clear any previous pause
     st.session_state.interruption_message = None
+    st.session_state.thread_id = new_thread_id(position)
     
 
     # 🌟 NEW DYNAMIC STATUS IMPLEMENTATION 🌟
     # Define rotating messages
     status_messages = ["Workflow Log (Starting...)", "Workflow Log (Processing...)", "Workflow Log (Running...)"]
-    status_placeholder = st.empty() # Create a placeholder for the status message
     
     log_container = st.container()
     
     initial_state = {"position": position, "is_running": True}
 
     with log_container:
-        for i, step_output in enumerate(run_workflow_stream(initial_state)):
-            # Update the dynamic status on each step
-            current_status = status_messages[i % len(status_messages)]
-            status_placeholder.subheader(current_status)
-            
-            with st.chat_message("Agent"):
-                st.markdown(step_output)
-            time.sleep(0.2) 
-            
-    # Clear the dynamic status placeholder after the loop finishes
-    status_placeholder.empty()
+        render_workflow_stream(initial_state, status_messages)
             
     st.session_state.is_running = False
     st.rerun() 
@@ -191,6 +230,12 @@ if st.session_state.interruption_node:
         Submission_key = "Offer Letter"
 
     elif 'interview' in st.session_state.interruption_message:
+        shortlist = st.session_state.current_state.get('shortlisted_candidates')
+        if shortlist:
+            with st.expander(f"Review Shortlist ({len(shortlist)} candidates)", expanded=True):
+                for rank, candidate in enumerate(shortlist, start=1):
+                    st.markdown(f"**{rank}. {candidate['name']}** ({candidate['email']}) — score **{candidate['score']}**/100")
+                    st.caption(candidate['rationale'])
         candidate_data = st.session_state.current_state.get('selected_candidate_data')
         print("Candidate Data for Interview Node:", candidate_data)
         if candidate_data:
@@ -206,6 +251,14 @@ if st.session_state.interruption_node:
                     # Fallback for any other string or simple object
                     st.markdown(str(candidate_data))
         Submission_key = "Interview"
+
+    elif 'applications' in st.session_state.interruption_message:
+        st.info("Applications are counted in the background; the workflow continues on its own once enough "
+                "arrive or the deadline passes. Answer 'yes' to continue right away, 'no' to keep waiting.")
+        if st.button("🔄 Refresh"):
+            _refresh_from_graph()
+            st.rerun()
+        Submission_key = "Applications"
                 
     else:
         st.info(f"Unknown interruption node: {interruption_node}. Proceeding with 'yes/no' approval.")
@@ -218,6 +271,17 @@ if st.session_state.interruption_node:
 
     # --- 2. Resume Button Logic ---
     if st.button(f"Submit Approval for {Submission_key}"):
+        if Submission_key == "Applications":
+            if approval_decision == "no":
+                # Keep waiting; the scheduler continues the workflow
+                _refresh_from_graph()
+                st.rerun()
+            # Take the wait off the scheduler before resuming by hand, then make sure the
+            # scheduler hasn't woken the workflow already: don't answer its next question
+            claimed = st.session_state.hr_graph.application_waits.claim(st.session_state.thread_id)
+            _refresh_from_graph()
+            if not claimed or 'applications' not in str(st.session_state.interruption_message):
+                st.rerun()
         
         approval_command = Command(resume=approval_decision) 
 
@@ -229,23 +293,12 @@ if st.session_state.interruption_node:
         # 🌟 NEW DYNAMIC STATUS IMPLEMENTATION 🌟
         # Define rotating messages
         status_messages = ["Workflow Log (Resuming...)", "Workflow Log (Processing...)", "Workflow Log (Running...)"]
-        status_placeholder = st.empty() # Create a placeholder for the status message
         
         log_container = st.container()
 
         # Resume the workflow stream
         with log_container:
-            for i, step_output in enumerate(run_workflow_stream(approval_command)):
-                # Update the dynamic status on each step or a frequent interval
-                current_status = status_messages[i % len(status_messages)]
-                status_placeholder.subheader(current_status)
-                
-                with st.chat_message("Agent"):
-                    st.markdown(step_output)
-                time.sleep(0.1)
-                
-        # Clear the dynamic status placeholder after the loop finishes
-        status_placeholder.empty()
+            render_workflow_stream(approval_command, status_messages)
                 
         # Final state check after resuming
         st.session_state.is_running = False
@@ -259,6 +312,8 @@ if st.session_state.interruption_node:
 
 # --- Display Current Workflow Log ---
 st.subheader("Current Workflow Log")
+if st.session_state.thread_id:
+    st.caption(f"Requisition `{st.session_state.thread_id}`")
 for log in st.session_state.workflow_log:
     with st.chat_message("Agent"):
         st.markdown(log)
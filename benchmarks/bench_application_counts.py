@@ -0,0 +1,80 @@
+"""
+Benchmark: database load of application counting when thousands of posted jobs are polled,
+counting by fetching the application rows (the previous behaviour), with a count-only
+(head) query, and with the count-only query behind the short-lived count cache. Several
+pollers (the wait scheduler, threshold checks, UI refreshes) look at every job each round.
+Runs against an in-memory stand-in for the Supabase tables on a simulated clock.
+
+    python -m benchmarks.bench_application_counts --jobs 5000 --rounds 10 --pollers 3 --poll 2 --ttl 5
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+
+from HrAssistantAgent.graphUtil import HRRecruitingGraph
+from benchmarks.synthetic import InMemorySupabase
+
+
+class RowCountingGraph(HRRecruitingGraph):
+    """Counts applications by fetching their rows."""
+
+    def _query_application_count(self, job_id: int) -> int:
+        return len(self.get_resume_paths_by_job_id(job_id))
+
+
+def make_db(jobs: int, max_applications: int) -> InMemorySupabase:
+    rng = random.Random(0)
+    db = InMemorySupabase()
+    next_id = 0
+    for job_id in range(jobs):
+        n = rng.randint(0, max_applications)
+        db.add_applications(job_id, n, start_id=next_id)
+        next_id += n
+    return db
+
+
+def run(label: str, graph_class, ttl: float, args) -> None:
+    db = make_db(args.jobs, args.max_applications)
+    hr_graph = graph_class()
+    hr_graph.supabase = db
+    clock = [0.0]
+    hr_graph.application_counts.ttl_seconds = ttl
+    hr_graph.application_counts.clock = lambda: clock[0]
+
+    start = time.perf_counter()
+    total = 0
+    for _ in range(args.rounds):
+        for _ in range(args.pollers):
+            total += sum(hr_graph.count_applications(job_id) for job_id in range(args.jobs))
+        clock[0] += args.poll
+    elapsed = time.perf_counter() - start
+
+    cache = hr_graph.application_counts.stats()
+    print(
+        f"{label:<18} {db.queries:>7} queries {db.rows_returned:>9} rows  {db.db_seconds:7.1f}s db time  "
+        f"{elapsed:5.2f}s python  (cache hit rate {cache['hit_rate']:.0%}, checksum {total})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--max-applications", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--pollers", type=int, default=3)
+    parser.add_argument("--poll", type=float, default=2.0, help="Simulated seconds between polling rounds")
+    parser.add_argument("--ttl", type=float, default=5.0, help="Count cache TTL (seconds)")
+    args = parser.parse_args()
+
+    run("rows, no cache", RowCountingGraph, 0.0, args)
+    run("count, no cache", HRRecruitingGraph, 0.0, args)
+    run(f"count, {args.ttl:g}s cache", HRRecruitingGraph, args.ttl, args)
+
+
+if __name__ == "__main__":
+    main()
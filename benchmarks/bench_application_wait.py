@@ -0,0 +1,149 @@
+"""
+Benchmark: many posted jobs waiting for applications, with post_job sleeping for the whole
+wait (the previous behaviour, one thread pinned per requisition) versus the
+wait_for_applications interrupt woken by the scheduler. Applications arrive in a local
+in-memory stand-in for the applications table; some jobs reach the threshold early, some
+never do and are woken by the deadline.
+
+Reports the threads alive halfway through the wait and how long after its threshold was
+reached each workflow got to the threshold check.
+
+    python -m benchmarks.bench_application_wait --requisitions 50 --wait 6 --poll 0.5
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+
+from langgraph.types import Command
+
+from HrAssistantAgent.dbModels.job_model import Job
+from HrAssistantAgent.llmUtils import CerebrasUtils
+from benchmarks.bench_async_workflows import LatencyChatModel, StandInGraph
+
+
+class WaitingGraph(StandInGraph):
+    """Records when each job was posted and reached the threshold check; stops before resume review."""
+    db_latency = 0.005
+
+    def __init__(self):
+        super().__init__()
+        self.posted: Dict[int, float] = {}
+        self.checked: Dict[int, float] = {}
+
+    def _job(self, job: Job) -> Job:
+        job = super()._job(job)
+        self.posted[job.id] = time.time()
+        return job
+
+    def check_application_threshold_node(self, state):
+        self.checked[state['job'].id] = time.time()
+        return {"application_threshhold": self._application_threshold(state), "current_number_of_application": state.get('current_number_of_application')}
+
+    @staticmethod
+    def route_on_threshold(state) -> str:
+        # Stop at the shortlist approval either way instead of looping through tweak_job_post
+        return "review_resume"
+
+    def review_resume(self, state):
+        return {"resume_reviewed": True, "shortlisted_candidates": []}
+
+
+class SleepingGraph(WaitingGraph):
+    """The previous post_job: blocks its thread for the whole wait, then counts."""
+
+    def post_job(self, state, config):
+        job = self.create_job(Job.from_dict(json.loads(state['job_post_json'])), state=state)
+        time.sleep(self.APPLICATION_WAIT_SECONDS)
+        return {"job_posted": True, "status": "job_posted", "job": job, "application_deadline": time.time()}
+
+    def wait_for_applications(self, state, config):
+        return {"current_number_of_application": self.count_applications(state['job'].id)}
+
+
+def arrivals(job_id: int, wait: float, rng_seed: int = 0) -> List[float]:
+    """Offsets after posting at which the job's applications arrive; some jobs stay short of the threshold."""
+    rng = random.Random(rng_seed * 100003 + job_id)
+    return sorted(rng.uniform(0, 1.5 * wait) for _ in range(rng.randint(3, 8)))
+
+
+def feed(hr_graph: WaitingGraph, wait: float, stop: threading.Event):
+    """Adds applications to the stand-in table as their arrival times pass."""
+    delivered: Dict[int, int] = {}
+    while not stop.is_set():
+        now = time.time()
+        for job_id, posted in list(hr_graph.posted.items()):
+            due = sum(1 for offset in arrivals(job_id, wait) if posted + offset <= now)
+            if due != delivered.get(job_id, 0):
+                delivered[job_id] = due
+                hr_graph.applications[job_id] = due
+        stop.wait(0.02)
+
+
+def requisition(hr_graph: WaitingGraph, thread_id: str):
+    config = {"configurable": {"thread_id": thread_id}}
+    hr_graph.graph.invoke({"position": f"ML Engineer {thread_id}"}, config=config)
+    hr_graph.graph.invoke(Command(resume="yes"), config=config)
+
+
+def run(label: str, hr_graph: WaitingGraph, args) -> None:
+    hr_graph.cerebras_utils = CerebrasUtils(llm=LatencyChatModel(latency=0.01))
+    stop = threading.Event()
+    feeder = threading.Thread(target=feed, args=(hr_graph, args.wait, stop), daemon=True)
+    feeder.start()
+    idle = threading.active_count()
+    mid_wait = []
+    threading.Timer(args.wait / 2, lambda: mid_wait.append(threading.active_count())).start()
+
+    start = time.time()
+    # A server handling each requisition on its own worker thread
+    with ThreadPoolExecutor(max_workers=args.requisitions) as pool:
+        list(pool.map(lambda i: requisition(hr_graph, f"{label}-{i}"), range(args.requisitions)))
+    while len(hr_graph.checked) < args.requisitions and time.time() - start < args.wait * 4:
+        time.sleep(0.05)
+    elapsed = time.time() - start
+    stop.set()
+
+    threshold = hr_graph.DEFAULT_APPLICATION_THRESHOLD
+    early: List[float] = []
+    by_deadline = 0
+    for job_id, posted in hr_graph.posted.items():
+        offsets = arrivals(job_id, args.wait)
+        reached = posted + offsets[threshold - 1] if len(offsets) >= threshold else None
+        if reached is not None and reached - posted < args.wait:
+            early.append(hr_graph.checked[job_id] - reached)
+        else:
+            by_deadline += 1
+    print(
+        f"{label:<10} {len(hr_graph.checked)}/{args.requisitions} checked in {elapsed:5.1f}s, {mid_wait[0] - idle:>3} threads busy mid-wait; "
+        f"{len(early)} reached threshold, checked {statistics.mean(early):.2f}s (max {max(early):.2f}s) after; "
+        f"{by_deadline} woken by deadline"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requisitions", type=int, default=50)
+    parser.add_argument("--wait", type=float, default=6.0, help="Application wait deadline (seconds)")
+    parser.add_argument("--poll", type=float, default=0.5, help="Scheduler poll interval (seconds)")
+    args = parser.parse_args()
+
+    WaitingGraph.APPLICATION_WAIT_SECONDS = args.wait
+    os.environ["HR_APPLICATION_POLL_SECONDS"] = str(args.poll)
+    # Counts cached for less than a poll interval, so every poll sees fresh ones
+    os.environ["HR_APPLICATION_COUNT_TTL"] = str(args.poll / 2)
+    run("sleep", SleepingGraph(), args)
+    run("interrupt", WaitingGraph(), args)
+
+
+if __name__ == "__main__":
+    main()
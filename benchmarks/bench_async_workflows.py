@@ -0,0 +1,135 @@
+"""
+Benchmark: requisitions per second through the recruiting graph (JD generation, approval,
+posting data and job creation, up to the application wait), run one after another with the
+sync `invoke` versus concurrently with `ainvoke` on one event loop. The model and Supabase
+are local stand-ins with fixed latencies.
+
+    python -m benchmarks.bench_async_workflows --requisitions 20 --llm-latency 0.3 --db-latency 0.05
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.types import Command
+
+from HrAssistantAgent.dbModels.job_model import Job
+from HrAssistantAgent.graphUtil import HRRecruitingGraph
+from HrAssistantAgent.llmUtils import CerebrasUtils, JobListing
+
+LISTING = JobListing(
+    title="Senior Data Scientist", company="Cerebras Systems", type="Full-time",
+    description="Optimise inference workloads.", requirements=["Python", "PyTorch"],
+).model_dump_json()
+
+
+class LatencyChatModel(BaseChatModel):
+    """Answers every prompt with a job listing after `latency` seconds (sync or async)."""
+    latency: float = 0.3
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-fake"
+
+    def _result(self) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=LISTING))])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        return self._result()
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._result()
+
+
+class StandInGraph(HRRecruitingGraph):
+    """The recruiting graph with Supabase (jobs and application counts) replaced by a fixed-latency stand-in."""
+    db_latency = 0.05
+
+    def __init__(self):
+        super().__init__()
+        # Thread-safe job ids for workflows running concurrently
+        self._ids = itertools.count(1)
+        # job id -> applications received
+        self.applications: Dict[int, int] = {}
+
+    def _job(self, job: Job) -> Job:
+        job.id = next(self._ids)
+        return job
+
+    def create_job(self, job: Job, state) -> Job:
+        time.sleep(self.db_latency)
+        return self._job(job)
+
+    async def acreate_job(self, job: Job, state) -> Job:
+        await asyncio.sleep(self.db_latency)
+        return self._job(job)
+
+    def update_job(self, job: Job) -> Job:
+        time.sleep(self.db_latency)
+        return job
+
+    async def aupdate_job(self, job: Job) -> Job:
+        await asyncio.sleep(self.db_latency)
+        return job
+
+    def _query_application_count(self, job_id: int) -> int:
+        time.sleep(self.db_latency)
+        return self.applications.get(job_id, 0)
+
+
+def run_sync(hr_graph, thread_id):
+    config = {"configurable": {"thread_id": thread_id}}
+    hr_graph.graph.invoke({"position": f"ML Engineer {thread_id}"}, config=config)
+    result = hr_graph.graph.invoke(Command(resume="yes"), config=config, interrupt_after=["post_job"])
+    assert result["job_posted"]
+
+
+async def run_async(hr_graph, thread_id):
+    config = {"configurable": {"thread_id": thread_id}}
+    await hr_graph.graph.ainvoke({"position": f"ML Engineer {thread_id}"}, config=config)
+    result = await hr_graph.graph.ainvoke(Command(resume="yes"), config=config, interrupt_after=["post_job"])
+    assert result["job_posted"]
+
+
+async def run_all_async(hr_graph, requisitions):
+    await asyncio.gather(*(run_async(hr_graph, f"async-{i}") for i in range(requisitions)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requisitions", type=int, default=20)
+    parser.add_argument("--llm-latency", type=float, default=0.3)
+    parser.add_argument("--db-latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    StandInGraph.db_latency = args.db_latency
+    # Nothing is woken from the application wait during the run
+    StandInGraph.APPLICATION_WAIT_SECONDS = 3600
+    hr_graph = StandInGraph()
+    hr_graph.cerebras_utils = CerebrasUtils(llm=LatencyChatModel(latency=args.llm_latency))
+
+    start = time.perf_counter()
+    for i in range(args.requisitions):
+        run_sync(hr_graph, f"sync-{i}")
+    elapsed = time.perf_counter() - start
+    print(f"{'sync':<6} {args.requisitions} requisitions in {elapsed:6.2f}s ({args.requisitions / elapsed:6.2f}/s)")
+
+    start = time.perf_counter()
+    asyncio.run(run_all_async(hr_graph, args.requisitions))
+    elapsed = time.perf_counter() - start
+    print(f"{'async':<6} {args.requisitions} requisitions in {elapsed:6.2f}s ({args.requisitions / elapsed:6.2f}/s)")
+
+
+if __name__ == "__main__":
+    main()
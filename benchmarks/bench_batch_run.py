@@ -0,0 +1,85 @@
+"""
+Benchmark: the headless batch runner taking positions from a file all the way through the
+workflow (JD, posting, application wait, review, offer) with a stubbed LLM, Supabase,
+resume review and mail agent, at several parallelism levels. Positions mix approval
+policies: auto-approve, approve-after-2 JD revisions and stopping at the offer.
+
+    python -m benchmarks.bench_batch_run --positions 60 --parallelism 1,8,32 --llm-latency 0.05
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+# The stand-in applications arrive at once; the scheduler notices them on its next poll
+os.environ["HR_APPLICATION_POLL_SECONDS"] = "0.05"
+os.environ["HR_APPLICATION_COUNT_TTL"] = "0"
+
+from langchain_core.messages import AIMessage
+
+from HrAssistantAgent.batchRun import ApprovalPolicy, BatchRunner, load_positions, print_report
+from HrAssistantAgent.llmUtils import CerebrasUtils
+from benchmarks.bench_async_workflows import LatencyChatModel, StandInGraph
+
+
+class BatchGraph(StandInGraph):
+    """Stand-in graph whose jobs already have applications, with the resume review and mail agent stubbed."""
+
+    def _query_application_count(self, job_id: int) -> int:
+        return 10
+
+    def review_resume(self, state):
+        shortlist = [{"name": f"Candidate {i}", "email": f"candidate{i}@example.com", "score": 90 - i, "rationale": ""} for i in range(3)]
+        return {"resume_reviewed": True, "status": "resume_reviewed", "selected_candidate_data": None, "shortlisted_candidates": shortlist}
+
+    def gmail_agent(self, state):
+        return {"messages": [AIMessage(content="Offer email sent.")]}
+
+
+def write_positions(path: str, n: int):
+    with open(path, "w") as f:
+        for i in range(n):
+            if i % 3 == 0:
+                f.write(f"ML Engineer {i}\n")
+            elif i % 3 == 1:
+                f.write(json.dumps({"position": f"Data Scientist {i}", "policy": {"jd": "approve-after-2"}}) + "\n")
+            else:
+                f.write(json.dumps({"position": f"Platform Engineer {i}", "policy": {"offer": "stop"}}) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=60)
+    parser.add_argument("--parallelism", default="1,8,32", help="Comma-separated parallelism levels")
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--db-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    StandInGraph.db_latency = args.db_latency
+    with tempfile.TemporaryDirectory() as tmp:
+        positions_path = os.path.join(tmp, "positions.txt")
+        write_positions(positions_path, args.positions)
+        positions = load_positions(positions_path, ApprovalPolicy())
+        for parallelism in (int(p) for p in args.parallelism.split(",")):
+            out_path = os.path.join(tmp, f"results-{parallelism}.jsonl")
+            # The nodes print as they run; only the summary is of interest here
+            with contextlib.redirect_stdout(io.StringIO()):
+                hr_graph = BatchGraph()
+                hr_graph.cerebras_utils = CerebrasUtils(llm=LatencyChatModel(latency=args.llm_latency))
+                with open(out_path, "w") as out:
+                    summary = BatchRunner(hr_graph, parallelism=parallelism).run(positions, out)
+            with open(out_path) as f:
+                results = [json.loads(line) for line in f]
+            revisions = sum(r["jd_revisions"] for r in results)
+            print(f"\n--- parallelism {parallelism}: {len(results)} result lines, {revisions} JD revisions, "
+                  f"{sum(r['offer_sent'] for r in results)} offers sent ---")
+            print_report(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Micro-benchmark: per-call overhead of CerebrasUtils excluding the model call, comparing
+building the loader/prompt/chain on every call (the previous implementation) with
+the chains compiled once at construction and the memoized company context.
+
+The model is an instant stand-in; its own cost is measured separately and subtracted.
+
+    python -m benchmarks.bench_cerebras_overhead --calls 500
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+
+from langchain.prompts import ChatPromptTemplate
+from langchain_community.document_loaders import TextLoader
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.prompts import PromptTemplate
+
+from HrAssistantAgent.llmUtils import CerebrasUtils, JobListing
+from benchmarks.synthetic import SAMPLE_JD
+
+LISTING = JobListing(
+    title="Senior Data Scientist", company="Cerebras Systems", type="Full-time",
+    description="Optimise inference workloads.", requirements=["Python", "PyTorch"],
+).model_dump_json()
+
+
+def per_call_job_description(hr_tool, position):
+    """The pre-change create_job_description: loader, prompt and chain rebuilt per call."""
+    docs = TextLoader("companyinfo.txt", encoding="utf-8").load()
+    prompt = PromptTemplate.from_template(
+        "You are an HR assistant. Write a job description for the position: {position}. "
+        "Context about company can be taken from: {company_context}."
+    )
+    return (prompt | hr_tool.llm).invoke({"position": position, "company_context": docs[0].page_content}).content
+
+
+def per_call_post_listing(hr_tool, jd):
+    """The pre-change create_post_listing_data: prompt, format instructions and chain rebuilt per call."""
+    prompt = ChatPromptTemplate.from_template(
+        template="You are an HR assistant. Extract the job listing details from the following job description: {jd}\n Return the details in a structured format. \n {format_instruction}",
+        partial_variables={"format_instruction": hr_tool.JobListingParser.get_format_instructions()},
+    )
+    return (prompt | hr_tool.llm | hr_tool.JobListingParser).invoke({"jd": jd}).model_dump_json(indent=2)
+
+
+def timed(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    hr_tool = CerebrasUtils(llm=FakeListChatModel(responses=[LISTING]))
+    model_only = timed(lambda: hr_tool.llm.invoke("prompt"), args.calls)
+    print(f"model stand-in alone: {model_only:7.0f} µs/call (subtracted below)")
+
+    cases = [
+        ("create_job_description", lambda: per_call_job_description(hr_tool, "ML Engineer"),
+         lambda: hr_tool.create_job_description("ML Engineer")),
+        ("create_post_listing_data", lambda: per_call_post_listing(hr_tool, SAMPLE_JD),
+         lambda: hr_tool.create_post_listing_data(SAMPLE_JD)),
+    ]
+    for name, before, after in cases:
+        before_us = timed(before, args.calls) - model_only
+        after_us = timed(after, args.calls) - model_only
+        print(f"{name:<26} per-call overhead: rebuilt {before_us:7.0f} µs -> prebuilt {after_us:7.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
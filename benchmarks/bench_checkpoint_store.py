@@ -0,0 +1,154 @@
+"""
+Benchmark: resident memory and resume latency of the workflow checkpointer with thousands
+of workflows paused at the JD approval, each after a few JD revisions. Compares the
+in-memory saver (the previous behaviour), SQLite keeping every checkpoint and SQLite
+keeping the last K per workflow. The SQLite stores are then reopened by a fresh process
+(a restart) and the same workflows resumed from disk.
+
+Each mode runs in its own process so resident memory isn't shared between them.
+
+    python -m benchmarks.bench_checkpoint_store --threads 2000 --revisions 4 --keep-last 5
+"""
+import argparse
+import contextlib
+import gc
+import io
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.types import Command
+
+from HrAssistantAgent.llmUtils import CerebrasUtils
+from benchmarks.bench_async_workflows import LatencyChatModel, StandInGraph
+from benchmarks.synthetic import SAMPLE_JD
+
+
+class JDChatModel(LatencyChatModel):
+    """Answers every prompt with a JD of about `jd_chars` characters."""
+    jd_chars: int = 4000
+
+    def _result(self) -> ChatResult:
+        jd = (SAMPLE_JD + "\n") * (self.jd_chars // len(SAMPLE_JD) + 1)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=jd[:self.jd_chars]))])
+
+
+def rss_mb() -> float:
+    """Current resident memory (peak where /proc isn't available)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(values: List[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))]
+
+
+def make_graph(mode: str, args) -> StandInGraph:
+    if mode != "memory":
+        os.environ["HR_CHECKPOINT_PATH"] = args.db
+        os.environ["HR_CHECKPOINT_KEEP_LAST"] = str(0 if mode == "sqlite-all" else args.keep_last)
+    hr_graph = StandInGraph()
+    hr_graph.cerebras_utils = CerebrasUtils(llm=JDChatModel(latency=0, jd_chars=args.jd_chars))
+    return hr_graph
+
+
+def config(i: int):
+    return {"configurable": {"thread_id": f"requisition-{i}"}}
+
+
+def resume_latency(hr_graph: StandInGraph, args) -> str:
+    """Reads the state of, then resumes with another revision, a random sample of the paused workflows."""
+    sample = random.Random(1).sample(range(args.threads), min(args.sample, args.threads))
+    reads, resumes = [], []
+    for i in sample:
+        start = time.perf_counter()
+        hr_graph.graph.get_state(config(i))
+        reads.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        hr_graph.graph.invoke(Command(resume="no"), config=config(i))
+        resumes.append(time.perf_counter() - start)
+    return (
+        f"get_state p50 {percentile(reads, 0.5) * 1000:5.2f}ms p95 {percentile(reads, 0.95) * 1000:5.2f}ms, "
+        f"resume p50 {percentile(resumes, 0.5) * 1000:5.1f}ms p95 {percentile(resumes, 0.95) * 1000:5.1f}ms"
+    )
+
+
+def db_size_mb(path: str) -> float:
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p)) / 2**20
+
+
+def child(args) -> None:
+    """Runs one mode; `--restart` reopens an existing store instead of filling one."""
+    # The nodes print as they run; only the summary is of interest here
+    with contextlib.redirect_stdout(io.StringIO()):
+        hr_graph = make_graph(args.mode, args)
+        gc.collect()
+        baseline = rss_mb()
+        if not args.restart:
+            start = time.perf_counter()
+            for i in range(args.threads):
+                hr_graph.graph.invoke({"position": f"ML Engineer {i}"}, config=config(i))
+                for _ in range(args.revisions):
+                    hr_graph.graph.invoke(Command(resume="no"), config=config(i))
+            fill = time.perf_counter() - start
+        gc.collect()
+        resident = rss_mb() - baseline
+        latency = resume_latency(hr_graph, args)
+    label = args.mode + (" (restart)" if args.restart else "")
+    line = f"{label:<24} +{resident:7.1f} MB resident"
+    if args.mode != "memory":
+        stats = hr_graph.checkpointer.stats()
+        line += f", {db_size_mb(args.db):6.1f} MB on disk ({stats['checkpoints']} checkpoints)"
+    if not args.restart:
+        line += f", filled in {fill:5.1f}s"
+    print(f"{line}\n{'':<26}{latency}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=2000, help="Paused workflows")
+    parser.add_argument("--revisions", type=int, default=4, help="JD revisions per workflow before it pauses")
+    parser.add_argument("--keep-last", type=int, default=5, help="Checkpoints kept per workflow by the compacting store")
+    parser.add_argument("--jd-chars", type=int, default=4000)
+    parser.add_argument("--sample", type=int, default=200, help="Workflows resumed to measure latency")
+    parser.add_argument("--mode", choices=["memory", "sqlite-all", "sqlite-compact"], help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--restart", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args)
+        return
+
+    print(f"{args.threads} workflows x {args.revisions} JD revisions, {args.jd_chars}-character JDs")
+    common = [
+        "--threads", str(args.threads), "--revisions", str(args.revisions), "--keep-last", str(args.keep_last),
+        "--jd-chars", str(args.jd_chars), "--sample", str(args.sample),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ["memory", "sqlite-all", "sqlite-compact"]:
+            db = os.path.join(tmp, f"{mode}.db")
+            runs = [[]] if mode == "memory" else [[], ["--restart"]]
+            for extra in runs:
+                subprocess.run(
+                    [sys.executable, "-W", "ignore", "-m", "benchmarks.bench_checkpoint_store", "--mode", mode, "--db", db, *common, *extra],
+                    check=True,
+                )
+
+
+if __name__ == "__main__":
+    main()
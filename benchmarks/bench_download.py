@@ -0,0 +1,74 @@
+"""
+Benchmark: sequential `requests.get` downloads vs the pooled ResumeDownloader.
+
+    python -m benchmarks.bench_download --resumes 300 --latency 0.05
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+import requests
+
+from HrAssistantAgent.resumeDownloader import ResumeDownloader
+from benchmarks.synthetic import ResumeServer, make_resume_corpus
+
+
+def sequential_baseline(resume_list, out_dir):
+    """The original download loop: one fresh connection and a fully buffered body per file."""
+    for item in resume_list:
+        url = item["resume_url"]
+        response = requests.get(url)
+        if response.status_code == 200:
+            with open(os.path.join(out_dir, url.split("/")[-1]), "wb") as f:
+                f.write(response.content)
+
+
+def pooled(resume_list, out_dir, workers):
+    jobs = [(item["resume_url"], os.path.join(out_dir, item["resume_url"].split("/")[-1])) for item in resume_list]
+    with ResumeDownloader(max_workers=workers, backoff_factor=0.05) as downloader:
+        return downloader.download_all(jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05, help="Server-side latency per request (s)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--flaky-every", type=int, default=25, help="Every Nth file returns 503 once")
+    args = parser.parse_args()
+
+    corpus = make_resume_corpus(args.resumes)
+    total_kb = sum(len(b) for b in corpus.values()) / 1024
+    print(f"Corpus: {args.resumes} PDFs, {total_kb:.0f} KB, server latency {args.latency * 1000:.0f} ms")
+
+    out_dir = tempfile.mkdtemp(prefix="bench_download_")
+    try:
+        with ResumeServer(corpus, latency=args.latency) as server:
+            start = time.perf_counter()
+            sequential_baseline(server.resume_list(), out_dir)
+            baseline = time.perf_counter() - start
+            print(f"{'sequential baseline':<22} {baseline:7.2f}s")
+
+        for workers in args.workers:
+            with ResumeServer(corpus, latency=args.latency, flaky_every=args.flaky_every) as server:
+                start = time.perf_counter()
+                results = pooled(server.resume_list(), out_dir, workers)
+                elapsed = time.perf_counter() - start
+            ok = sum(r.ok for r in results)
+            retried = sum(r.attempts > 1 for r in results)
+            per_file = [r.elapsed for r in results if r.ok]
+            p95 = statistics.quantiles(per_file, n=20)[-1] if len(per_file) > 1 else 0.0
+            print(
+                f"{f'pooled x{workers}':<22} {elapsed:7.2f}s  speedup {baseline / elapsed:5.1f}x  "
+                f"ok {ok}/{len(results)}  retried {retried}  per-file p50 {statistics.median(per_file) * 1000:.0f} ms "
+                f"p95 {p95 * 1000:.0f} ms"
+            )
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: indexing throughput and top-k retrieval overlap of the local hashing
+embedding backend versus the remote one.
+
+By default the remote backend is a stand-in with a per-request delay (no network),
+so its retrieval ranking is arbitrary and only the BM25 overlap is meaningful. Pass
+`--remote openai` with OPENAI_API_KEY set to compare against the real API.
+
+    python -m benchmarks.bench_embedding_backends --resumes 2000 --k 10
+    python -m benchmarks.bench_embedding_backends --resumes 300 --remote openai
+"""
+import argparse
+import statistics
+import time
+
+from langchain_community.vectorstores import FAISS
+
+from HrAssistantAgent.bm25Index import BM25Index
+from HrAssistantAgent.embeddingBackends import make_embeddings
+from HrAssistantAgent.rateGovernor import GovernedEmbeddings
+from benchmarks.bench_embedding_cache import SlowRemoteEmbeddings
+from benchmarks.synthetic import SKILLS, TITLES, make_resume_text
+
+
+def build(embeddings, texts, ids):
+    start = time.perf_counter()
+    store = FAISS.from_embeddings(list(zip(texts, embeddings.embed_documents(texts))), embeddings, ids=ids)
+    return store, time.perf_counter() - start
+
+
+def top_ids(store, query, k):
+    return [doc.id for doc in store.similarity_search(query, k=k)]
+
+
+def overlap(a, b):
+    return len(set(a) & set(b)) / max(1, len(a))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--remote", choices=["stand-in", "openai"], default="stand-in")
+    parser.add_argument("--latency", type=float, default=0.2, help="per request, stand-in remote only")
+    args = parser.parse_args()
+
+    texts = [make_resume_text(i, pages=2) for i in range(args.resumes)]
+    ids = [f"doc-{i}" for i in range(args.resumes)]
+    queries = [
+        f"{TITLES[i % len(TITLES)]} with {SKILLS[i % len(SKILLS)]} and {SKILLS[(i * 7 + 3) % len(SKILLS)]}"
+        for i in range(20)
+    ]
+
+    if args.remote == "openai":
+        # Governed as in the pipeline: the client itself doesn't retry 429s
+        remote = make_embeddings("openai")
+        remote = GovernedEmbeddings(remote, "openai", remote.model)
+    else:
+        remote = SlowRemoteEmbeddings(size=1536, latency=args.latency)
+    local = make_embeddings("hashing", dim=args.dim)
+
+    stores = {}
+    for name, embeddings in (("remote", remote), ("hashing", local)):
+        stores[name], elapsed = build(embeddings, texts, ids)
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            top_ids(stores[name], query, args.k)
+            latencies.append(time.perf_counter() - start)
+        print(
+            f"{name:<8} index {args.resumes} resumes in {elapsed:6.2f}s ({args.resumes / elapsed:8.0f} docs/s), "
+            f"query p50 {statistics.median(latencies) * 1000:.1f} ms"
+        )
+
+    bm25 = BM25Index()
+    bm25.add_many(zip(ids, texts))
+    lexical = {query: [doc_id for doc_id, _ in bm25.search(query, k=args.k)] for query in queries}
+    for name, store in stores.items():
+        print(f"{name:<8} overlap@{args.k} with BM25: {statistics.mean(overlap(top_ids(store, q, args.k), lexical[q]) for q in queries):.0%}")
+    remote_vs_local = statistics.mean(
+        overlap(top_ids(stores["remote"], q, args.k), top_ids(stores["hashing"], q, args.k)) for q in queries
+    )
+    note = "" if args.remote == "openai" else " (stand-in remote ranking is arbitrary)"
+    print(f"hashing vs remote overlap@{args.k}: {remote_vs_local:.0%}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: re-embedding the same resumes across jobs, with and without CachedEmbeddings.
+
+    python -m benchmarks.bench_embedding_cache --resumes 500 --jobs 3
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from typing import List
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from HrAssistantAgent import embeddingCache
+from HrAssistantAgent.embeddingCache import CachedEmbeddings
+from benchmarks.synthetic import make_resume_text
+
+
+class SlowRemoteEmbeddings(DeterministicFakeEmbedding):
+    """Deterministic vectors plus a per-request delay standing in for the embeddings API."""
+    latency: float = 0.2
+    batch_size: int = 100
+    requests_made: int = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            time.sleep(self.latency)
+            self.requests_made += 1
+            vectors.extend(super().embed_documents(texts[start:start + self.batch_size]))
+        return vectors
+
+
+def run(embeddings, resumes, jobs):
+    start = time.perf_counter()
+    for job in range(jobs):
+        # Each job sees most of the same candidates plus a few new ones
+        pool = resumes[job * 10:]
+        embeddings.embed_documents(pool)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--jobs", type=int, default=3)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--max-mb", type=float, default=64)
+    args = parser.parse_args()
+
+    resumes = [make_resume_text(i, pages=2) for i in range(args.resumes + args.jobs * 10)]
+
+    remote = SlowRemoteEmbeddings(size=args.dim)
+    uncached = run(remote, resumes, args.jobs)
+    print(f"{'no cache':<12} {uncached:6.2f}s  {remote.requests_made} API requests")
+
+    cache_dir = tempfile.mkdtemp(prefix="bench_embcache_")
+    try:
+        remote = SlowRemoteEmbeddings(size=args.dim)
+        cached = CachedEmbeddings(remote, cache_dir=cache_dir, max_bytes=int(args.max_mb * 1024 * 1024))
+        elapsed = run(cached, resumes, args.jobs)
+        print(f"{'cache':<12} {elapsed:6.2f}s  {remote.requests_made} API requests")
+        cached.report()
+
+        # A fresh process re-opens the memory-mapped cache: every lookup is a hit
+        embeddingCache._STORES.clear()
+        remote = SlowRemoteEmbeddings(size=args.dim)
+        reopened = CachedEmbeddings(remote, cache_dir=cache_dir, max_bytes=int(args.max_mb * 1024 * 1024))
+        elapsed = run(reopened, resumes, 1)
+        print(f"{'reopened':<12} {elapsed:6.2f}s  {remote.requests_made} API requests")
+        reopened.report()
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: BM25 index build/query cost at tens of thousands of resumes, and how often
+hard requirements ("PyTorch", "CS-3") appear in the top-k for dense-only vs hybrid retrieval.
+
+Dense vectors come from a deterministic fake embedding, so the dense ranking here is a
+stand-in for "generic prose similarity" rather than a real embedding model.
+
+    python -m benchmarks.bench_hybrid_retrieval --resumes 20000 --k 10
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from HrAssistantAgent.bm25Index import BM25Index
+from HrAssistantAgent.llm_rag import PDFRAGPipeline
+from benchmarks.synthetic import make_resume_text
+
+QUERIES = [
+    ("PyTorch", "CS-3"),
+    ("CUDA", "Quantization"),
+    ("Kubernetes", "Go"),
+    ("Banking", "Risk Modelling"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=256)
+    args = parser.parse_args()
+
+    texts = [make_resume_text(i) for i in range(args.resumes)]
+    ids = [f"doc-{i}" for i in range(args.resumes)]
+
+    start = time.perf_counter()
+    bm25 = BM25Index()
+    bm25.add_many(zip(ids, texts))
+    print(f"BM25 build: {args.resumes} resumes in {time.perf_counter() - start:.2f}s, {len(bm25.postings)} terms")
+
+    latencies = []
+    for _ in range(20):
+        for terms in QUERIES:
+            start = time.perf_counter()
+            bm25.search(" ".join(terms) + " engineer with production experience", k=args.k)
+            latencies.append(time.perf_counter() - start)
+    print(f"BM25 query: p50 {statistics.median(latencies) * 1000:.1f} ms, max {max(latencies) * 1000:.1f} ms")
+
+    embeddings = DeterministicFakeEmbedding(size=args.dim)
+    start = time.perf_counter()
+    store = FAISS.from_embeddings(
+        list(zip(texts, embeddings.embed_documents(texts))), embeddings, ids=ids
+    )
+    print(f"FAISS build (precomputed vectors): {time.perf_counter() - start:.2f}s")
+
+    rag = PDFRAGPipeline(db_path="unused", embedding_cache_dir=None, retrieval_mode="hybrid")
+    rag.embeddings = embeddings
+    rag.vectorstore = store
+    rag.bm25 = bm25
+
+    for mode in ("similarity", "hybrid"):
+        rag.retrieval_mode = mode
+        hits, latencies = [], []
+        for terms in QUERIES:
+            query = f"Looking for an engineer with {terms[0]} and {terms[1]} in production"
+            start = time.perf_counter()
+            results = rag.search_chunks(query, k=args.k)
+            latencies.append(time.perf_counter() - start)
+            hits.append(sum(all(t.lower() in doc.page_content.lower() for t in terms) for doc, _ in results) / args.k)
+        print(
+            f"{mode:<11} requirement precision@{args.k}: {statistics.mean(hits):.0%}  "
+            f"query p50 {statistics.median(latencies) * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: re-running the same positions through CerebrasUtils with and without the
+SQLite LLM response cache. The model is a local stand-in with a fixed per-call latency.
+
+    python -m benchmarks.bench_llm_cache --positions 10 --runs 3 --latency 0.5
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+
+from HrAssistantAgent.llmCache import SQLiteLLMCache, bypass_llm_cache
+from HrAssistantAgent.llmUtils import CerebrasUtils
+from benchmarks.bench_shortlist import SlowScoringChatModel
+from benchmarks.synthetic import TITLES
+
+
+def run(hr_tool, positions, runs):
+    start = time.perf_counter()
+    calls = 0
+    for _ in range(runs):
+        for position in positions:
+            jd = hr_tool.create_job_description(position)
+            hr_tool.generate_offer_letter("Asha Arora", position, "Standard offer, USD 120k")
+            calls += 2
+    return time.perf_counter() - start, calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    positions = [f"{TITLES[i % len(TITLES)]} #{i}" for i in range(args.positions)]
+
+    uncached = CerebrasUtils(llm=SlowScoringChatModel(latency=args.latency))
+    elapsed, calls = run(uncached, positions, args.runs)
+    print(f"{'no cache':<10} {elapsed:6.2f}s for {calls} calls")
+
+    cache_dir = tempfile.mkdtemp(prefix="bench_llmcache_")
+    try:
+        cache_path = os.path.join(cache_dir, "llm_cache.sqlite")
+        cached = CerebrasUtils(llm=SlowScoringChatModel(latency=args.latency, cache=SQLiteLLMCache(cache_path)))
+        elapsed, calls = run(cached, positions, args.runs)
+        print(f"{'cache':<10} {elapsed:6.2f}s for {calls} calls")
+        cached.cache.report()
+
+        # A new process pointed at the same file starts warm
+        reopened = CerebrasUtils(llm=SlowScoringChatModel(latency=args.latency, cache=SQLiteLLMCache(cache_path)))
+        elapsed, calls = run(reopened, positions, 1)
+        print(f"{'reopened':<10} {elapsed:6.2f}s for {calls} calls")
+
+        start = time.perf_counter()
+        with bypass_llm_cache():
+            reopened.create_job_description(positions[0])
+        print(f"{'bypass':<10} {time.perf_counter() - start:6.2f}s for 1 call")
+        reopened.cache.report()
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: wall-clock time, estimated cost and output validity of a mixed CerebrasUtils
+workload (JD generation, job listing extraction, resume review) with every task on the
+large model (the previous behaviour) versus tiered routing with fallback to the large
+model on unparseable answers. Each tier is a local stand-in whose latency and price grow
+with model size and whose structured answers are occasionally unusable on small models.
+
+    python -m benchmarks.bench_model_routing --jds 20 --resumes 60 --small-failure-rate 0.1
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, List, Optional
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from HrAssistantAgent.llmUtils import CerebrasUtils, JobListing
+from HrAssistantAgent.modelRouting import DEFAULT_MODEL_TIERS, ModelRouter
+from HrAssistantAgent.tokenBudget import estimate_tokens
+from benchmarks.synthetic import SAMPLE_JD, TITLES, make_resume_text
+
+RESUME_MARKER = re.compile(r"^\[(\d+)\]\n(.+)$", re.MULTILINE)
+
+# Seconds per call and per 1k prompt / completion tokens, by tier
+LATENCY = {
+    "small": (0.05, 0.005, 0.02),
+    "medium": (0.10, 0.010, 0.05),
+    "large": (0.20, 0.020, 0.12),
+}
+
+
+class TierChatModel(BaseChatModel):
+    """Answers generation, extraction and review prompts like a model of the given tier would."""
+    tier: str
+    failure_rate: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return f"tier-fake-{self.tier}"
+
+    def _fails(self, prompt: str) -> bool:
+        digest = int(hashlib.sha1(prompt.encode()).hexdigest()[:8], 16)
+        return digest / 0xFFFFFFFF < self.failure_rate
+
+    def _answer(self, prompt: str) -> str:
+        if "could not be parsed" in prompt or self._fails(prompt):
+            return "I am not able to produce that in the requested format."
+        if "Extract the job listing" in prompt:
+            return JobListing(
+                title="Senior Data Scientist", company="Cerebras Systems", type="Full-time",
+                description="Lead the optimisation of AI inference workloads.", requirements=["Python", "PyTorch"],
+            ).model_dump_json()
+        if "Review the following resumes" in prompt:
+            reviews = [
+                {"resume": int(number), "candidate": name, "score": (int(number) * 37) % 101, "reason": "Stand-in review."}
+                for number, name in RESUME_MARKER.findall(prompt)
+            ]
+            return json.dumps({"reviews": reviews})
+        return SAMPLE_JD * 3
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        prompt = messages[-1].content
+        answer = self._answer(prompt)
+        prompt_tokens, answer_tokens = estimate_tokens(prompt), estimate_tokens(answer)
+        base, prefill, decode = LATENCY[self.tier]
+        time.sleep(base + prefill * prompt_tokens / 1000 + decode * answer_tokens / 1000)
+        usage = {"input_tokens": prompt_tokens, "output_tokens": answer_tokens, "total_tokens": prompt_tokens + answer_tokens}
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=answer, usage_metadata=usage))])
+
+
+def run(label: str, routes, args) -> None:
+    models = {
+        tier.model: TierChatModel(tier=name, failure_rate=args.small_failure_rate if name == "small" else 0.0)
+        for name, tier in DEFAULT_MODEL_TIERS.items()
+    }
+    router = ModelRouter(routes=routes, factory=lambda model: models[model])
+    hr_tool = CerebrasUtils(llm=None, cache_path="", router=router, review_concurrency=1)
+    resumes = [make_resume_text(i, pages=2) for i in range(args.resumes)]
+
+    start = time.perf_counter()
+    listings = 0
+    for i in range(args.jds):
+        jd = hr_tool.create_job_description(f"{TITLES[i % len(TITLES)]} #{i}")
+        try:
+            JobListing.model_validate_json(hr_tool.create_post_listing_data(jd + f"\nRequisition {i}"))
+            listings += 1
+        except Exception as e:
+            print(f"⚠️ listing {i} failed: {type(e).__name__}")
+    reviewed = len(hr_tool.rank_resumes(resumes, SAMPLE_JD))
+    elapsed = time.perf_counter() - start
+
+    stats = router.stats.stats()
+    cost = sum(task["cost"] for task in stats.values())
+    fallbacks = sum(task["fallbacks"] for task in stats.values())
+    print(
+        f"{label:<14} {elapsed:7.2f}s  ~${cost:.4f}  {listings}/{args.jds} listings  "
+        f"{reviewed}/{args.resumes} reviewed  {fallbacks} fallbacks"
+    )
+    for task, s in stats.items():
+        print(f"    {task:<11} {s['calls']:>3} calls  {s['mean_latency']:.2f}s mean  ~${s['cost']:.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jds", type=int, default=20)
+    parser.add_argument("--resumes", type=int, default=60)
+    parser.add_argument("--small-failure-rate", type=float, default=0.1, help="Share of unusable structured answers from the small tier")
+    args = parser.parse_args()
+
+    run("all large", {task: ["large"] for task in ("generation", "extraction", "review", "tool_calling")}, args)
+    run("tiered", None, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark: how many malformed structured answers the output repair layer recovers, over a
+corpus of broken variants of valid JobListing, CandidateSummary and CandidateAssessment
+outputs (fenced, wrapped in prose, trailing commas, truncated, Python literals, smart
+quotes, field name/type slips, unrecoverable ones).
+
+For every case it reports whether plain PydanticOutputParser, local repair alone, and local
+repair plus one correction call succeed, and the model time each approach would spend
+compared to re-running the whole node (the previous behaviour on a parse error).
+
+    python -m benchmarks.bench_output_repair --generation-latency 4 --correction-latency 0.6
+"""
+import argparse
+import json
+import os
+from collections import defaultdict
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.output_parsers import PydanticOutputParser
+
+from HrAssistantAgent.llmUtils import JobListing
+from HrAssistantAgent.llm_rag import CandidateAssessment, CandidateSummary
+from HrAssistantAgent.outputRepair import OutputRepairStats, RepairingOutputParser
+
+VALID = {
+    JobListing: {
+        "title": "Senior Data Scientist", "company": "Cerebras Systems", "type": "Full-time",
+        "description": "Lead the optimisation of AI inference workloads.",
+        "requirements": ["Python", "PyTorch", "5+ years of ML experience"],
+    },
+    CandidateSummary: {
+        "name": "Asha Arora", "email": "asha.arora@example.com",
+        "profile_summary": "ML engineer with 6 years in recommender systems and LLM serving.",
+    },
+    CandidateAssessment: {
+        "name": "Ben Brown", "email": "ben.brown@example.com", "score": 78,
+        "rationale": "Strong Python and PyTorch; no inference optimisation experience.",
+    },
+}
+
+
+class CountingCorrector(FakeListChatModel):
+    """Answers the correction call with the valid output and counts the calls."""
+    calls: int = 0
+
+    def _call(self, *args, **kwargs) -> str:
+        self.calls += 1
+        return super()._call(*args, **kwargs)
+
+
+def _pretty(data):
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _list_as_text(data):
+    broken = dict(data)
+    for key, value in broken.items():
+        if isinstance(value, list):
+            broken[key] = "\n".join(f"- {item}" for item in value)
+    return _pretty(broken)
+
+
+def _score_as_text(data):
+    broken = dict(data)
+    if "score" in broken:
+        broken["score"] = f"{broken['score']}/100"
+    return _pretty(broken)
+
+
+def _title_case_keys(data):
+    return _pretty({key.title(): value for key, value in data.items()})
+
+
+def _single_quotes(data):
+    return str(data)
+
+
+def _missing_field(data):
+    broken = dict(data)
+    broken.pop(next(iter(broken)))
+    return _pretty(broken)
+
+
+BREAKAGES = {
+    "fenced": lambda data: f"```json\n{_pretty(data)}\n```",
+    "prose": lambda data: f"Sure! Here is the structured result:\n{_pretty(data)}\nLet me know if you need changes.",
+    "trailing_comma": lambda data: _pretty(data)[:-2] + ",\n}",
+    "truncated_90": lambda data: _pretty(data)[: int(len(_pretty(data)) * 0.9)],
+    "truncated_60": lambda data: _pretty(data)[: int(len(_pretty(data)) * 0.6)],
+    "python_literals": lambda data: _pretty(data).replace('"Full-time"', "None").replace("78", "True"),
+    "smart_quotes": lambda data: _pretty(data).replace('"', "“", 1).replace('"', "”", 1),
+    "title_case_keys": _title_case_keys,
+    "list_as_text": _list_as_text,
+    "score_as_text": _score_as_text,
+    "single_quotes": _single_quotes,
+    "missing_field": _missing_field,
+}
+
+
+def plain_ok(parser, text):
+    try:
+        parser.parse(text)
+        return True
+    except OutputParserException:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--generation-latency", type=float, default=4.0, help="Model seconds to regenerate a whole answer")
+    parser.add_argument("--correction-latency", type=float, default=0.6, help="Model seconds for a short correction call")
+    args = parser.parse_args()
+
+    local_stats, corrected_stats = OutputRepairStats(), OutputRepairStats()
+    rows = defaultdict(lambda: [0, 0, 0, 0])
+    rerun_seconds = repair_seconds = 0.0
+    for model, data in VALID.items():
+        base = PydanticOutputParser(pydantic_object=model)
+        for name, breakage in BREAKAGES.items():
+            text = breakage(data)
+            row = rows[name]
+            row[0] += 1
+            row[1] += plain_ok(base, text)
+
+            local = RepairingOutputParser(parser=base, stats=local_stats)
+            try:
+                local.parse(text)
+                row[2] += 1
+            except OutputParserException:
+                pass
+
+            corrector = CountingCorrector(responses=[_pretty(data)])
+            corrected = RepairingOutputParser(parser=base, llm=corrector, stats=corrected_stats)
+            try:
+                corrected.parse(text)
+                row[3] += 1
+            except OutputParserException:
+                pass
+
+            if not plain_ok(base, text):
+                # Before: the node reran and paid the whole generation again
+                rerun_seconds += args.generation_latency
+                repair_seconds += args.correction_latency * corrector.calls
+
+    print(f"{'breakage':<17} {'cases':>5} {'plain':>6} {'local':>6} {'+correction':>12}")
+    for name, (cases, plain, local, corrected) in rows.items():
+        print(f"{name:<17} {cases:>5} {plain:>6} {local:>6} {corrected:>12}")
+
+    for label, stats in (("local only", local_stats), ("with correction", corrected_stats)):
+        summary = stats.stats()
+        print(f"{label:<16} recovered {summary['repair_rate']:.0%} of outputs, failed {summary['failure_rate']:.0%}")
+    corrected_stats.report()
+    print(f"model time for failed parses: rerun node {rerun_seconds:.1f}s -> repair {repair_seconds:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: serial PyPDFLoader parsing vs ParallelPDFExtractor at several worker counts.
+
+    python -m benchmarks.bench_pdf_extraction --resumes 200 --pages 4 --workers 1 2 4 8
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from langchain_community.document_loaders import PyPDFLoader
+
+from HrAssistantAgent.pdfExtraction import ParallelPDFExtractor
+from benchmarks.synthetic import make_resume_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--max-pages", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"CPU cores: {os.cpu_count()}")
+    corpus_dir = tempfile.mkdtemp(prefix="bench_pdf_")
+    try:
+        paths = []
+        for name, content in make_resume_corpus(args.resumes, pages=args.pages).items():
+            path = os.path.join(corpus_dir, name)
+            with open(path, "wb") as f:
+                f.write(content)
+            paths.append(path)
+
+        start = time.perf_counter()
+        serial_texts = ["\n".join(p.page_content for p in PyPDFLoader(path).load()) for path in paths]
+        serial = time.perf_counter() - start
+        print(f"{'serial PyPDFLoader':<22} {serial:6.2f}s  {len(paths) / serial:7.1f} docs/s")
+
+        for workers in args.workers:
+            with ParallelPDFExtractor(max_workers=workers, max_pages=args.max_pages) as extractor:
+                extractor.extract(paths[:workers])  # warm up the pool outside the timing
+                start = time.perf_counter()
+                results = extractor.extract(paths)
+                elapsed = time.perf_counter() - start
+            ok = sum(r.ok for r in results)
+            same_order = all(r.text.split("\n", 1)[0] == t.split("\n", 1)[0] for r, t in zip(results, serial_texts))
+            print(
+                f"{f'process pool x{workers}':<22} {elapsed:6.2f}s  {len(paths) / elapsed:7.1f} docs/s  "
+                f"speedup {serial / elapsed:4.1f}x  ok {ok}/{len(paths)}  stable order {same_order}"
+            )
+    finally:
+        shutil.rmtree(corpus_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: estimated prompt input tokens before and after compaction, and its CPU cost,
+for the kinds of text the LLM calls receive: a JD that went through a few
+change_job_description rounds (repeated and cut-off paragraphs, ragged whitespace),
+multi-page resumes with per-page boilerplate, and an oversized input hitting the budget.
+
+    python -m benchmarks.bench_prompt_compaction --rounds 3 --resumes 200 --pages 3
+"""
+import argparse
+import random
+import time
+
+from HrAssistantAgent.tokenBudget import compact_text, estimate_tokens
+from benchmarks.synthetic import SKILLS, TITLES, make_resume_text
+
+BOILERPLATE = (
+    "References available upon request.\n"
+    "This resume is confidential and intended for recruitment purposes only."
+)
+
+
+def make_jd(seed: int = 0) -> str:
+    rng = random.Random(seed)
+    title = rng.choice(TITLES)
+    skills = rng.sample(SKILLS, 8)
+    paragraphs = [
+        f"**Job Title: Senior {title}**",
+        f"**Company Overview:**\nWe build the world's fastest AI infrastructure. Our mission is to deliver unmatched speed for {title} teams.",
+        "**Key Responsibilities:**\n" + "\n".join(
+            f"{i}. **{skill}**: Design, build and operate production systems using {skill} with cross-functional teams."
+            for i, skill in enumerate(skills[:5], start=1)
+        ),
+        "**Requirements:**\n" + "\n".join(f"{i}. {skill} experience in production." for i, skill in enumerate(skills, start=1)),
+        "**What We Offer:**\nA competitive salary and benefits package, including health insurance and paid time off.",
+        f"If you are a motivated {title} looking to work on the latest AI technologies, we encourage you to apply for this exciting opportunity!",
+    ]
+    return "\n\n".join(paragraphs)
+
+
+def revise(jd: str, rng: random.Random) -> str:
+    """What a model often hands back from a revision round: repeats, cut-off copies, ragged spacing."""
+    paragraphs = jd.split("\n\n")
+    repeated = rng.choice(paragraphs)
+    cut = paragraphs[-1][: len(paragraphs[-1]) * 2 // 3]
+    ragged = [p.replace(". ", ".   ", 1) + "  " for p in paragraphs]
+    return "\n\n\n".join(ragged + [repeated, cut, paragraphs[-1]])
+
+
+def make_resume(i: int, pages: int) -> str:
+    text = make_resume_text(i, pages=pages)
+    return "\n\n".join([text] + [BOILERPLATE] * pages)
+
+
+def measure(name, texts, max_tokens=0):
+    start = time.perf_counter()
+    compacted = [compact_text(text, max_tokens) for text in texts]
+    elapsed = (time.perf_counter() - start) / len(texts) * 1e6
+    before = sum(estimate_tokens(text) for text in texts)
+    after = sum(estimate_tokens(text) for text in compacted)
+    print(f"{name:<22} {before:>9} -> {after:>9} tokens ({1 - after / before:5.1%} saved, {elapsed:7.0f} µs/text)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=3, help="change_job_description rounds applied to the JD")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--budget", type=int, default=6000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    jds = []
+    for seed in range(20):
+        jd = make_jd(seed)
+        for _ in range(args.rounds):
+            jd = revise(jd, rng)
+        jds.append(jd)
+
+    measure("clean JD", [make_jd(seed) for seed in range(20)])
+    measure(f"JD after {args.rounds} revisions", jds)
+    measure("resumes", [make_resume(i, args.pages) for i in range(args.resumes)])
+    oversized = "\n\n".join(make_resume_text(i, pages=args.pages) for i in range(100))
+    measure(f"input over {args.budget} cap", [oversized], max_tokens=args.budget)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: many concurrent workflows calling one rate-limited model, against a local
+OpenAI-compatible endpoint that enforces requests/min and tokens/min quotas (429 +
+Retry-After when exceeded). Compares calling the provider client directly (with and
+without its own retries) to routing the same client through the shared RateGovernor,
+configured with the real quota or with twice the quota (exercising the 429 backoff).
+
+    python -m benchmarks.bench_rate_governor --calls 120 --threads 24 --rpm 1200 --tpm 120000
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+
+from langchain_cerebras import ChatCerebras
+
+from HrAssistantAgent.rateGovernor import RateGovernor, RateLimits, govern
+from benchmarks.synthetic import QuotaChatServer, make_resume_text
+
+
+def run(model, prompts, threads):
+    def one(prompt):
+        try:
+            model.invoke(prompt)
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(one, prompts))
+    return time.perf_counter() - start, sum(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=120)
+    parser.add_argument("--threads", type=int, default=24, help="Concurrent workflows")
+    parser.add_argument("--rpm", type=float, default=1200)
+    parser.add_argument("--tpm", type=float, default=120000)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # ~400-token prompts, like a JD revision or posting-data extraction
+    prompts = [f"Summarise this resume in one line:\n{make_resume_text(i, pages=2)}" for i in range(args.calls)]
+    print(f"{'mode':<22} {'ok':>5} {'failed':>7} {'429s':>6} {'wall':>8}")
+    for mode in ("direct, no retries", "direct, SDK retries", "governed", "governed, limits 2x"):
+        with QuotaChatServer(args.rpm, args.tpm, latency=args.latency) as server:
+            governor = None
+            if mode == "direct, no retries":
+                model = ChatCerebras(model="llama-3.3-70b", base_url=server.base_url, max_retries=0)
+            elif mode == "direct, SDK retries":
+                model = ChatCerebras(model="llama-3.3-70b", base_url=server.base_url, max_retries=2)
+            else:
+                # "2x" configures the governor above the real quota, so it has to adapt to 429s
+                factor = 2 if mode.endswith("2x") else 1
+                governor = RateGovernor({"cerebras/*": RateLimits(args.rpm * factor, args.tpm * factor, max_concurrency=16)})
+                model = govern(
+                    ChatCerebras(model="llama-3.3-70b", base_url=server.base_url, max_retries=0),
+                    "cerebras", "llama-3.3-70b", governor=governor, completion_tokens=64,
+                )
+            elapsed, ok = run(model, prompts, args.threads)
+            print(f"{mode:<22} {ok:>5} {args.calls - ok:>7} {server.rejected:>6} {elapsed:>7.2f}s")
+            if governor is not None:
+                governor.report()
+
+
+if __name__ == "__main__":
+    main()
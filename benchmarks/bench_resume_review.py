@@ -0,0 +1,87 @@
+"""
+Benchmark: CerebrasUtils.review_resumes wall-clock time as the number of resumes and the
+worker pool grow, with all resumes stuffed into one prompt (the previous behaviour) versus
+map-reduce over token-budgeted batches. The model is a local stand-in whose latency grows
+with prompt and answer size and which rejects prompts beyond its context window.
+
+    python -m benchmarks.bench_resume_review --resumes 20 50 100 200 --concurrency 1 4 8
+"""
+import argparse
+import json
+import os
+import re
+import time
+from typing import Any, List, Optional
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from HrAssistantAgent.llmUtils import CerebrasUtils
+from HrAssistantAgent.tokenBudget import estimate_tokens
+from benchmarks.synthetic import SAMPLE_JD, make_resume_text
+
+RESUME_MARKER = re.compile(r"^\[(\d+)\]\n(.+)$", re.MULTILINE)
+
+
+class ReviewingChatModel(BaseChatModel):
+    """
+    Reviews every "[n]" resume in the prompt. Takes `base_latency` plus `prefill_latency`
+    per 1k prompt tokens plus `review_latency` per resume; fails beyond `context_tokens`.
+    """
+    base_latency: float = 0.3
+    prefill_latency: float = 0.05
+    review_latency: float = 0.04
+    context_tokens: int = 32000
+
+    @property
+    def _llm_type(self) -> str:
+        return "reviewing-fake"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        prompt = messages[-1].content
+        tokens = estimate_tokens(prompt)
+        if tokens > self.context_tokens:
+            raise ValueError(f"prompt of {tokens} tokens exceeds the {self.context_tokens}-token context window")
+        resumes = RESUME_MARKER.findall(prompt)
+        time.sleep(self.base_latency + self.prefill_latency * tokens / 1000 + self.review_latency * len(resumes))
+        reviews = [
+            {"resume": int(number), "candidate": name, "score": (int(number) * 37) % 101, "reason": "Stand-in review."}
+            for number, name in resumes
+        ]
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=json.dumps({"reviews": reviews})))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, nargs="+", default=[20, 50, 100, 200])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--batch-tokens", type=int, default=6000)
+    args = parser.parse_args()
+
+    model = ReviewingChatModel()
+    print(f"{'resumes':>8} {'mode':<16} {'wall':>8}")
+    for n in args.resumes:
+        resumes = [make_resume_text(i, pages=args.pages) for i in range(n)]
+
+        # One batch holding everything reproduces the single stuffed prompt
+        single = CerebrasUtils(llm=model, review_batch_tokens=10 ** 9)
+        start = time.perf_counter()
+        ranked = single.rank_resumes(resumes, SAMPLE_JD)
+        outcome = f"{time.perf_counter() - start:7.2f}s" if ranked else "  overflow"
+        print(f"{n:>8} {'single prompt':<16} {outcome:>8}")
+
+        for concurrency in args.concurrency:
+            hr_tool = CerebrasUtils(llm=model, review_batch_tokens=args.batch_tokens, review_concurrency=concurrency)
+            start = time.perf_counter()
+            ranked = hr_tool.rank_resumes(resumes, SAMPLE_JD)
+            elapsed = time.perf_counter() - start
+            assert len(ranked) == n, (len(ranked), n)
+            print(f"{n:>8} {f'map-reduce x{concurrency}':<16} {elapsed:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: wall-clock time of PDFRAGPipeline.shortlist() as the shortlist size and the
+LLM concurrency grow. The LLM is a local stand-in with a fixed per-call latency that
+returns a valid assessment, so only the orchestration is measured.
+
+    python -m benchmarks.bench_shortlist --resumes 500 --sizes 5 10 20 --concurrency 1 4 8
+"""
+import argparse
+import json
+import os
+import time
+import zlib
+from typing import Any, List, Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from HrAssistantAgent.embeddingBackends import HashingEmbeddings
+from HrAssistantAgent.llm_rag import PDFRAGPipeline
+from benchmarks.synthetic import SAMPLE_JD, make_resume_text
+
+
+class SlowScoringChatModel(BaseChatModel):
+    """Sleeps `latency` seconds, then returns a deterministic assessment of the prompt."""
+    latency: float = 0.5
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-scoring-fake"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        prompt = messages[-1].content
+        answer = json.dumps({
+            "name": "Candidate",
+            "email": "candidate@example.com",
+            "score": zlib.crc32(prompt.encode()) % 101,
+            "rationale": "Deterministic stand-in assessment.",
+        })
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=answer))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 20])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    texts = [make_resume_text(i) for i in range(args.resumes)]
+    embeddings = HashingEmbeddings()
+    rag = PDFRAGPipeline(db_path="unused", embedding_cache_dir=None, embedding_backend="hashing")
+    rag.vectorstore = FAISS.from_embeddings(
+        list(zip(texts, embeddings.embed_documents(texts))),
+        embeddings,
+        metadatas=[{"application_id": str(i), "email": f"candidate{i}@example.com"} for i in range(args.resumes)],
+    )
+    rag.llm = SlowScoringChatModel(latency=args.latency)
+
+    print(f"{'n':>4} {'concurrency':>12} {'wall':>8}  (LLM latency {args.latency:.2f}s per call)")
+    for n in args.sizes:
+        for concurrency in args.concurrency:
+            start = time.perf_counter()
+            shortlist = rag.shortlist(SAMPLE_JD, n=n, max_concurrency=concurrency)
+            elapsed = time.perf_counter() - start
+            assert len(shortlist) == n
+            print(f"{n:>4} {concurrency:>12} {elapsed:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
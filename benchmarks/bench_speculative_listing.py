@@ -0,0 +1,78 @@
+"""
+Benchmark: how long the recruiter waits after approving a JD until the job listing data is
+ready (resume -> create_job_posting_data done), with the extraction started only after
+approval (the previous behaviour) versus speculatively during the approve_jd interrupt.
+Also counts the model calls spent, since drafts that get rejected waste their speculative
+extraction. The model and Supabase are local stand-ins.
+
+    python -m benchmarks.bench_speculative_listing --requisitions 10 --llm-latency 1.0 --think 1.5 --reject-every 3
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import Any, List, Optional
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from langgraph.types import Command
+
+from HrAssistantAgent.llmUtils import CerebrasUtils
+from benchmarks.bench_async_workflows import LatencyChatModel, StandInGraph
+
+
+class CountingChatModel(LatencyChatModel):
+    calls: int = 0
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        self.calls += 1
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+def run(label: str, speculative: bool, args) -> None:
+    os.environ["HR_SPECULATIVE_LISTING"] = "1" if speculative else "0"
+    hr_graph = StandInGraph()
+    model = CountingChatModel(latency=args.llm_latency)
+    hr_graph.cerebras_utils = CerebrasUtils(llm=model)
+
+    waits = []
+    for i in range(args.requisitions):
+        config = {"configurable": {"thread_id": f"{label}-{i}"}}
+        hr_graph.graph.invoke({"position": f"ML Engineer {i}"}, config=config)
+        if args.reject_every and i % args.reject_every == 0:
+            time.sleep(args.think)
+            hr_graph.graph.invoke(Command(resume="no"), config=config)
+        time.sleep(args.think)
+        start = time.perf_counter()
+        result = hr_graph.graph.invoke(Command(resume="yes"), config=config, interrupt_before=["post_job"])
+        waits.append(time.perf_counter() - start)
+        assert result["job_post_json"]
+
+    print(
+        f"{label:<12} wait after approval: mean {statistics.mean(waits):.2f}s, max {max(waits):.2f}s; "
+        f"{model.calls} model calls for {args.requisitions} requisitions"
+    )
+    if hr_graph.listing_speculation:
+        hr_graph.listing_speculation.report()
+        hr_graph.listing_speculation.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requisitions", type=int, default=10)
+    parser.add_argument("--llm-latency", type=float, default=1.0)
+    parser.add_argument("--think", type=float, default=1.5, help="Seconds the recruiter takes to review a draft")
+    parser.add_argument("--reject-every", type=int, default=3, help="Reject the first draft of every n-th requisition (0 = never)")
+    args = parser.parse_args()
+
+    StandInGraph.APPLICATION_WAIT_SECONDS = 0
+    run("on approval", False, args)
+    run("speculative", True, args)
+
+
+if __name__ == "__main__":
+    main()
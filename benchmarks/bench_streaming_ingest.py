@@ -0,0 +1,70 @@
+"""
+Benchmark: three-phase ingest (download all -> parse all -> embed all) vs the
+overlapped streaming pipeline, against a local resume server and a slow fake
+embeddings endpoint.
+
+    python -m benchmarks.bench_streaming_ingest --resumes 300 --latency 0.05 --embed-latency 0.2
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+# The pipeline builds OpenAI clients on construction; the benchmark swaps in fake embeddings
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from HrAssistantAgent.llm_rag import PDFRAGPipeline
+from benchmarks.bench_embedding_cache import SlowRemoteEmbeddings
+from benchmarks.synthetic import ResumeServer, make_resume_corpus
+
+
+def run(streaming, corpus, args, workdir, trace_memory=False):
+    rag = PDFRAGPipeline(
+        db_path=os.path.join(workdir, f"db_{streaming}_{trace_memory}"),
+        download_dir=os.path.join(workdir, "resumes"),
+        embedding_cache_dir=None,
+        streaming_ingest=streaming,
+    )
+    rag.embeddings = SlowRemoteEmbeddings(size=256, latency=args.embed_latency, batch_size=16)
+    with ResumeServer(corpus, latency=args.latency) as server:
+        applications = [dict(id=i, **item) for i, item in enumerate(server.resume_list())]
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        added = rag.update_index(applications)
+        elapsed = time.perf_counter() - start
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return added, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.05, help="Server latency per resume (s)")
+    parser.add_argument("--embed-latency", type=float, default=0.2, help="Embedding API latency per batch of 16 (s)")
+    args = parser.parse_args()
+
+    corpus = make_resume_corpus(args.resumes, pages=args.pages)
+    workdir = tempfile.mkdtemp(prefix="bench_stream_")
+    try:
+        rows = []
+        for streaming in (False, True):
+            added, elapsed, _ = run(streaming, corpus, args, workdir)
+            # tracemalloc slows everything down, so memory is measured in a separate pass
+            _, _, peak = run(streaming, corpus, args, workdir, trace_memory=True)
+            rows.append((("streaming" if streaming else "three-phase"), added, elapsed, peak))
+        print()
+        for label, added, elapsed, peak in rows:
+            print(f"{label:<12} {added} resumes  {elapsed:6.2f}s  peak traced memory {peak / 1024 / 1024:6.1f} MB")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
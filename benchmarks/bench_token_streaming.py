@@ -0,0 +1,83 @@
+"""
+Benchmark: recruiter-visible time-to-first-token for JD generation through the graph,
+blocking (`invoke`, text shown once the node finishes) versus streamed (`stream_mode`
+"custom", tokens forwarded by the node as they arrive). The model is a local stand-in
+with a fixed time to first token and per-token delay.
+
+    python -m benchmarks.bench_token_streaming --tokens 400 --first-token 0.3 --token-latency 0.01
+"""
+import argparse
+import os
+import time
+from typing import Any, Iterator, List, Optional
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from HrAssistantAgent.graphUtil import HRRecruitingGraph
+from HrAssistantAgent.llmUtils import CerebrasUtils
+
+
+class SlowStreamingChatModel(BaseChatModel):
+    """Emits `tokens` words after `first_token` seconds, one every `token_latency` seconds."""
+    tokens: int = 400
+    first_token: float = 0.3
+    token_latency: float = 0.01
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-streaming-fake"
+
+    def _words(self) -> List[str]:
+        return [f"word{i} " for i in range(self.tokens)]
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        time.sleep(self.first_token + self.tokens * self.token_latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(self._words())))])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self.first_token)
+        for word in self._words():
+            time.sleep(self.token_latency)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word))
+
+
+def first_jd_text(hr_graph, thread_id, stream_mode):
+    """Seconds until the first JD text reaches the consumer, and until make_jd completes."""
+    config = {"configurable": {"thread_id": thread_id}}
+    start = time.perf_counter()
+    first = None
+    for mode, chunk in hr_graph.graph.stream({"position": "ML Engineer"}, config=config, stream_mode=stream_mode):
+        if mode == "custom" and first is None:
+            first = time.perf_counter() - start
+        if mode == "updates" and "make_jd" in chunk:
+            done = time.perf_counter() - start
+            return (first if first is not None else done), done
+    raise RuntimeError("make_jd did not run")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=400)
+    parser.add_argument("--first-token", type=float, default=0.3)
+    parser.add_argument("--token-latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    hr_graph = HRRecruitingGraph()
+    hr_graph.cerebras_utils = CerebrasUtils(llm=SlowStreamingChatModel(
+        tokens=args.tokens, first_token=args.first_token, token_latency=args.token_latency
+    ))
+
+    ttft, done = first_jd_text(hr_graph, "bench-blocking", ["updates"])
+    print(f"{'blocking':<9} first JD text after {ttft:5.2f}s (node finished {done:5.2f}s)")
+    ttft, done = first_jd_text(hr_graph, "bench-streamed", ["updates", "custom"])
+    print(f"{'streamed':<9} first JD text after {ttft:5.2f}s (node finished {done:5.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
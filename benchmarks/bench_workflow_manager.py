@@ -0,0 +1,122 @@
+"""
+Load test: hundreds of requisitions run concurrently by the WorkflowManager, each on its own
+checkpoint thread, with a stubbed LLM and Supabase. An auto-approving recruiter asks for
+`--revisions` JD revisions, then approves; a workflow is done once its job is posted and
+it waits for applications. Every `--cancel-every`th workflow is cancelled right after it
+is queued.
+
+Compares pool sizes (1 worker is one workflow at a time, as with the single shared
+thread), reports throughput and per-workflow latency, and checks that no workflow saw
+another's state.
+
+    python -m benchmarks.bench_workflow_manager --workflows 300 --workers 1,16,64,256 --llm-latency 0.05
+"""
+import argparse
+import contextlib
+import io
+import os
+import threading
+import time
+from typing import Dict, List
+
+os.environ.setdefault("CEREBRAS_API_KEY", "csk-benchmark")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["HR_LLM_CACHE_PATH"] = ""
+
+from HrAssistantAgent.llmUtils import CerebrasUtils
+from HrAssistantAgent.workflowManager import CANCELLED, COMPLETED, FAILED, PAUSED, Workflow, WorkflowManager
+from benchmarks.bench_async_workflows import LatencyChatModel, StandInGraph
+
+
+def percentile(values: List[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))]
+
+
+class AutoRecruiter:
+    """Answers every workflow's interrupts as soon as it pauses."""
+
+    def __init__(self, total: int, revisions: int):
+        self.manager: WorkflowManager = None
+        self.revisions = revisions
+        self.total = total
+        self.asked: Dict[str, int] = {}
+        self.finished: Dict[str, float] = {}
+        self.all_finished = threading.Event()
+        self._lock = threading.Lock()
+
+    def on_change(self, workflow: Workflow):
+        if workflow.status == PAUSED and workflow.node == "approve_jd":
+            asked = self.asked.get(workflow.thread_id, 0)
+            self.asked[workflow.thread_id] = asked + 1
+            self.manager.resume(workflow.thread_id, "no" if asked < self.revisions else "yes")
+            return
+        if workflow.status in (PAUSED, COMPLETED, FAILED, CANCELLED):
+            with self._lock:
+                self.finished.setdefault(workflow.thread_id, time.perf_counter())
+                if len(self.finished) == self.total:
+                    self.all_finished.set()
+
+
+def run(workers: int, args) -> None:
+    hr_graph = StandInGraph()
+    hr_graph.cerebras_utils = CerebrasUtils(llm=LatencyChatModel(latency=args.llm_latency))
+    recruiter = AutoRecruiter(args.workflows, args.revisions)
+    manager = WorkflowManager(hr_graph, max_workers=workers, on_change=recruiter.on_change)
+    recruiter.manager = manager
+
+    started: Dict[str, float] = {}
+    positions: Dict[str, str] = {}
+    # The nodes print as they run; only the summary is of interest here
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for i in range(args.workflows):
+            position = f"ML Engineer {i}"
+            thread_id = manager.start(position)
+            started[thread_id], positions[thread_id] = time.perf_counter(), position
+            if args.cancel_every and i % args.cancel_every == 0:
+                manager.cancel(thread_id)
+        recruiter.all_finished.wait()
+        elapsed = time.perf_counter() - start
+        manager.shutdown()
+        hr_graph.application_waits.stop()
+
+    counts = manager.counts()
+    waiting = [w for w in manager.list(PAUSED) if w.node == "wait_for_applications"]
+    latencies = [recruiter.finished[w.thread_id] - started[w.thread_id] for w in waiting]
+    # Isolation: each workflow's checkpoint holds its own position and a job of its own
+    crossed, job_ids = 0, set()
+    for workflow in waiting:
+        values = hr_graph.graph.get_state(workflow.config).values
+        crossed += values["position"] != positions[workflow.thread_id]
+        job_ids.add(values["job"].id)
+    cancelled_posted = sum(
+        1 for w in manager.list(CANCELLED) if hr_graph.graph.get_state(w.config).values.get("job") is not None
+    )
+    print(
+        f"{workers:>4} workers  {len(waiting)} posted in {elapsed:6.2f}s ({len(waiting) / elapsed:6.1f}/s)  "
+        f"latency p50 {percentile(latencies, 0.5):5.2f}s p95 {percentile(latencies, 0.95):5.2f}s  "
+        f"{counts.get(CANCELLED, 0)} cancelled ({cancelled_posted} posted anyway), {counts.get(FAILED, 0)} failed, "
+        f"{crossed} crossed states, {len(waiting) - len(job_ids)} shared jobs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workflows", type=int, default=300)
+    parser.add_argument("--workers", default="1,16,64,256", help="Comma-separated pool sizes")
+    parser.add_argument("--revisions", type=int, default=1, help="JD revisions asked for before approving")
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--db-latency", type=float, default=0.02)
+    parser.add_argument("--cancel-every", type=int, default=10, help="Cancel every Nth workflow (0: none)")
+    args = parser.parse_args()
+
+    StandInGraph.db_latency = args.db_latency
+    # Nothing is woken from the application wait during the run
+    StandInGraph.APPLICATION_WAIT_SECONDS = 3600
+    print(f"{args.workflows} workflows, {args.revisions} JD revision(s) each, {args.llm_latency}s LLM, {args.db_latency}s DB")
+    for workers in (int(w) for w in args.workers.split(",")):
+        run(workers, args)
+
+
+if __name__ == "__main__":
+    main()
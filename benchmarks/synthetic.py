@@ -0,0 +1,340 @@
+"""
+Synthetic data shared by the benchmark scripts: resume PDFs, JDs, a local
+HTTP stand-in for the Supabase storage bucket, an in-memory stand-in for the
+Supabase tables and a quota-enforcing chat endpoint.
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+SKILLS = [
+    "Python", "PyTorch", "TensorFlow", "C++", "CUDA", "Kubernetes", "Docker", "SQL",
+    "Spark", "LangChain", "Hugging Face", "Java", "Go", "Rust", "AWS", "GCP",
+    "React", "Angular", "TypeScript", "Quantization", "Compilers", "MLOps",
+    "Banking", "Risk Modelling", "Excel", "Recruiting", "Payroll", "CS-3",
+]
+TITLES = [
+    "Software Engineer", "Data Scientist", "ML Engineer", "Backend Developer",
+    "Financial Analyst", "HR Generalist", "Compiler Engineer", "DevOps Engineer",
+]
+FIRST_NAMES = ["Asha", "Ben", "Chen", "Divya", "Elena", "Farid", "Grace", "Hiro", "Isha", "Jon"]
+LAST_NAMES = ["Arora", "Brown", "Castro", "Das", "Evans", "Fischer", "Gupta", "Hill"]
+
+
+def make_resume_text(i: int, pages: int = 1, seed: Optional[int] = None) -> str:
+    rng = random.Random(i if seed is None else seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    title = rng.choice(TITLES)
+    skills = rng.sample(SKILLS, 6)
+    lines = [
+        name,
+        f"{name.split()[0].lower()}.{i}@example.com",
+        "",
+        "Summary",
+        f"{title} with {rng.randint(1, 15)} years of experience.",
+        "",
+        "Experience",
+    ]
+    for _ in range(pages * 8):
+        lines.append(f"Built systems using {rng.choice(skills)} and {rng.choice(skills)} for {rng.choice(TITLES)} teams.")
+    lines += ["", "Skills", ", ".join(skills), "", "Education", "B.Tech in Computer Science"]
+    return "\n".join(lines)
+
+
+def _escape_pdf_text(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(text: str, lines_per_page: int = 40) -> bytes:
+    """
+    Builds a minimal, valid text PDF (Helvetica, one text object per page).
+    """
+    lines = text.splitlines() or [""]
+    page_chunks = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    objects: List[bytes] = []
+    num_pages = len(page_chunks)
+    font_id = 3
+    first_page_id = 4
+    kids = " ".join(f"{first_page_id + 2 * p} 0 R" for p in range(num_pages))
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for p, chunk in enumerate(page_chunks):
+        content_id = first_page_id + 2 * p + 1
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        body = "BT /F1 10 Tf 14 TL 50 750 Td " + " ".join(f"({_escape_pdf_text(line)}) '" for line in chunk) + " ET"
+        stream = body.encode("latin-1", errors="replace")
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for idx, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{idx} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def make_resume_corpus(n: int, pages: int = 1) -> Dict[str, bytes]:
+    """Returns {file_name: pdf_bytes} for `n` synthetic resumes."""
+    return {f"candidate-{i:05d}.pdf": make_pdf(make_resume_text(i, pages=pages)) for i in range(n)}
+
+
+SAMPLE_JD = (
+    "We are hiring a Senior ML Engineer to optimise inference on CS-3 systems. "
+    "Requirements: Python, PyTorch, CUDA, Quantization, Compilers and Kubernetes experience."
+)
+
+
+def _corpus_index(name: str) -> int:
+    digits = name.rsplit("-", 1)[-1].split(".")[0]
+    return int(digits) if digits.isdigit() else 0
+
+
+class ResumeServer:
+    """
+    Local HTTP stand-in for the storage bucket. Serves an in-memory corpus with
+    optional per-request latency and a failure rate for the first attempt of each file.
+    """
+
+    def __init__(self, corpus: Dict[str, bytes], latency: float = 0.0, flaky_every: int = 0):
+        self.corpus = corpus
+        self.latency = latency
+        self.flaky_every = flaky_every
+        self.requests_served = 0
+        self._seen = set()
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                name = self.path.rsplit("/", 1)[-1]
+                with server._lock:
+                    server.requests_served += 1
+                    first_attempt = name not in server._seen
+                    server._seen.add(name)
+                if server.latency:
+                    time.sleep(server.latency)
+                body = server.corpus.get(name)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if server.flaky_every and first_attempt and _corpus_index(name) % server.flaky_every == 0:
+                    self.send_response(503)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/pdf")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/resumes"
+
+    def resume_list(self) -> List[Dict[str, str]]:
+        return [{"resume_url": f"{self.base_url}/{name}"} for name in sorted(self.corpus)]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class QuotaChatServer:
+    """
+    Local OpenAI-compatible chat completions endpoint (`/v1/chat/completions`) that
+    enforces a provider-style quota: requests and tokens per minute, spendable at most
+    `burst_seconds` worth at once. Over-quota requests get a 429 with Retry-After.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, latency: float = 0.2,
+                 completion_tokens: int = 50, burst_seconds: float = 1.0):
+        self.latency = latency
+        self.completion_tokens = completion_tokens
+        self.rates = (requests_per_minute / 60.0, tokens_per_minute / 60.0)
+        self.capacity = (max(1.0, self.rates[0] * burst_seconds), max(1.0, self.rates[1] * burst_seconds))
+        self.levels = list(self.capacity)
+        self.updated = time.monotonic()
+        self.served = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _reply(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                prompt_tokens = sum(len(str(message.get("content", ""))) for message in request.get("messages", [])) // 4
+                tokens = prompt_tokens + server.completion_tokens
+                if not server._admit(tokens):
+                    self._reply(429, {"error": {"message": "Rate limit exceeded", "type": "rate_limit_error"}}, {"Retry-After": "1"})
+                    return
+                time.sleep(server.latency)
+                self._reply(200, {
+                    "id": "chatcmpl-quota", "object": "chat.completion", "created": int(time.time()),
+                    "model": request.get("model", "fake"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok " * server.completion_tokens}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": server.completion_tokens, "total_tokens": tokens},
+                })
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def _admit(self, tokens: int) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self.updated = now - self.updated, now
+            self.levels = [min(cap, level + elapsed * rate) for cap, level, rate in zip(self.capacity, self.levels, self.rates)]
+            if self.levels[0] < 1 or self.levels[1] < tokens:
+                self.rejected += 1
+                return False
+            self.levels[0] -= 1
+            self.levels[1] -= tokens
+            self.served += 1
+            return True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _Response:
+    def __init__(self, data: List[Dict[str, Any]], count: Optional[int]):
+        self.data = data
+        self.count = count
+
+
+class _Query:
+    def __init__(self, db: "InMemorySupabase", table: str, columns: List[str], count: Optional[str], head: bool):
+        self.db, self.table, self.columns, self.count, self.head = db, table, columns, count, head
+        self.rows: Optional[List[Dict[str, Any]]] = None
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        if self.rows is None:
+            self.rows = self.db.lookup(self.table, column, value)
+        else:
+            self.rows = [row for row in self.rows if row.get(column) == value]
+        return self
+
+    def execute(self) -> _Response:
+        if self.rows is None:
+            self.rows = self.db.tables.setdefault(self.table, [])
+        data = [] if self.head else [{column: row.get(column) for column in self.columns} for row in self.rows]
+        self.db.record(len(data))
+        return _Response(data, len(self.rows) if self.count else None)
+
+
+class _Table:
+    def __init__(self, db: "InMemorySupabase", name: str):
+        self.db, self.name = db, name
+
+    def select(self, *columns: str, count: Optional[str] = None, head: Optional[bool] = None) -> _Query:
+        names = [name.strip() for column in columns for name in column.split(",") if name.strip()]
+        return _Query(self.db, self.name, names, count, bool(head))
+
+
+class InMemorySupabase:
+    """
+    Stand-in for the `supabase.Client` select queries the graph makes
+    (`table(...).select(..., count=, head=).eq(...).execute()`). Each query costs
+    `query_latency` plus `row_latency` per returned row of simulated database time, which
+    is accumulated in `db_seconds` rather than slept.
+    """
+
+    def __init__(self, query_latency: float = 0.005, row_latency: float = 0.00002):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        # (table, column) -> value -> rows, built on first use
+        self._indexes: Dict[tuple, Dict[Any, List[Dict[str, Any]]]] = {}
+        self.query_latency = query_latency
+        self.row_latency = row_latency
+        self.queries = 0
+        self.rows_returned = 0
+        self.db_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def table(self, name: str) -> _Table:
+        return _Table(self, name)
+
+    def lookup(self, table: str, column: str, value: Any) -> List[Dict[str, Any]]:
+        index = self._indexes.get((table, column))
+        if index is None:
+            index = {}
+            for row in self.tables.get(table, []):
+                index.setdefault(row.get(column), []).append(row)
+            self._indexes[(table, column)] = index
+        return index.get(value, [])
+
+    def record(self, rows: int):
+        with self._lock:
+            self.queries += 1
+            self.rows_returned += rows
+            self.db_seconds += self.query_latency + rows * self.row_latency
+
+    def add_applications(self, job_id: int, n: int, start_id: int = 0):
+        applications = self.tables.setdefault("applications", [])
+        self._indexes = {key: index for key, index in self._indexes.items() if key[0] != "applications"}
+        for i in range(n):
+            applications.append({
+                "id": start_id + i, "job_id": job_id, "name": f"Candidate {start_id + i}",
+                "email": f"candidate{start_id + i}@example.com",
+                "resume_url": f"https://storage.example.com/resumes/{job_id}/{start_id + i}.pdf",
+            })